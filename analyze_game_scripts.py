@@ -4,17 +4,41 @@ Universal Being Script Analyzer
 ==============================
 Maps out all possible scripts that can be loaded in the game.
 Tracks scene hierarchy, autoloads, and script connections.
+
+Function calls are resolved into a call graph (see call_graph.py) that
+can be queried without a full analysis:
+
+    python analyze_game_scripts.py --who-calls SystemBootstrap.get_flood_gates
+    python analyze_game_scripts.py --reaches scripts/main_script.gd:_ready
+
+Scene load cost comes from the resource dependency graph (see
+resource_graph.py): what each scene transitively loads, in load order:
+
+    python analyze_game_scripts.py --scene-deps scenes/PERFECT_ULTIMATE_UNIVERSAL_BEING.tscn
+
+The same graph finds scripts and scenes the game can never load: nothing
+reachable from run/main_scene, the autoloads or an enabled editor plugin
+preloads, loads, instances, extends or names them (--dead-code).
 """
 
-import os
+import argparse
 import re
 from pathlib import Path
 from typing import Dict, List, Set
 import json
 
+from phase_profiler import PhaseProfiler
+from project_index import ProjectIndex
+from project_root import find_project_root
+
 class UniversalBeingAnalyzer:
-    def __init__(self, project_root: str):
+    def __init__(self, project_root: str, index: ProjectIndex = None, jobs: int = 1,
+                 profiler: PhaseProfiler = None):
         self.root = Path(project_root)
+        self.index = index if index is not None else ProjectIndex(self.root)
+        self.jobs = jobs
+        self.profiler = profiler if profiler is not None else PhaseProfiler(tool='UniversalBeingAnalyzer')
+        self.profiler.attach(self.index)
         self.autoloads = {}
         self.main_scene = ""
         self.all_scripts = set()
@@ -22,23 +46,44 @@ class UniversalBeingAnalyzer:
         self.scene_hierarchy = {}  # scene -> [child scenes]
         self.script_functions = {}  # script -> [functions]
         self.script_calls = {}  # script -> [called functions]
+        self.call_graph = None  # CallGraph, built after the scripts are analyzed
+        self.resource_graph = None  # ResourceGraph over scenes, resources and scripts
         
     def analyze_project(self):
         """Complete project analysis"""
         print("🔍 UNIVERSAL BEING SCRIPT ANALYZER")
         print("=" * 50)
         
+        profile = self.profiler.phase
+        
         # 1. Parse project.godot for main scene and autoloads
-        self.parse_project_file()
+        with profile('parse_project_file'):
+            self.parse_project_file()
         
         # 2. Analyze all .tscn files for script attachments
-        self.analyze_all_scenes()
+        with profile('analyze_all_scenes'):
+            self.analyze_all_scenes()
         
         # 3. Analyze all .gd scripts for functions
-        self.analyze_all_scripts()
+        with profile('analyze_all_scripts'):
+            self.analyze_all_scripts()
+        
+        # 4. Resolve calls into the project-wide call graph
+        with profile('build_call_graph'):
+            self.call_graph = self.index.call_graph
+        
+        # 5. Scene -> resource load dependencies
+        with profile('build_resource_graph'):
+            self.resource_graph = self.index.resource_graph
         
-        # 4. Generate report
-        self.generate_report()
+        # 6. Generate report
+        with profile('generate_report'):
+            self.generate_report()
+        
+        # The report phase is measured too, so the profile is added to the JSON afterwards
+        if self.profiler.enabled:
+            self.save_json()
+            self.profiler.print_summary()
         
     def parse_project_file(self):
         """Parse project.godot for autoloads and main scene"""
@@ -47,28 +92,16 @@ class UniversalBeingAnalyzer:
             print("❌ No project.godot found!")
             return
             
-        with open(project_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-            
-        # Find main scene
-        main_match = re.search(r'run/main_scene="(.+?)"', content)
-        if main_match:
-            self.main_scene = main_match.group(1).replace('res://', '')
+        # Find main scene (project.godot is parsed once by the shared index)
+        if self.index.main_scene:
+            self.main_scene = self.index.main_scene.replace('res://', '')
             print(f"📌 Main Scene: {self.main_scene}")
             
         # Find autoloads
-        autoload_section = False
-        for line in content.split('\n'):
-            if '[autoload]' in line:
-                autoload_section = True
-                continue
-            elif line.startswith('[') and autoload_section:
-                break
-            elif autoload_section and '=' in line:
-                name, path = line.split('=', 1)
-                path = path.strip('"').replace('*', '').replace('res://', '')
-                self.autoloads[name] = path
-                self.all_scripts.add(path)
+        for name, path in self.index.autoloads.items():
+            path = path.replace('res://', '')
+            self.autoloads[name] = path
+            self.all_scripts.add(path)
                 
         print(f"🚀 Found {len(self.autoloads)} autoloads")
         
@@ -76,7 +109,7 @@ class UniversalBeingAnalyzer:
         """Analyze all .tscn files for scripts and sub-scenes"""
         print("\n🎬 Analyzing scenes...")
         
-        for tscn_file in self.root.rglob('*.tscn'):
+        for tscn_file in self.index.scenes():
             if '.godot' in str(tscn_file):
                 continue
                 
@@ -85,74 +118,65 @@ class UniversalBeingAnalyzer:
             
     def analyze_scene(self, scene_file: Path, scene_path: str):
         """Analyze a single scene file"""
-        try:
-            with open(scene_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-        except:
+        info = self.index.scene_info(scene_file)
+        if info is None:
             return
-            
+
         scripts = []
         child_scenes = []
-        
-        # Find script resources
-        script_matches = re.findall(r'ExtResource.*?path="(res://[^"]+\.gd)"', content)
-        for script in script_matches:
-            script_path = script.replace('res://', '')
-            scripts.append(script_path)
-            self.all_scripts.add(script_path)
-            
-        # Find scene instances
-        scene_matches = re.findall(r'ExtResource.*?path="(res://[^"]+\.tscn)"', content)
-        for scene in scene_matches:
-            child_scene = scene.replace('res://', '')
-            child_scenes.append(child_scene)
-            
-        # Find inline scripts
-        if 'GDScript' in content:
+
+        # Attached scripts and instanced scenes are ext_resources (Godot 3 and 4 headers)
+        for ext in info['ext_resources']:
+            path = ext['path'] or ''
+            if not path.startswith('res://'):
+                continue
+            if path.endswith('.gd'):
+                script_path = path.replace('res://', '')
+                scripts.append(script_path)
+                self.all_scripts.add(script_path)
+            elif path.endswith('.tscn'):
+                child_scenes.append(path.replace('res://', ''))
+
+        # Inline scripts are GDScript sub_resources
+        if any(sub['type'] == 'GDScript' for sub in info['sub_resources']):
             scripts.append(f"{scene_path}:inline_script")
-            
+
         if scripts:
             self.scene_scripts[scene_path] = scripts
         if child_scenes:
             self.scene_hierarchy[scene_path] = child_scenes
-            
+
     def analyze_all_scripts(self):
         """Analyze all .gd scripts for functions and calls"""
         print("\n📜 Analyzing scripts...")
         
         # Add scripts from file system that might not be attached yet
-        for gd_file in self.root.rglob('*.gd'):
+        for gd_file in self.index.scripts():
             if '.godot' not in str(gd_file):
                 script_path = str(gd_file.relative_to(self.root))
                 self.all_scripts.add(script_path)
         
-        # Analyze each script
-        for script_path in self.all_scripts:
-            full_path = self.root / script_path
-            if full_path.exists():
-                self.analyze_script(full_path, script_path)
+        # Analyze each script (sorted so output never depends on set order)
+        scripts = [(self.root / p, p) for p in sorted(self.all_scripts)]
+        scripts = [(full_path, p) for full_path, p in scripts if full_path.exists()]
+        
+        # Parse stale scripts across worker processes; results are merged in order
+        self.index.prefetch_facts([full_path for full_path, _ in scripts], self.jobs)
+        
+        for full_path, script_path in scripts:
+            self.analyze_script(full_path, script_path)
+        
+        # Persist extracted facts so the next run only re-parses changed files
+        self.index.save_cache()
                 
     def analyze_script(self, script_file: Path, script_path: str):
         """Analyze a single script for functions and calls"""
-        try:
-            with open(script_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-        except:
+        facts = self.index.facts(script_file)
+        if facts['encoding'] != 'utf-8':
             return
             
-        functions = []
-        calls = []
-        
-        # Find function definitions
-        func_matches = re.findall(r'func\s+(\w+)\s*\(', content)
-        functions.extend(func_matches)
-        
-        # Find function calls (basic pattern)
-        call_matches = re.findall(r'(\w+)\s*\(', content)
-        calls.extend(call_matches)
-        
-        # Find signal emissions
-        signal_matches = re.findall(r'\.emit\s*\(', content)
+        # Function definitions, called names and signal emissions come from the fact cache
+        functions = facts['functions']
         
         # Check for Pentagon methods
         pentagon_methods = ['pentagon_init', 'pentagon_ready', 'pentagon_process', 
@@ -161,16 +185,16 @@ class UniversalBeingAnalyzer:
         
         self.script_functions[script_path] = {
             'functions': functions,
-            'calls': list(set(calls)),
-            'signals': len(signal_matches),
+            'calls': facts['calls'],
+            'signals': facts['signal_emits'],
             'has_pentagon': has_pentagon,
-            'extends': self._get_extends(content)
+            'extends': self._get_extends(facts)
         }
         
-    def _get_extends(self, content: str) -> str:
+    def _get_extends(self, facts: Dict) -> str:
         """Get what class the script extends"""
-        match = re.search(r'extends\s+(\w+)', content)
-        return match.group(1) if match else ""
+        match = re.match(r'\w+', facts['extends'] or '')
+        return match.group(0) if match else ""
         
     def generate_report(self):
         """Generate analysis report"""
@@ -198,9 +222,14 @@ class UniversalBeingAnalyzer:
             # Main Scene Scripts
             f.write("## 🎮 Main Scene Script Chain\n\n")
             if self.main_scene:
-                self._write_scene_hierarchy(f, self.main_scene, 0)
+                self._write_scene_hierarchy(f, self.main_scene, 0, set())
             f.write("\n")
             
+            # Scene load cost and dead code
+            if self.resource_graph:
+                self._write_scene_load_cost(f)
+                self._write_unreachable(f)
+            
             # All Scripts by Category
             f.write("## 📂 Scripts by Location\n\n")
             
@@ -222,22 +251,47 @@ class UniversalBeingAnalyzer:
                     
             # Pentagon compliant scripts
             f.write("\n## 🔥 Pentagon Architecture Scripts\n\n")
-            pentagon_scripts = [s for s in self.all_scripts 
+            pentagon_scripts = [s for s in sorted(self.all_scripts) 
                               if s in self.script_functions and 
                               self.script_functions[s]['has_pentagon']]
             for script in pentagon_scripts:
                 f.write(f"- ✅ `{script}`\n")
+            
+            # Call graph
+            if self.call_graph:
+                summary = self.call_graph.summary()
+                f.write("\n## 🔗 Call Graph\n\n")
+                f.write(f"- **Functions:** {summary['functions']}\n")
+                f.write(f"- **Call Sites:** {summary['call_sites']} "
+                        f"({summary['resolved_calls']} resolved to project functions)\n")
+                f.write(f"- **Caller → Callee Edges:** {summary['edges']}\n\n")
+                f.write("### Most Called Functions\n")
+                for entry in summary['most_called']:
+                    f.write(f"- `{entry['function']}` ({entry['callers']} callers)\n")
                 
         print(f"\n📊 Report saved to: {report_path}")
         
-        # Also save JSON for programmatic access
+        self.save_json()
+        
+    def save_json(self):
+        """Save JSON for programmatic access"""
         json_data = {
             'autoloads': self.autoloads,
             'main_scene': self.main_scene,
-            'all_scripts': list(self.all_scripts),
+            'all_scripts': sorted(self.all_scripts),
             'scene_scripts': self.scene_scripts,
             'scene_hierarchy': self.scene_hierarchy
         }
+        if self.call_graph:
+            json_data['call_graph'] = self.call_graph.summary()
+        if self.resource_graph:
+            json_data['unreachable'] = self.unreachable_files()
+            json_data['scene_dependencies'] = self.scene_dependencies()
+            json_data['dependency_cycles'] = [
+                [node.replace('res://', '') for node in cycle] for cycle in self.resource_graph.cycles()
+            ]
+        if self.profiler.enabled:
+            json_data['profile'] = self.profiler.report()
         
         json_path = self.root / 'script_analysis.json'
         with open(json_path, 'w', encoding='utf-8') as f:
@@ -245,9 +299,157 @@ class UniversalBeingAnalyzer:
             
         print(f"📊 JSON data saved to: {json_path}")
         
-    def _write_scene_hierarchy(self, f, scene_path: str, indent: int):
-        """Write scene hierarchy recursively"""
+    def print_who_calls(self, symbol: str):
+        """Print every resolved call to a function"""
+        graph = self._query_graph()
+        calls = graph.who_calls(symbol)
+        if not graph.functions(symbol):
+            print(f"❌ No function matches {symbol}")
+            return
+        print(f"📞 {len(calls)} function(s) call {symbol}")
+        for caller, callee, lines in calls:
+            print(f"   {caller} (line {', '.join(map(str, lines))}) → {callee}")
+    
+    def print_reaches(self, symbol: str):
+        """Print every function transitively reachable from a function"""
+        graph = self._query_graph()
+        if not graph.functions(symbol):
+            print(f"❌ No function matches {symbol}")
+            return
+        reached = sorted(graph.reaches(symbol))
+        print(f"🕸️ {symbol} reaches {len(reached)} function(s)")
+        for function in reached:
+            print(f"   {function}")
+    
+    def _query_graph(self):
+        """Call graph over cached facts, without the full analysis"""
+        self.index.prefetch_facts(self.index.scripts(), self.jobs)
+        graph = self.index.call_graph
+        self.index.save_cache()
+        return graph
+    
+    def scene_dependencies(self) -> Dict[str, Dict]:
+        """Direct dependencies and transitive load cost of every scene"""
+        graph = self.resource_graph
+        scenes = {}
+        for scene in graph.scenes():
+            cost = graph.cost(scene)
+            scenes[scene.replace('res://', '')] = {
+                'direct': [node.replace('res://', '') for node in graph.dependencies(scene)],
+                'transitive_resources': cost['resources'],
+                'transitive_bytes': cost['bytes'],
+                'missing': [node.replace('res://', '') for node in graph.missing.get(scene, [])],
+            }
+        return scenes
+    
+    def unreachable_files(self) -> Dict:
+        """Scripts, scenes and resources no root can reach, with their size on disk"""
+        graph = self.resource_graph
+        unreachable = {'roots': [root.replace('res://', '') for root in graph.roots()],
+                       'scripts': [], 'scenes': [], 'resources': [], 'bytes': 0}
+        section = {'.gd': 'scripts', '.tscn': 'scenes', '.tres': 'resources'}
+        for node in graph.unreachable():
+            folder = graph.scanned_dir(node)
+            unreachable[section[node[node.rindex('.'):]]].append({
+                'path': node.replace('res://', ''),
+                'bytes': graph.sizes[node],
+                'scanned_dir': folder.replace('res://', '') if folder else None,
+            })
+            unreachable['bytes'] += graph.sizes[node]
+        return unreachable
+    
+    def print_dead_code(self):
+        """Print every unreachable script, scene and resource"""
+        self.index.prefetch_facts(self.index.scripts(), self.jobs)
+        self.resource_graph = self.index.resource_graph
+        self.index.save_cache()
+        
+        unreachable = self.unreachable_files()
+        print(f"🌱 Roots: {', '.join(unreachable['roots'])}")
+        for section in ('scripts', 'scenes', 'resources'):
+            entries = unreachable[section]
+            print(f"\n💀 {len(entries)} unreachable {section} "
+                  f"({sum(e['bytes'] for e in entries) / 1024:.1f} KB)")
+            for entry in entries:
+                note = f"  (maybe via a scan of {entry['scanned_dir']})" if entry['scanned_dir'] else ""
+                print(f"   {entry['bytes'] / 1024:8.1f} KB  {entry['path']}{note}")
+        print(f"\n📦 {unreachable['bytes'] / 1024:.1f} KB could be left out of export builds")
+    
+    def print_scene_deps(self, scene_path: str):
+        """Print everything a scene loads, dependencies first"""
+        self.index.prefetch_facts(self.index.scripts(), self.jobs)
+        graph = self.index.resource_graph
+        self.index.save_cache()
+        
+        res_path = scene_path if scene_path.startswith('res://') else 'res://' + scene_path
+        if res_path not in graph.edges:
+            print(f"❌ Unknown scene or resource: {scene_path}")
+            return
+        cost = graph.cost(res_path)
+        print(f"📦 {res_path} loads {cost['resources']} resources ({cost['bytes'] / 1024:.1f} KB in total)")
+        for node in graph.load_order(res_path):
+            print(f"   {graph.sizes[node] / 1024:8.1f} KB  {node}")
+        for node in graph.missing.get(res_path, []):
+            print(f"   ❌ missing    {node}")
+        for cycle in graph.cycles():
+            if res_path in cycle or graph.closure(res_path).intersection(cycle):
+                print(f"   🔁 cycle: {' → '.join(cycle)}")
+    
+    def _write_scene_load_cost(self, f):
+        """Heaviest scenes by transitive load size, plus dependency cycles"""
+        graph = self.resource_graph
+        f.write("## 📦 Scene Load Cost\n\n")
+        if self.main_scene:
+            main = 'res://' + self.main_scene
+            cost = graph.cost(main)
+            f.write(f"- **Main Scene Loads:** {cost['resources']} resources, {cost['bytes'] / 1024:.1f} KB\n")
+            missing = graph.missing.get(main, [])
+            if missing:
+                f.write(f"- **Missing From Main Scene:** {len(missing)} referenced files do not exist\n")
+        f.write("\n### Heaviest Scenes\n")
+        heaviest = sorted(graph.scenes(), key=lambda scene: (-graph.cost(scene)['bytes'], scene))[:10]
+        for scene in heaviest:
+            cost = graph.cost(scene)
+            f.write(f"- `{scene.replace('res://', '')}`: {cost['resources']} resources, "
+                    f"{cost['bytes'] / 1024:.1f} KB\n")
+        cycles = graph.cycles()
+        if cycles:
+            f.write("\n### Dependency Cycles\n")
+            for cycle in cycles:
+                f.write(f"- 🔁 {' → '.join(f'`{node}`' for node in cycle)}\n")
+        f.write("\n")
+    
+    def _write_unreachable(self, f):
+        """Unreachable scripts and scenes, grouped by top-level folder"""
+        unreachable = self.unreachable_files()
+        entries = unreachable['scripts'] + unreachable['scenes'] + unreachable['resources']
+        f.write("## 💀 Unreachable Scripts & Scenes\n\n")
+        f.write(f"- **Roots:** {', '.join(f'`{root}`' for root in unreachable['roots'])}\n")
+        f.write(f"- **Unreachable Scripts:** {len(unreachable['scripts'])}\n")
+        f.write(f"- **Unreachable Scenes:** {len(unreachable['scenes'])}\n")
+        f.write(f"- **Unreachable Resources:** {len(unreachable['resources'])}\n")
+        f.write(f"- **Total Size:** {unreachable['bytes'] / 1024:.1f} KB\n")
+        scanned = [e for e in entries if e['scanned_dir']]
+        if scanned:
+            f.write(f"- **Possibly Loaded By Folder Scans:** {len(scanned)} "
+                    f"({sum(e['bytes'] for e in scanned) / 1024:.1f} KB)\n")
+        
+        folders = {}
+        for entry in entries:
+            folder = entry['path'].split('/')[0] if '/' in entry['path'] else '.'
+            count, size = folders.get(folder, (0, 0))
+            folders[folder] = (count + 1, size + entry['bytes'])
+        f.write("\n### By Folder\n")
+        for folder, (count, size) in sorted(folders.items(), key=lambda item: (-item[1][1], item[0]))[:10]:
+            f.write(f"- `{folder}/`: {count} files, {size / 1024:.1f} KB\n")
+        f.write("\nRun `python analyze_game_scripts.py --dead-code` for the full list.\n\n")
+    
+    def _write_scene_hierarchy(self, f, scene_path: str, indent: int, ancestors: Set[str]):
+        """Write scene hierarchy recursively (a scene that instances its own ancestor is not expanded)"""
         prefix = "  " * indent
+        if scene_path in ancestors:
+            f.write(f"{prefix}- **{scene_path}** (cycle)\n")
+            return
         f.write(f"{prefix}- **{scene_path}**\n")
         
         # Scripts in this scene
@@ -257,8 +459,10 @@ class UniversalBeingAnalyzer:
                 
         # Child scenes
         if scene_path in self.scene_hierarchy:
+            ancestors.add(scene_path)
             for child in self.scene_hierarchy[scene_path]:
-                self._write_scene_hierarchy(f, child, indent + 1)
+                self._write_scene_hierarchy(f, child, indent + 1, ancestors)
+            ancestors.discard(scene_path)
                 
     def _write_script_info(self, f, script: str):
         """Write info about a single script"""
@@ -272,9 +476,39 @@ class UniversalBeingAnalyzer:
 
 def main():
     """Run the analysis"""
-    # Get project root from current script location
-    project_root = os.path.dirname(os.path.abspath(__file__))
-    analyzer = UniversalBeingAnalyzer(project_root)
+    parser = argparse.ArgumentParser(description='Map scripts, scenes and autoloads the game can load')
+    parser.add_argument('--jobs', '-j', type=int, default=1, metavar='N',
+                        help='Parse scripts across N worker processes (0 = one per CPU core)')
+    parser.add_argument('--profile', action='store_true',
+                        help='Record per-phase time, files, bytes read and peak memory into script_analysis.json')
+    parser.add_argument('--profile-dump', metavar='DIR',
+                        help='Also write a cProfile .pstats dump per phase into DIR (implies --profile)')
+    parser.add_argument('--who-calls', metavar='SYMBOL',
+                        help='Only list the callers of a function (Autoload.func, ClassName.func, path.gd:func or func)')
+    parser.add_argument('--reaches', metavar='SYMBOL',
+                        help='Only list every function transitively called from a function')
+    parser.add_argument('--scene-deps', metavar='SCENE',
+                        help='Only list everything a scene transitively loads, in load order')
+    parser.add_argument('--dead-code', action='store_true',
+                        help='Only list the scripts, scenes and resources the game can never load')
+    args = parser.parse_args()
+    
+    # Find the Godot project these tools belong to
+    project_root = find_project_root()
+    profiler = PhaseProfiler(args.profile, args.profile_dump, tool='UniversalBeingAnalyzer')
+    with profiler.phase('project_index_walk'):
+        index = ProjectIndex(project_root)
+    analyzer = UniversalBeingAnalyzer(project_root, index=index, jobs=args.jobs, profiler=profiler)
+    if args.who_calls or args.reaches or args.scene_deps or args.dead_code:
+        if args.who_calls:
+            analyzer.print_who_calls(args.who_calls)
+        if args.reaches:
+            analyzer.print_reaches(args.reaches)
+        if args.scene_deps:
+            analyzer.print_scene_deps(args.scene_deps)
+        if args.dead_code:
+            analyzer.print_dead_code()
+        return
     analyzer.analyze_project()
 
 if __name__ == "__main__":
@@ -6,21 +6,232 @@ Validates the new beings/, systems/, components/ structure
 Generated: 2025-06-06 - Post-Architecture Documentation
 """
 
-import os
+import argparse
+import hashlib
 import json
+import os
+import sys
+import time
+from abc import ABC, abstractmethod
 from pathlib import Path
-import re
 from collections import defaultdict, Counter
-import time
+
+from json_stream import JsonSectionWriter
+from metrics_history import MetricsHistory
+from phase_profiler import PhaseProfiler, peak_rss_mb
+from project_index import ProjectIndex
+from project_root import find_project_root
+
+class ScriptVisitor(ABC):
+    """One metric collected during ArchitectureAnalyzer's single script traversal.
+    
+    Subclasses fill one analysis section: visit() sees every script's cached
+    facts (see script_facts.py), finish() returns the section. New metrics are
+    added by appending a visitor to ArchitectureAnalyzer.script_visitors.
+    """
+    section = None
+    banner = ""
+    
+    def __init__(self, analyzer):
+        self.analyzer = analyzer
+    
+    @abstractmethod
+    def visit(self, gd_file, relative_path, facts):
+        """Fold one script's facts into the section"""
+    
+    @abstractmethod
+    def finish(self):
+        """The finished section"""
+
+class PentagonComplianceVisitor(ScriptVisitor):
+    """Pentagon architecture compliance across the project"""
+    section = "pentagon_compliance"
+    banner = "⭐ Analyzing Pentagon compliance..."
+    
+    def __init__(self, analyzer):
+        super().__init__(analyzer)
+        self.compliance = {
+            "total_scripts": 0,
+            "compliant_scripts": 0,
+            "non_compliant": [],
+            "missing_methods": defaultdict(list),
+            "super_call_issues": [],
+            "compliance_by_directory": {}
+        }
+    
+    def visit(self, gd_file, relative_path, facts):
+        compliance = self.compliance
+        compliance["total_scripts"] += 1
+        
+        # Get directory for categorization
+        directory = str(relative_path.parts[0]) if relative_path.parts else "root"
+        
+        if directory not in compliance["compliance_by_directory"]:
+            compliance["compliance_by_directory"][directory] = {
+                "total": 0, "compliant": 0, "files": []
+            }
+        
+        compliance["compliance_by_directory"][directory]["total"] += 1
+        
+        # Analyze Pentagon compliance
+        pentagon_result = self.analyzer.check_pentagon_compliance(gd_file)
+        
+        if pentagon_result["is_compliant"]:
+            compliance["compliant_scripts"] += 1
+            compliance["compliance_by_directory"][directory]["compliant"] += 1
+        else:
+            compliance["non_compliant"].append({
+                "file": str(relative_path),
+                "issues": pentagon_result["issues"]
+            })
+            
+            for missing_method in pentagon_result["missing_methods"]:
+                compliance["missing_methods"][missing_method].append(str(relative_path))
+        
+        compliance["compliance_by_directory"][directory]["files"].append({
+            "name": gd_file.name,
+            "compliant": pentagon_result["is_compliant"],
+            "issues": pentagon_result["issues"]
+        })
+    
+    def finish(self):
+        compliance = self.compliance
+        
+        # Calculate compliance percentage
+        if compliance["total_scripts"] > 0:
+            compliance["compliance_percentage"] = round(
+                (compliance["compliant_scripts"] / compliance["total_scripts"]) * 100, 1
+            )
+        else:
+            compliance["compliance_percentage"] = 0
+        return compliance
+
+class ConsciousnessVisitor(ScriptVisitor):
+    """Consciousness level usage across beings"""
+    section = "consciousness_levels"
+    banner = "🧠 Analyzing consciousness levels..."
+    
+    def __init__(self, analyzer):
+        super().__init__(analyzer)
+        self.consciousness_analysis = {
+            "level_distribution": Counter(),
+            "beings_by_level": defaultdict(list),
+            "consciousness_evolution": [],
+            "total_conscious_beings": 0
+        }
+    
+    def visit(self, gd_file, relative_path, facts):
+        if facts['encoding'] != 'utf-8':
+            return
+        
+        # consciousness_level assignments
+        for _line, level in facts['consciousness_levels']:
+            self.consciousness_analysis["level_distribution"][level] += 1
+            self.consciousness_analysis["beings_by_level"][level].append(gd_file.name)
+            self.consciousness_analysis["total_conscious_beings"] += 1
+    
+    def finish(self):
+        return self.consciousness_analysis
+
+class AkashicVisitor(ScriptVisitor):
+    """AkashicRecords integration and usage"""
+    section = "akashic_integration"
+    banner = "📚 Analyzing Akashic Records integration..."
+    
+    def __init__(self, analyzer):
+        super().__init__(analyzer)
+        self.akashic_analysis = {
+            "akashic_references": 0,
+            "save_operations": 0,
+            "load_operations": 0,
+            "component_packages": 0,
+            "akashic_library_structure": {},
+            "integration_health": "Unknown"
+        }
+    
+    def visit(self, gd_file, relative_path, facts):
+        if facts['encoding'] != 'utf-8':
+            return
+        
+        # Count AkashicRecords usage
+        if facts["akashic_references"]:
+            self.akashic_analysis["akashic_references"] += 1
+        
+        self.akashic_analysis["save_operations"] += facts["save_operations"]
+        self.akashic_analysis["load_operations"] += facts["load_operations"]
+    
+    def finish(self):
+        akashic_analysis = self.akashic_analysis
+        analyzer = self.analyzer
+        
+        # Analyze akashic_library structure
+        akashic_lib = analyzer.project_root / "akashic_library"
+        if akashic_lib.exists():
+            akashic_analysis["akashic_library_structure"] = analyzer.analyze_directory(
+                akashic_lib, "Akashic Library"
+            )
+            
+            # Count .ub.zip packages (archives and unpacked package folders)
+            akashic_analysis["component_packages"] = (
+                len(analyzer.index.files(".ub.zip", "akashic_library")) +
+                len(analyzer.index.dirs(".ub.zip", "akashic_library"))
+            )
+        
+        # Health assessment
+        if akashic_analysis["akashic_references"] > 5 and akashic_analysis["component_packages"] > 0:
+            akashic_analysis["integration_health"] = "Excellent - active integration"
+        elif akashic_analysis["akashic_references"] > 0:
+            akashic_analysis["integration_health"] = "Good - basic integration"
+        else:
+            akashic_analysis["integration_health"] = "Poor - minimal integration"
+        return akashic_analysis
+
+class ScriptIndexVisitor(ScriptVisitor):
+    """Per-script fingerprint and results, so a later --since run can skip unchanged files"""
+    section = "script_index"
+    banner = "🔑 Fingerprinting scripts..."
+    
+    def __init__(self, analyzer):
+        super().__init__(analyzer)
+        self.script_index = {}
+    
+    def visit(self, gd_file, relative_path, facts):
+        record = self.analyzer.index.fingerprint(gd_file) or {"mtime_ns": None, "size": None, "sha1": None}
+        record.update(self.analyzer.script_record(gd_file, facts))
+        self.script_index[str(relative_path)] = record
+    
+    def finish(self):
+        return self.script_index
 
 class ArchitectureAnalyzer:
-    def __init__(self, project_root=None):
-        # Auto-detect project root from script location
+    # Metrics collected in the single script traversal (see analyze_scripts)
+    script_visitors = [PentagonComplianceVisitor, ConsciousnessVisitor, AkashicVisitor, ScriptIndexVisitor]
+    
+    def __init__(self, project_root=None, index=None, jobs=1, profiler=None, compact_json=False,
+                 record_history=True):
+        # Auto-detect project root (see project_root.py)
         if project_root is None:
-            project_root = os.path.dirname(os.path.abspath(__file__))
+            project_root = find_project_root()
         
         self.project_root = Path(project_root)
         
+        # Shared single-pass file index (walk once, read each file once)
+        self.index = index if index is not None else ProjectIndex(self.project_root)
+        self.jobs = jobs
+        
+        # Per-phase timing/IO/memory (disabled unless --profile)
+        self.profiler = profiler if profiler is not None else PhaseProfiler(tool='ArchitectureAnalyzer')
+        self.profiler.attach(self.index)
+        
+        # architecture_analysis.json is written section by section as phases finish
+        self.compact_json = compact_json
+        self.json_path = self.project_root / "architecture_analysis.json"
+        self.json_writer = None
+        self.finished_sections = set()
+        
+        # Every full run is appended to the SQLite metrics history (see metrics_history.py)
+        self.record_history = record_history
+        
         # Analysis results
         self.analysis = {
             "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
@@ -88,8 +299,9 @@ class ArchitectureAnalyzer:
         autoloads_dir = self.project_root / "autoloads"
         structure["autoloads"] = self.analyze_directory(autoloads_dir, "Global Singletons")
         
-        # Akashic Library analysis
+        # Akashic Library analysis (wide tree - listed across threads when --jobs allows)
         akashic_dir = self.project_root / "akashic_library"
+        self.index.prefetch_tree(akashic_dir, stat_suffix=".gd", jobs=self.jobs)
         structure["akashic_library"] = self.analyze_directory(akashic_dir, "Asset Library")
         
         self.analysis["project_structure"] = structure
@@ -107,7 +319,7 @@ class ArchitectureAnalyzer:
     
     def analyze_directory(self, directory, description):
         """Analyze a specific directory"""
-        if not directory.exists():
+        if self.index.stat(directory) is None:
             return {
                 "description": description,
                 "exists": False,
@@ -125,21 +337,24 @@ class ArchitectureAnalyzer:
             "size_kb": 0
         }
         
-        # Count scripts and subdirectories
+        # Count scripts and subdirectories (listings and stats come from the per-run index caches)
         try:
-            for item in directory.iterdir():
-                if item.is_file() and item.suffix == ".gd":
+            for name, is_dir, is_file in self.index.list_dir(directory, stat_suffix=".gd"):
+                if is_file and os.path.splitext(name)[1] == ".gd":
+                    stat = self.index.stat(directory / name)
+                    if stat is None:
+                        raise FileNotFoundError(f"Cannot stat {directory / name}")
                     analysis["script_count"] += 1
                     analysis["files"].append({
-                        "name": item.name,
-                        "size": item.stat().st_size,
-                        "modified": item.stat().st_mtime
+                        "name": name,
+                        "size": stat.st_size,
+                        "modified": stat.st_mtime
                     })
-                    analysis["size_kb"] += item.stat().st_size
-                elif item.is_dir() and not item.name.startswith('.'):
-                    subdir_analysis = self.analyze_directory(item, f"{description} - {item.name}")
+                    analysis["size_kb"] += stat.st_size
+                elif is_dir and not name.startswith('.'):
+                    subdir_analysis = self.analyze_directory(directory / name, f"{description} - {name}")
                     analysis["subdirectories"].append({
-                        "name": item.name,
+                        "name": name,
                         "script_count": subdir_analysis["script_count"],
                         "analysis": subdir_analysis
                     })
@@ -151,78 +366,38 @@ class ArchitectureAnalyzer:
         analysis["size_kb"] = round(analysis["size_kb"] / 1024, 2)
         return analysis
     
-    def analyze_pentagon_compliance(self):
-        """Analyze Pentagon architecture compliance across the project"""
-        print("⭐ Analyzing Pentagon compliance...")
-        
-        compliance = {
-            "total_scripts": 0,
-            "compliant_scripts": 0,
-            "non_compliant": [],
-            "missing_methods": defaultdict(list),
-            "super_call_issues": [],
-            "compliance_by_directory": {}
-        }
-        
-        # Check all GDScript files
-        for gd_file in self.project_root.rglob("*.gd"):
-            if self.should_skip_file(gd_file):
-                continue
-                
-            compliance["total_scripts"] += 1
-            
-            # Get directory for categorization
+    def analyze_scripts(self):
+        """Run every registered script visitor over one shared traversal"""
+        visitors = [visitor_class(self) for visitor_class in self.script_visitors]
+        for visitor in visitors:
+            print(visitor.banner)
+        
+        scripts = [f for f in self.index.scripts() if not self.should_skip_file(f)]
+        
+        # Parse stale scripts across worker processes; the traversal below then hits the cache.
+        # The class hierarchy needs every script, since base classes may live anywhere.
+        self.index.prefetch_facts(self.index.scripts(), self.jobs)
+        self.index.class_hierarchy
+        
+        # Each script is read and tokenized once, whatever the number of visitors
+        for gd_file in scripts:
+            facts = self.index.facts(gd_file)
             relative_path = gd_file.relative_to(self.project_root)
-            directory = str(relative_path.parts[0]) if relative_path.parts else "root"
-            
-            if directory not in compliance["compliance_by_directory"]:
-                compliance["compliance_by_directory"][directory] = {
-                    "total": 0, "compliant": 0, "files": []
-                }
-            
-            compliance["compliance_by_directory"][directory]["total"] += 1
-            
-            # Analyze Pentagon compliance
-            pentagon_result = self.check_pentagon_compliance(gd_file)
-            
-            if pentagon_result["is_compliant"]:
-                compliance["compliant_scripts"] += 1
-                compliance["compliance_by_directory"][directory]["compliant"] += 1
-            else:
-                compliance["non_compliant"].append({
-                    "file": str(relative_path),
-                    "issues": pentagon_result["issues"]
-                })
-                
-                for missing_method in pentagon_result["missing_methods"]:
-                    compliance["missing_methods"][missing_method].append(str(relative_path))
-            
-            compliance["compliance_by_directory"][directory]["files"].append({
-                "name": gd_file.name,
-                "compliant": pentagon_result["is_compliant"],
-                "issues": pentagon_result["issues"]
-            })
+            for visitor in visitors:
+                visitor.visit(gd_file, relative_path, facts)
         
-        # Calculate compliance percentage
-        if compliance["total_scripts"] > 0:
-            compliance["compliance_percentage"] = round(
-                (compliance["compliant_scripts"] / compliance["total_scripts"]) * 100, 1
-            )
-        else:
-            compliance["compliance_percentage"] = 0
-            
-        self.analysis["pentagon_compliance"] = compliance
+        for visitor in visitors:
+            self.analysis[visitor.section] = visitor.finish()
+        return [visitor.section for visitor in visitors]
     
     def check_pentagon_compliance(self, file_path):
         """Check if a script follows Pentagon architecture"""
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-        except:
+        facts = self.index.facts(file_path)
+        if facts['encoding'] != 'utf-8':
             return {"is_compliant": False, "issues": ["Cannot read file"], "missing_methods": []}
         
-        # Check if it extends UniversalBeing
-        if "extends UniversalBeing" not in content:
+        # Check if it inherits from UniversalBeing (intermediate classes and res:// paths included)
+        if not self.index.class_hierarchy.is_universal_being(file_path):
             return {"is_compliant": True, "issues": ["Not a UniversalBeing"], "missing_methods": []}
         
         issues = []
@@ -230,22 +405,14 @@ class ArchitectureAnalyzer:
         
         # Check for Pentagon methods
         for method in self.pentagon_methods:
-            if f"func {method}(" not in content:
+            method_facts = facts['pentagon_methods'].get(method)
+            if not method_facts:
                 missing_methods.append(method)
                 continue
             
-            # Check for super calls (simplified check)
-            method_pattern = rf"func {method}\([^)]*\).*?(?=func|\Z)"
-            method_match = re.search(method_pattern, content, re.DOTALL)
-            
-            if method_match and method != "pentagon_sewers":
-                # For most methods, super should be called first
-                if f"super.{method}(" not in method_match.group():
-                    issues.append(f"Missing super.{method}() call")
-            elif method_match and method == "pentagon_sewers":
-                # For sewers, super should be called last
-                if f"super.{method}(" not in method_match.group():
-                    issues.append(f"Missing super.{method}() call")
+            # Check for super calls (simplified check - position is the validator's job)
+            if method_facts['super_line'] is None:
+                issues.append(f"Missing super.{method}() call")
         
         is_compliant = len(missing_methods) == 0 and len(issues) == 0
         
@@ -255,39 +422,19 @@ class ArchitectureAnalyzer:
             "missing_methods": missing_methods
         }
     
-    def analyze_consciousness_levels(self):
-        """Analyze consciousness level usage across beings"""
-        print("🧠 Analyzing consciousness levels...")
-        
-        consciousness_analysis = {
-            "level_distribution": Counter(),
-            "beings_by_level": defaultdict(list),
-            "consciousness_evolution": [],
-            "total_conscious_beings": 0
+    def script_record(self, gd_file, facts):
+        """Per-script results kept in script_index and compared by --since"""
+        pentagon_result = self.check_pentagon_compliance(gd_file)
+        levels = []
+        if facts['encoding'] == 'utf-8':
+            levels = [level for _line, level in facts['consciousness_levels']]
+        # Missing methods count as issues, so --since reports a script that lost one
+        issues = [f"Missing {method}() method" for method in pentagon_result["missing_methods"]]
+        return {
+            "compliant": pentagon_result["is_compliant"],
+            "issues": issues + pentagon_result["issues"],
+            "consciousness_levels": levels
         }
-        
-        # Scan for consciousness_level assignments
-        for gd_file in self.project_root.rglob("*.gd"):
-            if self.should_skip_file(gd_file):
-                continue
-                
-            try:
-                with open(gd_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    
-                # Look for consciousness_level assignments
-                level_matches = re.findall(r'consciousness_level\s*=\s*(\d+)', content)
-                
-                for level_str in level_matches:
-                    level = int(level_str)
-                    consciousness_analysis["level_distribution"][level] += 1
-                    consciousness_analysis["beings_by_level"][level].append(gd_file.name)
-                    consciousness_analysis["total_conscious_beings"] += 1
-                    
-            except:
-                continue
-        
-        self.analysis["consciousness_levels"] = consciousness_analysis
     
     def analyze_autoloads(self):
         """Analyze autoload system configuration"""
@@ -299,35 +446,17 @@ class ArchitectureAnalyzer:
             "autoload_health": "Unknown"
         }
         
-        # Read project.godot for autoload configuration
-        project_godot = self.project_root / "project.godot"
-        
-        if project_godot.exists():
-            try:
-                with open(project_godot, 'r', encoding='utf-8') as f:
-                    content = f.read()
+        # Autoload entries come from the shared parse of project.godot
+        try:
+            for name, path in self.index.autoloads.items():
+                autoload_analysis["configured_autoloads"][name] = path
+                
+                # Check if file exists
+                autoload_file = self.project_root / path.replace('res://', '')
+                autoload_analysis["autoload_files_exist"][name] = autoload_file.exists()
                 
-                # Extract autoload entries
-                autoload_section = False
-                for line in content.split('\n'):
-                    if line.strip() == "[autoload]":
-                        autoload_section = True
-                        continue
-                    elif line.startswith('[') and autoload_section:
-                        break
-                    elif autoload_section and '=' in line:
-                        name, path = line.split('=', 1)
-                        name = name.strip()
-                        path = path.strip().strip('"').replace('*', '')
-                        
-                        autoload_analysis["configured_autoloads"][name] = path
-                        
-                        # Check if file exists
-                        autoload_file = self.project_root / path.replace('res://', '')
-                        autoload_analysis["autoload_files_exist"][name] = autoload_file.exists()
-                        
-            except Exception as e:
-                autoload_analysis["error"] = str(e)
+        except Exception as e:
+            autoload_analysis["error"] = str(e)
         
         # Health assessment
         total_autoloads = len(autoload_analysis["configured_autoloads"])
@@ -344,57 +473,6 @@ class ArchitectureAnalyzer:
             
         self.analysis["autoload_analysis"] = autoload_analysis
     
-    def analyze_akashic_integration(self):
-        """Analyze AkashicRecords integration and usage"""
-        print("📚 Analyzing Akashic Records integration...")
-        
-        akashic_analysis = {
-            "akashic_references": 0,
-            "save_operations": 0,
-            "load_operations": 0,
-            "component_packages": 0,
-            "akashic_library_structure": {},
-            "integration_health": "Unknown"
-        }
-        
-        # Count AkashicRecords usage
-        for gd_file in self.project_root.rglob("*.gd"):
-            if self.should_skip_file(gd_file):
-                continue
-                
-            try:
-                with open(gd_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    
-                if "AkashicRecords" in content:
-                    akashic_analysis["akashic_references"] += 1
-                    
-                akashic_analysis["save_operations"] += content.count("save_being_to_zip")
-                akashic_analysis["load_operations"] += content.count("load_being_from_zip")
-                    
-            except:
-                continue
-        
-        # Analyze akashic_library structure
-        akashic_lib = self.project_root / "akashic_library"
-        if akashic_lib.exists():
-            akashic_analysis["akashic_library_structure"] = self.analyze_directory(
-                akashic_lib, "Akashic Library"
-            )
-            
-            # Count .ub.zip packages
-            akashic_analysis["component_packages"] = len(list(akashic_lib.rglob("*.ub.zip")))
-        
-        # Health assessment
-        if akashic_analysis["akashic_references"] > 5 and akashic_analysis["component_packages"] > 0:
-            akashic_analysis["integration_health"] = "Excellent - active integration"
-        elif akashic_analysis["akashic_references"] > 0:
-            akashic_analysis["integration_health"] = "Good - basic integration"
-        else:
-            akashic_analysis["integration_health"] = "Poor - minimal integration"
-            
-        self.analysis["akashic_integration"] = akashic_analysis
-    
     def calculate_organization_score(self, structure):
         """Calculate overall organization score"""
         score = 0
@@ -547,13 +625,228 @@ class ArchitectureAnalyzer:
                 f.write("- 📦 Develop more .ub.zip component packages for modularity\n")
         
         print(f"📄 Report saved to: {report_path}")
+    
+    def stream_section(self, key):
+        """Mark a section finished and append every finished section whose turn has come.
+
+        Sections reach the file in self.analysis order, the order json.dump()
+        wrote them in, so one finished early (architecture_health) waits for
+        the ones before it. Each drops its per-file details once written.
+        """
+        self.finished_sections.add(key)
+        for pending in self.analysis:
+            if pending in self.json_writer.sections:
+                continue
+            if pending not in self.finished_sections:
+                break
+            self.json_writer.write_section(pending, self.analysis[pending])
+            self.release_details(pending)
+    
+    def release_details(self, key):
+        """Keep only what the markdown report needs; the full section is already on disk"""
+        section = self.analysis[key]
+        if key == "project_structure":
+            for folder in section.values():
+                folder.pop("files", None)
+                for subdir in folder["subdirectories"]:
+                    subdir.pop("analysis", None)
+        elif key == "pentagon_compliance":
+            section["missing_methods"] = {}
+            for directory in section["compliance_by_directory"].values():
+                directory.pop("files", None)
+        elif key == "consciousness_levels":
+            section["beings_by_level"] = {}
+        elif key == "akashic_integration":
+            section["akashic_library_structure"] = {}
+        elif key == "script_index":
+            self.analysis[key] = {}
+    
+    def run_delta(self, snapshot_path, delta_path=None):
+        """Compare the project with an earlier architecture_analysis.json,
+        re-analyzing only scripts whose content hash changed"""
+        print("🔍 Universal Being Architecture Delta")
+        print("=" * 50)
+        
+        snapshot_path = Path(snapshot_path)
+        with open(snapshot_path, 'r', encoding='utf-8') as f:
+            snapshot = json.load(f)
         
-        # Save JSON data
-        json_path = self.project_root / "architecture_analysis.json"
-        with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump(self.analysis, f, indent=2, default=str)
+        previous = snapshot.get("script_index")
+        if previous is None:
+            raise ValueError(f"{snapshot_path} has no script_index - run a full analysis to create a snapshot")
         
-        print(f"📊 JSON data saved to: {json_path}")
+        print(f"📂 Analyzing project: {self.project_root}")
+        print(f"📸 Snapshot: {snapshot_path} ({snapshot.get('timestamp', 'unknown time')})")
+        
+        profile = self.profiler.phase
+        with profile('compare_scripts'):
+            current, changed, added = self.compare_scripts(previous)
+        with profile('analyze_autoloads'):
+            self.analyze_autoloads()
+        with profile('save_cache'):
+            self.index.save_cache()
+        
+        removed = sorted(set(previous) - set(current))
+        delta = {
+            "timestamp": self.analysis["timestamp"],
+            "snapshot": str(snapshot_path),
+            "snapshot_timestamp": snapshot.get("timestamp"),
+            "scripts_checked": len(current),
+            "changed_files": changed,
+            "added_files": added,
+            "removed_files": removed,
+            "newly_compliant": [],
+            "new_violations": [],
+            "consciousness_changes": {},
+            "autoload_health": {}
+        }
+        
+        # Compliance transitions, only among scripts that actually changed
+        for key in changed + added:
+            old = previous.get(key)
+            new = current[key]
+            if new["compliant"]:
+                if old and not old["compliant"]:
+                    delta["newly_compliant"].append(key)
+                continue
+            old_issues = set(old["issues"]) if old and not old["compliant"] else set()
+            new_issues = [issue for issue in new["issues"] if issue not in old_issues]
+            if new_issues:
+                delta["new_violations"].append({"file": key, "issues": new_issues})
+        
+        # Consciousness level distribution before and after
+        before = Counter(level for record in previous.values() for level in record["consciousness_levels"])
+        after = Counter(level for record in current.values() for level in record["consciousness_levels"])
+        for level in sorted(set(before) | set(after)):
+            if before[level] != after[level]:
+                delta["consciousness_changes"][level] = {
+                    "before": before[level], "after": after[level], "change": after[level] - before[level]
+                }
+        
+        # Autoload health, plus which autoloads appeared, vanished or lost their file
+        old_autoloads = snapshot.get("autoload_analysis", {})
+        new_autoloads = self.analysis["autoload_analysis"]
+        old_exist = old_autoloads.get("autoload_files_exist", {})
+        new_exist = new_autoloads["autoload_files_exist"]
+        autoload_delta = {
+            "before": old_autoloads.get("autoload_health"),
+            "after": new_autoloads["autoload_health"],
+            "added": sorted(set(new_exist) - set(old_exist)),
+            "removed": sorted(set(old_exist) - set(new_exist)),
+            "now_missing": sorted(name for name, exists in new_exist.items() if not exists and old_exist.get(name)),
+            "now_present": sorted(name for name, exists in new_exist.items() if exists and old_exist.get(name) is False)
+        }
+        if autoload_delta["before"] != autoload_delta["after"] or any(
+                autoload_delta[k] for k in ("added", "removed", "now_missing", "now_present")):
+            delta["autoload_health"] = autoload_delta
+        
+        if self.profiler.enabled:
+            delta["profile"] = self.profiler.report()
+        
+        delta_path = Path(delta_path) if delta_path else self.project_root / "architecture_delta.json"
+        with JsonSectionWriter(delta_path, compact=self.compact_json) as writer:
+            for key, value in delta.items():
+                writer.write_section(key, value)
+        
+        self.print_delta(delta)
+        print(f"\n📊 Delta saved to: {delta_path}")
+        self.profiler.print_summary()
+        return delta
+    
+    def compare_scripts(self, previous):
+        """Current script_index records; unchanged scripts reuse the snapshot's record.
+        
+        A script inheriting from a changed, added or removed script is analyzed
+        again too, since its compliance follows its base classes (as with
+        git_changes.changed_scripts).
+        """
+        current = {}
+        changed = []
+        added = []
+        targets = set()
+        
+        def analyze(gd_file, key):
+            facts = self.index.facts(gd_file)
+            record = self.index.fingerprint(gd_file) or {"mtime_ns": None, "size": None, "sha1": None}
+            record.update(self.script_record(gd_file, facts))
+            current[key] = record
+        
+        def old_class_name(key):
+            # The fact cache still holds it until the script is parsed again
+            entry = self.index.fact_cache.entries.get(key)
+            if entry and entry['facts'].get('class_name'):
+                targets.add(entry['facts']['class_name'])
+        
+        scripts = [f for f in self.index.scripts() if not self.should_skip_file(f)]
+        for gd_file in scripts:
+            key = self.index.relative(gd_file)
+            old = previous.get(key)
+            try:
+                stat = gd_file.stat()
+            except OSError:
+                continue
+            
+            if old and old["mtime_ns"] == stat.st_mtime_ns and old["size"] == stat.st_size:
+                current[key] = old
+                continue
+            
+            if old:
+                # Touched: only a different hash means the script needs analyzing again
+                with open(gd_file, 'rb') as f:
+                    digest = hashlib.sha1(f.read()).hexdigest()
+                if digest == old["sha1"]:
+                    current[key] = old
+                    continue
+            
+            old_class_name(key)
+            targets.add(gd_file)
+            analyze(gd_file, key)
+            (changed if old else added).append(key)
+        
+        for key in set(previous) - set(current):
+            old_class_name(key)
+            targets.add(self.project_root / key)
+        
+        if targets:
+            for res_path in sorted(self.index.class_hierarchy.subclasses(targets)):
+                gd_file = self.project_root / res_path[len('res://'):]
+                key = self.index.relative(gd_file)
+                old = current.get(key)
+                if old is None or key in changed or key in added:
+                    continue
+                analyze(gd_file, key)
+                if any(current[key][field] != old[field] for field in ("compliant", "issues", "consciousness_levels")):
+                    changed.append(key)
+        
+        return current, changed, added
+    
+    def print_delta(self, delta):
+        print(f"\n📈 Changes since {delta['snapshot_timestamp']}:")
+        print(f"   Scripts: {len(delta['changed_files'])} changed, {len(delta['added_files'])} added, "
+              f"{len(delta['removed_files'])} removed (of {delta['scripts_checked']})")
+        
+        if delta["newly_compliant"]:
+            print(f"\n✅ Newly compliant ({len(delta['newly_compliant'])}):")
+            for key in delta["newly_compliant"]:
+                print(f"   + {key}")
+        
+        if delta["new_violations"]:
+            print(f"\n❌ New violations ({len(delta['new_violations'])}):")
+            for violation in delta["new_violations"]:
+                print(f"   - {violation['file']}: {', '.join(violation['issues'])}")
+        
+        if delta["consciousness_changes"]:
+            print("\n🧠 Consciousness level distribution:")
+            for level, change in delta["consciousness_changes"].items():
+                level_name = self.consciousness_levels.get(int(level), f"Level {level}")
+                print(f"   {level_name}: {change['before']} -> {change['after']} ({change['change']:+d})")
+        
+        autoloads = delta["autoload_health"]
+        if autoloads:
+            print(f"\n🚀 Autoload health: {autoloads['before']} -> {autoloads['after']}")
+            for label in ("added", "removed", "now_missing", "now_present"):
+                if autoloads[label]:
+                    print(f"   {label.replace('_', ' ')}: {', '.join(autoloads[label])}")
     
     def run_analysis(self):
         """Execute complete architecture analysis"""
@@ -561,16 +854,59 @@ class ArchitectureAnalyzer:
         print("=" * 50)
         
         print(f"📂 Analyzing project: {self.project_root}")
+        started = time.perf_counter()
+        
+        # Each section reaches disk as soon as its phase finishes, so a crash
+        # in a later phase still leaves valid JSON with the finished sections
+        self.json_writer = JsonSectionWriter(self.json_path, compact=self.compact_json)
+        try:
+            self.stream_section("timestamp")
+            
+            # Run all analyses
+            profile = self.profiler.phase
+            with profile('analyze_project_structure'):
+                self.analyze_project_structure()
+            self.stream_section("project_structure")
+            self.stream_section("architecture_health")
+            with profile('analyze_scripts'):
+                sections = self.analyze_scripts()
+            for section in sections:
+                self.stream_section(section)
+            with profile('analyze_autoloads'):
+                self.analyze_autoloads()
+            self.stream_section("autoload_analysis")
+            
+            # Sections no phase fills yet keep their place in the output
+            for key in list(self.analysis):
+                if key not in self.finished_sections:
+                    self.stream_section(key)
+            
+            # Persist extracted facts so the next run only re-parses changed files
+            with profile('save_cache'):
+                self.index.save_cache()
+            
+            # Generate reports
+            with profile('generate_comprehensive_report'):
+                self.generate_comprehensive_report()
+            
+            # The report phase is measured too, so the profile is the last section
+            if self.profiler.enabled:
+                self.analysis["profile"] = self.profiler.report()
+                self.stream_section("profile")
+        finally:
+            self.json_writer.close()
         
-        # Run all analyses
-        self.analyze_project_structure()
-        self.analyze_pentagon_compliance()
-        self.analyze_consciousness_levels()
-        self.analyze_autoloads()
-        self.analyze_akashic_integration()
+        print(f"📊 JSON data saved to: {self.json_path}")
         
-        # Generate reports
-        self.generate_comprehensive_report()
+        if self.record_history:
+            history = MetricsHistory(self.project_root)
+            try:
+                run_id = history.record_run(self.analysis, seconds=round(time.perf_counter() - started, 4),
+                                            phases=self.profiler.phases, peak_rss_mb=peak_rss_mb())
+            finally:
+                history.close()
+            print(f"📈 Run #{run_id} recorded in: {history.path}")
+        self.profiler.print_summary()
         
         print("\n✅ Architecture analysis complete!")
         print(f"📊 Organization Score: {self.analysis['architecture_health']['structure']['organization_score']}/100")
@@ -578,9 +914,37 @@ class ArchitectureAnalyzer:
         print(f"🧠 Conscious Beings: {self.analysis['consciousness_levels']['total_conscious_beings']}")
 
 def main():
-    # Get project root from current script location
-    project_root = os.path.dirname(os.path.abspath(__file__))
-    analyzer = ArchitectureAnalyzer(project_root)
+    parser = argparse.ArgumentParser(description='Analyze Universal Being project architecture')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Re-parse every script instead of using .ub_cache/script_facts.json')
+    parser.add_argument('--jobs', '-j', type=int, default=1, metavar='N',
+                        help='Parse scripts across N worker processes (0 = one per CPU core)')
+    parser.add_argument('--profile', action='store_true',
+                        help='Record per-phase time, files, bytes read and peak memory into the JSON output')
+    parser.add_argument('--profile-dump', metavar='DIR',
+                        help='Also write a cProfile .pstats dump per phase into DIR (implies --profile)')
+    parser.add_argument('--compact-json', action='store_true',
+                        help='Write architecture_analysis.json without indentation')
+    parser.add_argument('--no-history', action='store_true',
+                        help='Do not record this run in the metrics history (ub_history.sqlite)')
+    parser.add_argument('--since', metavar='SNAPSHOT',
+                        help='Only re-analyze scripts changed since an earlier architecture_analysis.json '
+                             'and write the delta instead of a full analysis')
+    parser.add_argument('--delta-output', metavar='PATH',
+                        help='Where --since writes its delta (default: architecture_delta.json)')
+    args = parser.parse_args()
+    
+    # Find the Godot project these tools belong to
+    project_root = find_project_root()
+    profiler = PhaseProfiler(args.profile, args.profile_dump, tool='ArchitectureAnalyzer')
+    with profiler.phase('project_index_walk'):
+        index = ProjectIndex(project_root, use_cache=not args.no_cache)
+    analyzer = ArchitectureAnalyzer(project_root, index=index, jobs=args.jobs, profiler=profiler,
+                                    compact_json=args.compact_json, record_history=not args.no_history)
+    if args.since:
+        delta = analyzer.run_delta(args.since, args.delta_output)
+        # Non-zero exit lets CI fail a pull request that adds violations
+        sys.exit(1 if delta["new_violations"] else 0)
     analyzer.run_analysis()
 
 if __name__ == "__main__":
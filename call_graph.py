@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Universal Being Call Graph
+==========================
+Resolved function -> caller index over every script, built once per run
+from the cached call sites in the script facts (see script_facts.py).
+
+    graph = index.call_graph
+    graph.who_calls('SystemBootstrap.get_flood_gates')
+    graph.reaches('res://scripts/main_script.gd:_ready')
+
+Functions are named 'res://path.gd:function'; code outside any function
+(member initializers) is '<script>'. A call is resolved through its
+receiver:
+- no receiver, self           -> the calling script, then its ancestors
+- super                       -> the ancestors of the calling script
+- an autoload name            -> the autoload script (SystemBootstrap.x())
+- a class_name                -> that script (FloodGates.x()); Foo.new() goes
+                                 to the _init() Foo defines or inherits
+- a variable typed in the script (var fg: FloodGates) -> that class
+
+Everything else (engine methods, untyped variables, chained calls) stays
+unresolved and is only counted. Queries are dictionary lookups plus a
+breadth-first walk, so they take milliseconds even on a large project.
+"""
+
+from collections import deque
+from typing import Dict, List, Optional, Set, Tuple
+
+SCRIPT_LEVEL = '<script>'
+
+
+class CallGraph:
+    def __init__(self, index):
+        self.index = index
+        self.hierarchy = index.class_hierarchy
+
+        self.autoloads: Dict[str, str] = index.autoloads  # name -> res:// path
+        self.definitions: Dict[str, Dict[str, int]] = {}  # res:// path -> function -> line
+        self.by_name: Dict[str, List[str]] = {}           # function name -> defining scripts
+        self.callees: Dict[str, Dict[str, List[int]]] = {}  # caller -> callee -> call lines
+        self.callers: Dict[str, Dict[str, List[int]]] = {}  # callee -> caller -> call lines
+        self.call_sites = 0
+        self.resolved = 0
+        self.receivers: Dict[str, int] = {}  # resolved calls per autoload / class receiver
+
+        self._lookups: Dict[Tuple[str, str], Optional[str]] = {}
+        self._build()
+
+    def _build(self):
+        facts_by_script = {}
+        for script in self.index.scripts():
+            facts = self.index.facts(script)
+            if facts['encoding'] != 'utf-8':
+                continue
+            res_path = self.hierarchy.res_path(script)
+            facts_by_script[res_path] = facts
+            self.definitions[res_path] = facts['function_lines']
+            for name in facts['function_lines']:
+                self.by_name.setdefault(name, []).append(res_path)
+
+        # Every definition is known before the first call is resolved
+        for res_path, facts in facts_by_script.items():
+            typed_vars = facts['typed_vars']
+            for caller, receiver, name, line in facts['call_sites']:
+                self.call_sites += 1
+                target_script = self._receiver_script(res_path, receiver, typed_vars)
+                if target_script is None:
+                    continue
+                if name == 'new' and self._is_class_receiver(receiver, typed_vars):
+                    name = '_init'  # The constructor
+                if receiver == 'super':
+                    callee = self._lookup_ancestors(target_script, name)
+                else:
+                    callee = self._lookup(target_script, name)
+                if callee is None:
+                    continue
+
+                self.resolved += 1
+                if receiver not in (None, 'self', 'super'):
+                    self.receivers[receiver] = self.receivers.get(receiver, 0) + 1
+                caller_node = f"{res_path}:{caller or SCRIPT_LEVEL}"
+                self.callees.setdefault(caller_node, {}).setdefault(callee, []).append(line)
+                self.callers.setdefault(callee, {}).setdefault(caller_node, []).append(line)
+
+    def _receiver_script(self, res_path: str, receiver: Optional[str], typed_vars: Dict[str, str]) -> Optional[str]:
+        """Script a call goes to, before looking up inherited functions"""
+        if receiver in (None, 'self', 'super'):
+            return res_path
+        if receiver in self.autoloads:
+            return self.autoloads[receiver]
+        class_name = typed_vars.get(receiver, receiver)
+        return self.hierarchy.class_files.get(class_name)
+
+    def _is_class_receiver(self, receiver: Optional[str], typed_vars: Dict[str, str]) -> bool:
+        """True when the receiver is a class_name itself rather than an instance"""
+        return (receiver in self.hierarchy.class_files and receiver not in typed_vars
+                and receiver not in self.autoloads)
+
+    def _lookup(self, res_path: str, name: str) -> Optional[str]:
+        """'res://defining.gd:name' for a function defined in res_path or inherited by it"""
+        key = (res_path, name)
+        if key not in self._lookups:
+            if name in self.definitions.get(res_path, ()):
+                self._lookups[key] = f"{res_path}:{name}"
+            else:
+                self._lookups[key] = self._lookup_ancestors(res_path, name)
+        return self._lookups[key]
+
+    def _lookup_ancestors(self, res_path: str, name: str) -> Optional[str]:
+        for ancestor in self.hierarchy.ancestors(res_path):
+            if name in self.definitions.get(ancestor, ()):
+                return f"{ancestor}:{name}"
+        return None
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def functions(self, symbol: str) -> List[str]:
+        """Function nodes matching a symbol.
+
+        'Autoload.func', 'ClassName.func', 'res://path.gd:func',
+        'path.gd:func', or a bare 'func' (every definition of that name).
+        """
+        if ':' in symbol and not symbol.endswith(':'):
+            path, name = symbol.rsplit(':', 1)
+            if not path.startswith('res://'):
+                path = 'res://' + path
+            return [f"{path}:{name}"] if name in self.definitions.get(path, ()) else []
+
+        if '.' in symbol:
+            receiver, name = symbol.rsplit('.', 1)
+            script = self._receiver_script('', receiver, {})
+            callee = self._lookup(script, name) if script else None
+            return [callee] if callee else []
+
+        return [f"{path}:{symbol}" for path in self.by_name.get(symbol, [])]
+
+    def who_calls(self, symbol: str) -> List[Tuple[str, str, List[int]]]:
+        """(caller, callee, call lines) for every resolved call to the symbol"""
+        return [(caller, callee, lines)
+                for callee in self.functions(symbol)
+                for caller, lines in sorted(self.callers.get(callee, {}).items())]
+
+    def reaches(self, symbol: str) -> Set[str]:
+        """Every function transitively callable from the symbol (the symbol itself excluded)"""
+        start = self.functions(symbol)
+        seen: Set[str] = set(start)
+        queue = deque(start)
+        while queue:
+            for callee in self.callees.get(queue.popleft(), ()):
+                if callee not in seen:
+                    seen.add(callee)
+                    queue.append(callee)
+        return seen.difference(start)
+
+    def most_called(self, limit: int = 10) -> List[Tuple[str, int]]:
+        """Functions with the most distinct calling functions"""
+        counts = [(callee, len(callers)) for callee, callers in self.callers.items()]
+        counts.sort(key=lambda item: (-item[1], item[0]))
+        return counts[:limit]
+
+    def summary(self) -> Dict:
+        return {
+            'functions': sum(len(functions) for functions in self.definitions.values()),
+            'call_sites': self.call_sites,
+            'resolved_calls': self.resolved,
+            'edges': sum(len(callees) for callees in self.callees.values()),
+            'calls_by_receiver': dict(sorted(self.receivers.items(), key=lambda item: -item[1])[:15]),
+            'most_called': [{'function': callee, 'callers': count} for callee, count in self.most_called()],
+        }
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Universal Being Class Hierarchy
+===============================
+A project-wide class_name -> script -> extends index, built once per run
+from the cached script facts (see script_facts.py).
+
+The Pentagon tools used to treat a script as a Universal Being only when
+its extends line literally started with "UniversalBeing". Beings that
+extend an intermediate class (UniversalBeingEnhanced, a class_name from
+scripts/, or a quoted "res://..." path) were misclassified, and scripts
+extending an unrelated UniversalBeingControl were wrongly included.
+
+    hierarchy = index.class_hierarchy
+    hierarchy.is_universal_being(path)   # O(1) after the first query
+    hierarchy.ancestors(path)            # ['res://core/UniversalBeing.gd', 'Node3D', ...]
+
+extends targets resolve in this order:
+- quoted paths: "res://..." or relative to the script ("../base.gd")
+- class_name declared by a project script
+- anything else (Node3D, RefCounted, ...) stays a plain engine class name
+
+Ancestor chains are memoized per script, and inheritance cycles end the
+chain instead of recursing forever.
+"""
+
+import os
+import re
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+# The class every Pentagon being descends from
+ROOT_CLASS = 'UniversalBeing'
+
+_QUOTED_RE = re.compile(r'''^(["'])(.+?)\1''')
+_IDENTIFIER_RE = re.compile(r'^[A-Za-z_]\w*')
+
+
+class ClassHierarchy:
+    def __init__(self, index):
+        self.index = index
+        self.root = index.root
+
+        self.class_files: Dict[str, str] = {}     # class_name -> res:// path
+        self.extends: Dict[str, str] = {}         # res:// path -> resolved parent (res:// path or class name)
+        self.duplicates: Dict[str, List[str]] = {}  # class_name declared by more than one script
+
+        self._ancestors: Dict[str, List[str]] = {}
+        self._is_ub: Dict[str, bool] = {}
+
+        self._build()
+
+    def _build(self):
+        raw_extends = {}
+        for script in self.index.scripts():
+            facts = self.index.facts(script)
+            if facts['encoding'] != 'utf-8':
+                continue
+
+            res_path = self.res_path(script)
+            class_name = facts['class_name']
+            if class_name:
+                if class_name in self.class_files:
+                    self.duplicates.setdefault(class_name, [self.class_files[class_name]]).append(res_path)
+                else:
+                    self.class_files[class_name] = res_path
+            if facts['extends']:
+                raw_extends[res_path] = facts['extends']
+
+        # class_names are only known once every script was seen
+        for res_path, target in raw_extends.items():
+            parent = self.resolve(target, res_path)
+            if parent:
+                self.extends[res_path] = parent
+
+    def res_path(self, path) -> str:
+        """res:// form of a project file path"""
+        return 'res://' + Path(path).relative_to(self.root).as_posix()
+
+    def resolve(self, target: str, from_res_path: str) -> Optional[str]:
+        """An extends target as a res:// script path, or an engine class name"""
+        target = target.strip()
+        quoted = _QUOTED_RE.match(target)
+        if quoted:
+            path = quoted.group(2)
+            if path.startswith('res://'):
+                return path
+            # Relative to the extending script's folder
+            base = os.path.dirname(from_res_path[len('res://'):])
+            return 'res://' + os.path.normpath(os.path.join(base, path)).replace(os.sep, '/')
+
+        identifier = _IDENTIFIER_RE.match(target)
+        if not identifier:
+            return None
+        name = identifier.group(0)  # Outer class of "Base.Inner"
+        return self.class_files.get(name, name)
+
+    def ancestors(self, path) -> List[str]:
+        """Parents of a script from nearest to farthest (res:// paths and class names)"""
+        res_path = path if str(path).startswith('res://') else self.res_path(path)
+        chain = self._ancestors.get(res_path)
+        if chain is not None:
+            return chain
+
+        chain = []
+        seen: Set[str] = {res_path}
+        current = self.extends.get(res_path)
+        while current and current not in seen:
+            chain.append(current)
+            seen.add(current)
+            known = self._ancestors.get(current)
+            if known is not None:
+                chain.extend(a for a in known if a not in seen)
+                break
+            current = self.extends.get(current)
+
+        self._ancestors[res_path] = chain
+        return chain
+
+    def is_universal_being(self, path) -> bool:
+        """Whether a script inherits from UniversalBeing, directly or through any intermediate class"""
+        res_path = path if str(path).startswith('res://') else self.res_path(path)
+        result = self._is_ub.get(res_path)
+        if result is None:
+            root_file = self.class_files.get(ROOT_CLASS)
+            result = any(a == ROOT_CLASS or a == root_file for a in self.ancestors(res_path))
+            self._is_ub[res_path] = result
+        return result
+
+    def subclasses(self, targets) -> Set[str]:
+        """res:// paths of every script inheriting from any target.
+
+        Targets are Path objects, res:// paths or class names; a class name
+        also matches scripts whose extends no longer resolves to a file
+        (the class was renamed or its script deleted).
+        """
+        targets = {self.res_path(t) if isinstance(t, Path) else t for t in targets}
+        return {child for child in self.extends
+                if child not in targets and targets.intersection(self.ancestors(child))}
@@ -24,12 +24,13 @@ ORGANIZING RULES:
 6. Create navigation README if missing
 """
 
-import os
 import shutil
 from pathlib import Path
 from typing import Dict, List
 from datetime import datetime
 
+from project_root import find_project_root
+
 class DocsOrganizer:
     def __init__(self, project_root: str):
         self.root = Path(project_root)
@@ -305,8 +306,8 @@ That's it! You're now in the Universal Being universe where everything is consci
 
 def main():
     """Main organization function"""
-    # Get project root from current script location
-    project_root = os.path.dirname(os.path.abspath(__file__))
+    # Find the Godot project these tools belong to
+    project_root = find_project_root()
     organizer = DocsOrganizer(project_root)
     organizer.organize_docs()
 
@@ -20,12 +20,13 @@ ALLOWED STRUCTURE:
 EVERYTHING ELSE GETS SORTED OR DELETED.
 """
 
-import os
 import shutil
 import json
 from pathlib import Path
 from typing import List, Dict, Set
 
+from project_root import find_project_root
+
 class UniversalBeingCleaner:
     def __init__(self, project_root: str):
         self.root = Path(project_root)
@@ -300,8 +301,8 @@ class UniversalBeingCleaner:
 
 def main():
     """Main cleanup function"""
-    # Get project root from current script location
-    project_root = os.path.dirname(os.path.abspath(__file__))
+    # Find the Godot project these tools belong to
+    project_root = find_project_root()
     cleaner = UniversalBeingCleaner(project_root)
     cleaner.run_cleanup()
 
@@ -10,11 +10,13 @@ import shutil
 from pathlib import Path
 import json
 
+from project_root import find_project_root
+
 class ScriptsCleaner:
     def __init__(self, project_root=None):
-        # Auto-detect project root from script location
+        # Auto-detect project root (see project_root.py)
         if project_root is None:
-            project_root = os.path.dirname(os.path.abspath(__file__))
+            project_root = find_project_root()
         
         self.project_root = Path(project_root)
         self.scripts_dir = self.project_root / "scripts"
@@ -371,8 +373,8 @@ class ScriptsCleaner:
         print("🔍 Review the backup and report before deleting backup folder")
 
 def main():
-    # Get project root from current script location
-    project_root = os.path.dirname(os.path.abspath(__file__))
+    # Find the Godot project these tools belong to
+    project_root = find_project_root()
     cleaner = ScriptsCleaner(project_root)
     cleaner.run_cleanup()
 
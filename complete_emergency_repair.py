@@ -9,9 +9,12 @@ import re
 import shutil
 from pathlib import Path
 
+from project_root import find_project_root
+
 class CompleteEmergencyRepair:
-    def __init__(self):
-        self.project_root = Path(r"C:\Users\Percision 15\Universal_Being")
+    def __init__(self, project_root=None):
+        # Shared root finder (see project_root.py) instead of a hardcoded Windows path
+        self.project_root = Path(project_root) if project_root else find_project_root()
         self.fixes_applied = []
         self.errors_fixed = 0
         
@@ -200,6 +203,29 @@ class CompleteEmergencyRepair:
                 except:
                     pass
     
+    def fix_scene_uid_references(self):
+        """Point every scene ext_resource at the file its uid or path names now"""
+        print("🔧 Fixing scene uid:// references...")
+        from project_index import ProjectIndex
+        from uid_index import relink_scene_text
+
+        index = ProjectIndex(self.project_root)
+        uids = index.uid_index
+        for scene_file in index.scenes() + index.resources():
+            try:
+                with open(scene_file, 'r', encoding='utf-8') as f:
+                    content = f.read()
+                content, changes = relink_scene_text(content, uids, uids.res_path(scene_file))
+                if changes:
+                    with open(scene_file, 'w', encoding='utf-8') as f:
+                        f.write(content)
+                    index.refresh_file(scene_file)
+                    self.errors_fixed += len(changes)
+                    self.fixes_applied.append(f"Relinked {len(changes)} uid/path references in {scene_file.name}")
+            except:
+                pass
+        index.save_cache()
+    
     def fix_missing_extends(self):
         """Fix missing or wrong extends statements"""
         print("🔧 Fixing extends statements...")
@@ -345,6 +371,7 @@ func get_component_data() -> Dictionary:
         self.fix_systembootstrap_completely()
         self.remove_all_duplicate_class_names()
         self.fix_all_preload_paths()
+        self.fix_scene_uid_references()
         self.fix_missing_extends()
         self.fix_pentagon_compliance()
         self.create_missing_base_classes()
@@ -8,9 +8,11 @@ import os
 import re
 from pathlib import Path
 
+from project_root import find_project_root
+
 class EmergencyRepair:
-    def __init__(self):
-        self.project_root = Path.cwd()
+    def __init__(self, project_root=None):
+        self.project_root = Path(project_root) if project_root else find_project_root()
         self.fixes_applied = []
         
     def fix_systembootstrap(self):
@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+Universal Being File Watcher
+============================
+Reports which project files changed so tools can re-check only those.
+
+Two backends share one interface:
+- InotifyWatcher: Linux inotify through ctypes, no extra packages needed
+- PollingWatcher: (mtime, size) snapshots, works everywhere (Windows,
+  WSL drives under /mnt, network shares)
+
+    watcher = create_watcher(project_root, ['beings', 'core'], suffixes=('.gd',))
+    while True:
+        for path in watcher.wait():
+            print("changed:", path)
+
+wait() blocks until something changed, then keeps collecting until the
+tree has been quiet for `settle` seconds, so an editor save that touches
+a file several times is reported once. Deleted files are reported too;
+callers check path.exists().
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from project_index import SKIP_DIRS
+
+# inotify event flags (linux/inotify.h)
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+
+_WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_DELETE_SELF
+_EVENT_HEADER = struct.Struct('iIII')  # wd, mask, cookie, len
+
+
+class PollingWatcher:
+    """Detects changes by comparing (mtime, size) snapshots of the watched trees"""
+
+    backend = 'polling'
+
+    def __init__(self, project_root, directories: Iterable[str], suffixes: Tuple[str, ...] = ('.gd',),
+                 interval: float = 1.0, settle: float = 0.3):
+        self.root = Path(project_root)
+        self.directories = [self.root / d for d in directories]
+        self.suffixes = tuple(suffixes)
+        self.interval = interval
+        self.settle = settle
+        self._snapshot = self._take_snapshot()
+
+    def files(self) -> List[Path]:
+        """Every watched file currently on disk"""
+        return list(self._snapshot)
+
+    def _take_snapshot(self) -> Dict[Path, Tuple[int, int]]:
+        snapshot = {}
+        for path in _walk_files(self.directories, self.suffixes):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue  # Deleted between listing and stat
+            snapshot[path] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+    def poll(self) -> Set[Path]:
+        """Paths added, modified or deleted since the previous poll"""
+        current = self._take_snapshot()
+        previous = self._snapshot
+        self._snapshot = current
+
+        changed = {p for p, key in current.items() if previous.get(p) != key}
+        changed.update(p for p in previous if p not in current)
+        return changed
+
+    def wait(self, timeout: Optional[float] = None) -> Set[Path]:
+        """Block until files change (or timeout expires) and return them"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            changed = self.poll()
+            if changed:
+                # Keep collecting until the editor has finished writing
+                while True:
+                    time.sleep(self.settle)
+                    more = self.poll()
+                    if not more:
+                        return changed
+                    changed |= more
+            if deadline is not None and time.monotonic() >= deadline:
+                return set()
+            time.sleep(self.interval)
+
+    def close(self):
+        pass
+
+
+class InotifyWatcher:
+    """Linux inotify watcher; raises OSError when inotify is unavailable"""
+
+    backend = 'inotify'
+
+    def __init__(self, project_root, directories: Iterable[str], suffixes: Tuple[str, ...] = ('.gd',),
+                 settle: float = 0.3):
+        self.root = Path(project_root)
+        self.directories = [self.root / d for d in directories]
+        self.suffixes = tuple(suffixes)
+        self.settle = settle
+        self._watches: Dict[int, Path] = {}
+
+        libc_name = ctypes.util.find_library('c')
+        self._libc = ctypes.CDLL(libc_name, use_errno=True)
+        if not hasattr(self._libc, 'inotify_init1'):
+            raise OSError("inotify is not available on this platform")
+
+        self._fd = self._libc.inotify_init1(os.O_CLOEXEC)
+        if self._fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+
+        # Files seen so far, so a directory moved away can report what it took along
+        self._known: Set[Path] = set()
+        for directory in self.directories:
+            if directory.is_dir():
+                self._known.update(self._add_tree(directory))
+
+    def files(self) -> List[Path]:
+        """Every watched file currently on disk"""
+        return list(_walk_files(self.directories, self.suffixes))
+
+    def _add_tree(self, directory: Path) -> List[Path]:
+        """Watch directory and its subdirectories; returns matching files already inside"""
+        found = []
+        for dirpath, dirnames, filenames in os.walk(directory):
+            dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS]
+            self._add_watch(Path(dirpath))
+            found.extend(Path(dirpath) / name for name in filenames if name.endswith(self.suffixes))
+        return found
+
+    def _add_watch(self, directory: Path):
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(str(directory)), _WATCH_MASK)
+        if wd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, f"Cannot watch {directory}: {os.strerror(errno)}")
+        self._watches[wd] = directory
+
+    def _read_events(self) -> Set[Path]:
+        changed: Set[Path] = set()
+        data = os.read(self._fd, 64 * 1024)
+        offset = 0
+
+        while offset < len(data):
+            wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            name = data[offset:offset + length].rstrip(b'\0')
+            offset += length
+
+            if mask & IN_Q_OVERFLOW:
+                # Events were dropped - report everything so callers resynchronise
+                current = set(self.files())
+                changed |= current | self._known
+                self._known = current
+                continue
+            if mask & IN_IGNORED:
+                self._watches.pop(wd, None)
+                continue
+
+            directory = self._watches.get(wd)
+            if directory is None or not name:
+                continue
+            path = directory / os.fsdecode(name)
+
+            if mask & IN_ISDIR:
+                if mask & (IN_CREATE | IN_MOVED_TO):
+                    added = self._add_tree(path)
+                    self._known.update(added)
+                    changed.update(added)
+                elif mask & IN_MOVED_FROM:
+                    changed.update(self._forget_tree(path))
+                continue
+
+            if path.name.endswith(self.suffixes):
+                if mask & (IN_DELETE | IN_MOVED_FROM):
+                    self._known.discard(path)
+                else:
+                    self._known.add(path)
+                changed.add(path)
+
+        return changed
+
+    def _forget_tree(self, directory: Path) -> List[Path]:
+        """Drop watches and known files under a directory moved away; returns those files"""
+        prefix = str(directory) + os.sep
+        for wd, watched in list(self._watches.items()):
+            if watched == directory or str(watched).startswith(prefix):
+                self._libc.inotify_rm_watch(self._fd, wd)
+                del self._watches[wd]
+
+        gone = [p for p in self._known if str(p).startswith(prefix)]
+        self._known.difference_update(gone)
+        return gone
+
+    def wait(self, timeout: Optional[float] = None) -> Set[Path]:
+        """Block until files change (or timeout expires) and return them"""
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return set()
+
+        changed = self._read_events()
+        # Keep collecting until the editor has finished writing
+        while select.select([self._fd], [], [], self.settle)[0]:
+            changed |= self._read_events()
+        return changed
+
+    def close(self):
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+def create_watcher(project_root, directories: Iterable[str], suffixes: Tuple[str, ...] = ('.gd',),
+                   interval: float = 1.0, force_polling: bool = False):
+    """inotify when the platform supports it, polling otherwise"""
+    directories = list(directories)
+    if not force_polling:
+        try:
+            return InotifyWatcher(project_root, directories, suffixes)
+        except (OSError, AttributeError, TypeError):
+            pass  # Not Linux, no libc, or out of inotify watches
+    return PollingWatcher(project_root, directories, suffixes, interval=interval)
+
+
+def _walk_files(directories: List[Path], suffixes: Tuple[str, ...]):
+    for directory in directories:
+        for dirpath, dirnames, filenames in os.walk(directory):
+            dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS]
+            for name in filenames:
+                if name.endswith(suffixes):
+                    yield Path(dirpath) / name
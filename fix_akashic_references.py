@@ -3,11 +3,12 @@
 Fix AkashicRecordsSystem double-naming issue
 """
 
-import os
 import re
 from pathlib import Path
 
-def fix_akashic_references():
+from project_root import find_project_root
+
+def fix_akashic_references(root_dir=None):
     """Fix AkashicRecordsSystemSystem to AkashicRecordsSystem"""
     
     # Files to fix
@@ -18,8 +19,9 @@ def fix_akashic_references():
         "res://systems/storage/AkashicRecordsSystemSystem.gd": "res://systems/storage/AkashicRecordsSystem.gd"
     }
     
-    # Get project root from current script location
-    root_dir = os.path.dirname(os.path.abspath(__file__))
+    # Find the Godot project these tools belong to
+    if root_dir is None:
+        root_dir = find_project_root()
     updated_files = []
     
     # File extensions to check
@@ -8,22 +8,42 @@ Focuses on:
 2. Missing class_name declarations  
 3. Lost Pentagon method implementations
 4. File encoding issues
+
+All fixes for a script are applied together as span edits and the script
+is written once (see script_edits.py); --dry-run prints them as a unified
+diff instead.
 """
 
-import os
+import argparse
 import re
 from pathlib import Path
 from typing import List, Dict, Set
 
+from git_changes import GitScopeError, changed_scripts
+from phase_profiler import PhaseProfiler
+from project_index import ProjectIndex
+from project_root import find_project_root
+from script_edits import EditConflict, FileEdits
+
 class PentagonComplianceRecovery:
-    def __init__(self, project_root=None):
+    def __init__(self, project_root=None, index=None, jobs=1, profiler=None, only_files=None, dry_run=False):
         if project_root is None:
-            project_root = os.path.dirname(os.path.abspath(__file__))
+            project_root = find_project_root()
         
         self.project_root = Path(project_root)
+        self.index = index if index is not None else ProjectIndex(self.project_root)
+        self.jobs = jobs
+        self.profiler = profiler if profiler is not None else PhaseProfiler(tool='PentagonComplianceRecovery')
+        self.profiler.attach(self.index)
         self.issues_found = []
         self.fixes_applied = []
         
+        # --changed-since: only diagnose and fix these scripts (see git_changes.py)
+        self.only_files = only_files
+        
+        # Print the fixes as a unified diff instead of writing them
+        self.dry_run = dry_run
+        
         # Pentagon method requirements
         self.pentagon_methods = [
             "pentagon_init", "pentagon_ready", "pentagon_process", 
@@ -51,11 +71,19 @@ class PentagonComplianceRecovery:
         total_scripts = 0
         issue_scripts = 0
         
+        # Parse stale scripts across worker processes; issues are still collected in order
+        self.index.prefetch_facts(
+            [f for d in scan_directories for f in self.index.scripts(d)
+             if self.only_files is None or f in self.only_files], self.jobs
+        )
+        
         for directory in scan_directories:
             dir_path = self.project_root / directory
             if dir_path.exists():
                 print(f"\n📂 Scanning {directory}/")
-                scripts = list(dir_path.rglob("*.gd"))
+                scripts = self.index.scripts(directory)
+                if self.only_files is not None:
+                    scripts = [script for script in scripts if script in self.only_files]
                 total_scripts += len(scripts)
                 
                 for script in scripts:
@@ -69,49 +97,39 @@ class PentagonComplianceRecovery:
         print(f"   Scripts with issues: {issue_scripts}")
         print(f"   Total issues found: {len(self.issues_found)}")
         
+        # Persist extracted facts so the next run only re-parses changed files
+        self.index.save_cache()
+        
         return self.issues_found
     
     def analyze_script_compliance(self, script_path: Path) -> List[Dict]:
         """Analyze a single script for compliance issues"""
         issues = []
+        relative_path = str(script_path.relative_to(self.project_root))
         
-        try:
-            with open(script_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-        except UnicodeDecodeError:
-            try:
-                with open(script_path, 'r', encoding='cp1252') as f:
-                    content = f.read()
-                issues.append({
-                    "type": "ENCODING",
-                    "file": str(script_path.relative_to(self.project_root)),
-                    "message": "File has encoding issues (cp1252 detected)"
-                })
-            except:
-                issues.append({
-                    "type": "READ_ERROR", 
-                    "file": str(script_path.relative_to(self.project_root)),
-                    "message": "Cannot read file"
-                })
-                return issues
-        except:
+        facts = self.index.facts(script_path)
+        if facts['encoding'] is None:
             issues.append({
                 "type": "READ_ERROR",
-                "file": str(script_path.relative_to(self.project_root)), 
+                "file": relative_path,
                 "message": "Cannot read file"
             })
             return issues
-        
-        relative_path = str(script_path.relative_to(self.project_root))
+        elif facts['encoding'] != 'utf-8':
+            issues.append({
+                "type": "ENCODING",
+                "file": relative_path,
+                "message": "File has encoding issues (cp1252 detected)"
+            })
         
         # Check if this should be a Universal Being
-        if self.should_be_universal_being(content, script_path.name):
+        if self.should_be_universal_being(facts, script_path.name):
             # Check extends statement
-            extends_issues = self.check_extends_statement(content, relative_path)
+            extends_issues = self.check_extends_statement(facts, relative_path)
             issues.extend(extends_issues)
             
             # Check class_name
-            if not self.has_class_name(content):
+            if not self.has_class_name(facts):
                 issues.append({
                     "type": "MISSING_CLASS_NAME",
                     "file": relative_path,
@@ -119,21 +137,20 @@ class PentagonComplianceRecovery:
                 })
             
             # Check Pentagon methods
-            pentagon_issues = self.check_pentagon_methods(content, relative_path)
+            pentagon_issues = self.check_pentagon_methods(facts, relative_path)
             issues.extend(pentagon_issues)
         
         return issues
     
-    def should_be_universal_being(self, content: str, filename: str) -> bool:
+    def should_be_universal_being(self, facts: Dict, filename: str) -> bool:
         """Determine if script should extend UniversalBeing"""
         # If it extends UniversalBeing (even with wrong path), it should be compliant
-        if re.search(r'extends\s+.*Universal.*Being', content):
+        if facts['extends'] and re.search(r'Universal.*Being', facts['extends']):
             return True
         
         # If it has Pentagon methods, it should extend UniversalBeing
-        for method in self.pentagon_methods:
-            if f"func {method}(" in content:
-                return True
+        if facts['pentagon_methods']:
+            return True
         
         # If it's in beings/ folder, it should extend UniversalBeing
         if "beings" in filename or "UniversalBeing" in filename:
@@ -141,12 +158,12 @@ class PentagonComplianceRecovery:
         
         return False
     
-    def check_extends_statement(self, content: str, filepath: str) -> List[Dict]:
+    def check_extends_statement(self, facts: Dict, filepath: str) -> List[Dict]:
         """Check extends statement for validity"""
         issues = []
         
-        extends_match = re.search(r'extends\s+(.+)', content)
-        if not extends_match:
+        extends_value = facts['extends']
+        if not extends_value:
             issues.append({
                 "type": "MISSING_EXTENDS",
                 "file": filepath,
@@ -154,8 +171,6 @@ class PentagonComplianceRecovery:
             })
             return issues
         
-        extends_value = extends_match.group(1).strip()
-        
         # Check for broken paths
         if "res://" in extends_value and "UniversalBeing" in extends_value:
             # This is a path reference, check if it's valid
@@ -177,132 +192,129 @@ class PentagonComplianceRecovery:
         
         return issues
     
-    def has_class_name(self, content: str) -> bool:
+    def has_class_name(self, facts: Dict) -> bool:
         """Check if script has class_name declaration"""
-        return bool(re.search(r'class_name\s+\w+', content))
+        return facts['class_name'] is not None
     
-    def check_pentagon_methods(self, content: str, filepath: str) -> List[Dict]:
+    def check_pentagon_methods(self, facts: Dict, filepath: str) -> List[Dict]:
         """Check Pentagon method implementation"""
         issues = []
         
         for method in self.pentagon_methods:
-            if f"func {method}(" not in content:
+            method_facts = facts['pentagon_methods'].get(method)
+            if not method_facts:
                 issues.append({
                     "type": "MISSING_PENTAGON_METHOD",
                     "file": filepath,
                     "message": f"Missing {method}() method"
                 })
-            else:
-                # Check for super() call
-                method_pattern = rf"func {method}\([^)]*\).*?(?=func|\Z)"
-                method_match = re.search(method_pattern, content, re.DOTALL)
-                
-                if method_match and f"super.{method}(" not in method_match.group():
-                    issues.append({
-                        "type": "MISSING_SUPER_CALL",
-                        "file": filepath,
-                        "message": f"{method}() missing super() call"
-                    })
+            elif method_facts['super_line'] is None:
+                # Method exists but never calls its super() counterpart
+                issues.append({
+                    "type": "MISSING_SUPER_CALL",
+                    "file": filepath,
+                    "message": f"{method}() missing super() call"
+                })
         
         return issues
     
     def fix_compliance_issues(self):
-        """Automatically fix common compliance issues"""
+        """Automatically fix common compliance issues.
+        
+        Every fix for a script becomes a span edit against one in-memory copy;
+        each script is then written once (or shown as a diff with dry_run).
+        """
         print("\n🔧 APPLYING PENTAGON COMPLIANCE FIXES")
         print("=" * 50)
         
-        for issue in self.issues_found:
-            if issue["type"] == "BROKEN_EXTENDS_PATH":
-                self.fix_extends_path(issue)
-            elif issue["type"] == "WRONG_EXTENDS":
-                self.fix_extends_statement(issue)
-            elif issue["type"] == "MISSING_CLASS_NAME":
-                self.fix_class_name(issue)
+        fixers = {
+            "BROKEN_EXTENDS_PATH": self.fix_extends_path,
+            "WRONG_EXTENDS": self.fix_extends_statement,
+            "MISSING_CLASS_NAME": self.fix_class_name,
+        }
         
-        print(f"\n✅ Applied {len(self.fixes_applied)} fixes")
+        # file -> FileEdits (None when the script cannot be read as UTF-8)
+        plans: Dict[str, FileEdits] = {}
+        for issue in self.issues_found:
+            fixer = fixers.get(issue["type"])
+            if fixer is None:
+                continue
+            
+            if issue["file"] not in plans:
+                file_path = self.project_root / issue["file"]
+                try:
+                    plans[issue["file"]] = FileEdits(file_path, self.index.read_text(file_path))
+                except (OSError, UnicodeDecodeError) as e:
+                    print(f"  ❌ Failed to fix {issue['file']}: {e}")
+                    plans[issue["file"]] = None
+            edits = plans[issue["file"]]
+            if edits is None:
+                continue
+            
+            try:
+                fixer(issue, edits)
+            except EditConflict as e:
+                print(f"  ⚠️ Skipped fix in {issue['file']}: {e}")
+        
+        for relative_path, edits in plans.items():
+            if not edits or not edits.edits:
+                continue
+            if self.dry_run:
+                print(edits.diff(relative_path), end='')
+                continue
+            try:
+                edits.write()
+            except OSError as e:
+                print(f"  ❌ Failed to fix {relative_path}: {e}")
+                continue
+            self.index.refresh_file(edits.path)
+            for edit in edits.edits:
+                self.fixes_applied.append({"file": relative_path, "fix": edit.description})
+            print(f"  ✅ Fixed {relative_path}: {'; '.join(edit.description for edit in edits.edits)}")
+        
+        if self.dry_run:
+            planned = [edit for edits in plans.values() if edits for edit in edits.edits]
+            files = sum(1 for edits in plans.values() if edits and edits.edits)
+            print(f"\n🧪 Dry run: {len(planned)} fixes planned in {files} files, nothing written")
+        else:
+            print(f"\n✅ Applied {len(self.fixes_applied)} fixes")
         
         return self.fixes_applied
     
-    def fix_extends_path(self, issue: Dict):
+    def _extends_span(self, edits: FileEdits):
+        """(start, end, statement) of the script-level extends clause, without any trailing comment"""
+        if edits.outline.class_name == "UniversalBeing":
+            return None  # The root class cannot extend itself
+        for symbol in edits.outline.symbols:
+            if symbol.parent is None and symbol.kind in ('extends', 'class_name') and symbol.value:
+                statement = symbol.header
+                clause = re.search(r'\bextends\b', statement.code)
+                return statement.code_start + clause.start(), statement.code_start + len(statement.code), statement
+        return None
+    
+    def fix_extends_path(self, issue: Dict, edits: FileEdits):
         """Fix broken extends path"""
-        file_path = self.project_root / issue["file"]
-        
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
+        span = self._extends_span(edits)
+        if span:
             # Replace broken extends with simple class reference
-            old_extends = re.search(r'extends\s+(.+)', content)
-            if old_extends:
-                new_content = content.replace(old_extends.group(0), "extends UniversalBeing")
-                
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(new_content)
-                
-                self.fixes_applied.append({
-                    "file": issue["file"],
-                    "fix": f"Changed extends to 'UniversalBeing'"
-                })
-                print(f"  ✅ Fixed extends in {issue['file']}")
-        
-        except Exception as e:
-            print(f"  ❌ Failed to fix {issue['file']}: {e}")
+            edits.replace(span[0], span[1], "extends UniversalBeing", "Changed extends to 'UniversalBeing'")
     
-    def fix_extends_statement(self, issue: Dict):
+    def fix_extends_statement(self, issue: Dict, edits: FileEdits):
         """Fix wrong extends statement"""
-        file_path = self.project_root / issue["file"]
-        
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Replace extends line
-            extends_pattern = r'extends\s+.+'
-            new_content = re.sub(extends_pattern, "extends UniversalBeing", content, count=1)
-            
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(new_content)
-            
-            self.fixes_applied.append({
-                "file": issue["file"],
-                "fix": "Fixed extends statement to UniversalBeing"
-            })
-            print(f"  ✅ Fixed extends in {issue['file']}")
-        
-        except Exception as e:
-            print(f"  ❌ Failed to fix {issue['file']}: {e}")
+        span = self._extends_span(edits)
+        if span:
+            edits.replace(span[0], span[1], "extends UniversalBeing", "Fixed extends statement to UniversalBeing")
     
-    def fix_class_name(self, issue: Dict):
+    def fix_class_name(self, issue: Dict, edits: FileEdits):
         """Add missing class_name declaration"""
-        file_path = self.project_root / issue["file"]
-        
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Generate class name from filename
-            filename = Path(issue["file"]).stem
-            class_name = ''.join(word.capitalize() for word in filename.split('_'))
-            
-            # Insert class_name after extends line
-            extends_match = re.search(r'(extends\s+.+\n)', content)
-            if extends_match:
-                insert_pos = extends_match.end()
-                new_content = (content[:insert_pos] + 
-                             f"class_name {class_name}\n" + 
-                             content[insert_pos:])
-                
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(new_content)
-                
-                self.fixes_applied.append({
-                    "file": issue["file"],
-                    "fix": f"Added class_name {class_name}"
-                })
-                print(f"  ✅ Added class_name to {issue['file']}")
-        
-        except Exception as e:
-            print(f"  ❌ Failed to fix {issue['file']}: {e}")
+        # Generate class name from filename
+        filename = Path(issue["file"]).stem
+        class_name = ''.join(word.capitalize() for word in filename.split('_'))
+        
+        # Insert class_name after extends line
+        span = self._extends_span(edits)
+        if span:
+            edits.insert(span[2].end, f"\nclass_name {class_name}", f"Added class_name {class_name}")
     
     def generate_compliance_report(self):
         """Generate detailed compliance recovery report"""
@@ -346,21 +358,58 @@ class PentagonComplianceRecovery:
         print("Diagnosing compliance drop from 94.3% → 44.8%")
         print("=" * 60)
         
+        profile = self.profiler.phase
+        
         # Diagnose issues
-        self.diagnose_compliance_issues()
+        with profile('diagnose_compliance_issues'):
+            self.diagnose_compliance_issues()
         
         # Apply fixes
         if self.issues_found:
-            self.fix_compliance_issues()
+            with profile('fix_compliance_issues'):
+                self.fix_compliance_issues()
+        
+        # Generate report (a dry run leaves every file untouched)
+        if not self.dry_run:
+            with profile('generate_compliance_report'):
+                self.generate_compliance_report()
         
-        # Generate report
-        self.generate_compliance_report()
+        if self.profiler.enabled:
+            profile_path = self.project_root / "pentagon_recovery_profile.json"
+            self.profiler.save(profile_path)
+            self.profiler.print_summary()
+            print(f"⏱️ Profile saved to: {profile_path}")
+        
+        if self.dry_run:
+            print("\n🧪 Dry run complete - re-run without --dry-run to apply the fixes above")
+            return
         
         print("\n🏆 Pentagon compliance recovery complete!")
         print(f"   Run 'python validate_pentagon.py' to verify improvements")
 
 def main():
-    recovery = PentagonComplianceRecovery()
+    parser = argparse.ArgumentParser(description='Diagnose and fix Pentagon compliance issues')
+    parser.add_argument('--jobs', '-j', type=int, default=1, metavar='N',
+                        help='Parse scripts across N worker processes (0 = one per CPU core)')
+    parser.add_argument('--profile', action='store_true',
+                        help='Record per-phase time, files, bytes read and peak memory '
+                             'into pentagon_recovery_profile.json')
+    parser.add_argument('--profile-dump', metavar='DIR',
+                        help='Also write a cProfile .pstats dump per phase into DIR (implies --profile)')
+    parser.add_argument('--changed-since', metavar='REF',
+                        help='Only diagnose and fix scripts changed since a git ref (and scripts inheriting from them)')
+    parser.add_argument('--dry-run', action='store_true',
+                        help='Print the fixes as a unified diff without writing any file')
+    args = parser.parse_args()
+    
+    profiler = PhaseProfiler(args.profile, args.profile_dump, tool='PentagonComplianceRecovery')
+    recovery = PentagonComplianceRecovery(jobs=args.jobs, profiler=profiler, dry_run=args.dry_run)
+    if args.changed_since:
+        try:
+            recovery.only_files = changed_scripts(recovery.index, args.changed_since, args.jobs)
+        except GitScopeError as e:
+            parser.error(f"--changed-since: {e}")
+        print(f"🌿 {len(recovery.only_files)} script(s) changed since {args.changed_since} (subclasses included)")
     recovery.run_recovery()
 
 if __name__ == "__main__":
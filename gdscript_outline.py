@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+"""
+GDScript Outline Parser
+=======================
+Single-pass tokenizer/outliner for GDScript sources.
+
+One scan over the file finds every string literal, comment and bracket,
+which gives us:
+- a masked copy of the source (comment text and string contents blanked,
+  offsets and newlines preserved) that regexes can run on without ever
+  matching "func" inside a comment or a string
+- logical statements (bracketed and backslash-continued lines joined)
+- an outline of every func, inner class, signal, var, const, enum,
+  extends and class_name with line and character spans
+
+Function bodies are closed by indentation of real statements only, so
+blank lines, comments and multi-line strings never cut a body short and
+there is no upper limit on body length. Cost is linear in file size.
+
+    outline = parse_outline(content)
+    func = outline.function('pentagon_process')
+    for statement in outline.body(func):
+        print(statement.line, statement.code)
+"""
+
+import re
+from bisect import bisect_left, bisect_right
+from typing import List, Optional
+
+# Characters that change tokenizer state outside of strings and comments
+_TOKEN_RE = re.compile(r'"""|\'\'\'|["\'#()\[\]{}\n\\]')
+
+# Rest of a string literal after its opening quote(s); backslash-newline continues it
+_STRING_END_RES = {
+    '"': re.compile(r'(?:[^"\\\n]|\\[\s\S])*"'),
+    "'": re.compile(r"(?:[^'\\\n]|\\[\s\S])*'"),
+    '"""': re.compile(r'(?:[^\\]|\\.)*?"""', re.DOTALL),
+    "'''": re.compile(r"(?:[^\\]|\\.)*?'''", re.DOTALL),
+}
+
+_NON_NEWLINE_RE = re.compile(r'[^\n]')
+
+# Leading annotations and modifiers before a declaration keyword
+_PREFIX_RE = re.compile(r'(?:@\w+(?:\([^)]*\))?\s*|static\s+)*')
+
+_FUNC_RE = re.compile(r'func\s+(\w+)\s*\(')
+_CLASS_RE = re.compile(r'class\s+(\w+)')
+_SIGNAL_RE = re.compile(r'signal\s+(\w+)')
+_VAR_RE = re.compile(r'(var|const)\s+(\w+)')
+_ENUM_RE = re.compile(r'enum\s+(\w+)?')
+_EXTENDS_RE = re.compile(r'extends\s+(.+)', re.DOTALL)
+_CLASS_NAME_RE = re.compile(r'class_name\s+(\w+)(?:\s+extends\s+(.+))?', re.DOTALL)
+
+
+class Statement:
+    """One logical GDScript statement (continuation lines already joined)"""
+
+    __slots__ = ('start', 'end', 'line', 'end_line', 'indent', 'code', 'code_start')
+
+    def __init__(self, start: int, end: int, line: int, end_line: int, indent: int,
+                 code: str, code_start: int):
+        self.start = start
+        self.end = end
+        self.line = line
+        self.end_line = end_line
+        self.indent = indent
+        self.code = code  # masked source: no comments, string contents blanked
+        self.code_start = code_start  # offset of code[0] in the original source
+
+    def __repr__(self):
+        return f"Statement(line={self.line}, code={self.code!r})"
+
+
+class Symbol:
+    """A declaration in the outline with its line and character span"""
+
+    __slots__ = ('kind', 'name', 'value', 'line', 'end_line', 'start', 'end',
+                 'indent', 'parent', 'header')
+
+    def __init__(self, kind: str, name: str, statement: Statement, parent: Optional['Symbol'],
+                 value: Optional[str] = None):
+        self.kind = kind          # func, class, signal, var, const, enum, extends, class_name
+        self.name = name
+        self.value = value        # extends target, or the extends of a class_name line
+        self.line = statement.line
+        self.end_line = statement.end_line
+        self.start = statement.start
+        self.end = statement.end
+        self.indent = statement.indent
+        self.parent = parent      # enclosing inner class, or None at script level
+        self.header = statement   # declaring statement (e.g. the full func signature)
+
+    def __repr__(self):
+        return f"Symbol({self.kind} {self.name!r}, lines {self.line}-{self.end_line})"
+
+
+class Outline:
+    def __init__(self, content: str, code: str, statements: List[Statement], symbols: List[Symbol]):
+        self.content = content
+        self.code = code
+        self.statements = statements
+        self.symbols = symbols
+        self._statement_starts = [s.start for s in statements]
+
+    @property
+    def extends(self) -> Optional[str]:
+        """Script-level extends target as written (class name or quoted path)"""
+        for symbol in self.symbols:
+            if symbol.parent is None and symbol.kind in ('extends', 'class_name') and symbol.value:
+                return symbol.value
+        return None
+
+    @property
+    def class_name(self) -> Optional[str]:
+        for symbol in self.symbols:
+            if symbol.kind == 'class_name':
+                return symbol.name
+        return None
+
+    def functions(self, parent: Optional[Symbol] = None, any_level: bool = False) -> List[Symbol]:
+        """Functions declared directly in parent (script level by default)"""
+        return [s for s in self.symbols
+                if s.kind == 'func' and (any_level or s.parent is parent)]
+
+    def function(self, name: str, parent: Optional[Symbol] = None) -> Optional[Symbol]:
+        for symbol in self.symbols:
+            if symbol.kind == 'func' and symbol.name == name and symbol.parent is parent:
+                return symbol
+        return None
+
+    def body(self, symbol: Symbol) -> List[Statement]:
+        """Statements inside a func/class, excluding its header"""
+        first = bisect_right(self._statement_starts, symbol.header.start)
+        last = bisect_left(self._statement_starts, symbol.end)
+        return self.statements[first:last]
+
+    def in_code(self, offset: int) -> bool:
+        """True when offset is real code rather than comment text or string contents"""
+        return self.code[offset] == self.content[offset]
+
+
+def parse_outline(content: str) -> Outline:
+    """Tokenize and outline GDScript source in a single pass"""
+    masks, spans = _scan(content)
+    code = _apply_masks(content, masks)
+    statements = _build_statements(content, code, spans)
+    symbols = _build_symbols(content, statements)
+    return Outline(content, code, statements, symbols)
+
+
+def _scan(content: str):
+    """Find masked regions (comments, string contents) and logical statement spans"""
+    masks = []
+    spans = []
+    depth = 0
+    statement_start = 0
+    pos = 0
+    length = len(content)
+
+    while True:
+        match = _TOKEN_RE.search(content, pos)
+        if not match:
+            break
+        token = match.group()
+        index = match.start()
+
+        if token in _STRING_END_RES:
+            end_match = _STRING_END_RES[token].match(content, match.end())
+            if end_match:
+                end = end_match.end()
+                masks.append((match.end(), end - len(token)))
+            else:
+                # Unterminated literal: runs to end of line (or file for triple quotes)
+                end = length if len(token) == 3 else _line_end(content, index)
+                masks.append((match.end(), end))
+            pos = end
+        elif token == '#':
+            end = _line_end(content, index)
+            masks.append((index, end))
+            pos = end
+        elif token == '\\':
+            # Backslash-newline continues the statement on the next line
+            pos = index + 2 if content.startswith('\n', index + 1) else index + 1
+        elif token in '([{':
+            depth += 1
+            pos = index + 1
+        elif token in ')]}':
+            depth = max(0, depth - 1)
+            pos = index + 1
+        else:  # newline
+            if depth == 0:
+                spans.append((statement_start, index))
+                statement_start = index + 1
+            pos = index + 1
+
+    if statement_start < length:
+        spans.append((statement_start, length))
+
+    return masks, spans
+
+
+def _line_end(content: str, index: int) -> int:
+    end = content.find('\n', index)
+    return len(content) if end == -1 else end
+
+
+def _apply_masks(content: str, masks) -> str:
+    if not masks:
+        return content
+    pieces = []
+    pos = 0
+    for start, end in masks:
+        pieces.append(content[pos:start])
+        pieces.append(_NON_NEWLINE_RE.sub(' ', content[start:end]))
+        pos = end
+    pieces.append(content[pos:])
+    return ''.join(pieces)
+
+
+def _build_statements(content: str, code: str, spans) -> List[Statement]:
+    line_starts = [0] + [m.end() for m in re.finditer('\n', content)]
+    statements = []
+
+    for start, end in spans:
+        text = code[start:end]
+        stripped = text.strip()
+        if not stripped:
+            continue  # blank or comment-only line
+        indent = len(text) - len(text.lstrip(' \t'))
+        line = bisect_right(line_starts, start)
+        end_line = bisect_right(line_starts, max(start, end - 1))
+        code_start = start + len(text) - len(text.lstrip())
+        statements.append(Statement(start, end, line, end_line, indent, stripped, code_start))
+
+    return statements
+
+
+def _build_symbols(content: str, statements: List[Statement]) -> List[Symbol]:
+    symbols = []
+    stack: List[Symbol] = []  # open func/class blocks
+
+    for statement in statements:
+        while stack and statement.indent <= stack[-1].indent:
+            stack.pop()
+
+        # Every open block extends to cover this statement
+        for block in stack:
+            block.end = statement.end
+            block.end_line = statement.end_line
+
+        if any(block.kind == 'func' for block in stack):
+            continue  # locals and nested control flow are not part of the outline
+
+        parent = stack[-1] if stack else None
+        prefix = _PREFIX_RE.match(statement.code).end()
+        code = statement.code[prefix:]
+        base = statement.code_start + prefix
+        opens_block = statement.code.endswith(':')
+
+        match = _FUNC_RE.match(code)
+        if match:
+            symbol = Symbol('func', match.group(1), statement, parent)
+            symbols.append(symbol)
+            if opens_block:
+                stack.append(symbol)
+            continue
+
+        match = _CLASS_RE.match(code)
+        if match:
+            symbol = Symbol('class', match.group(1), statement, parent)
+            symbols.append(symbol)
+            if opens_block:
+                stack.append(symbol)
+            continue
+
+        match = _SIGNAL_RE.match(code)
+        if match:
+            symbols.append(Symbol('signal', match.group(1), statement, parent))
+            continue
+
+        match = _VAR_RE.match(code)
+        if match:
+            symbols.append(Symbol(match.group(1), match.group(2), statement, parent))
+            continue
+
+        match = _ENUM_RE.match(code)
+        if match:
+            symbols.append(Symbol('enum', match.group(1) or '', statement, parent))
+            continue
+
+        # extends targets are read from the original text so quoted paths survive masking
+        match = _CLASS_NAME_RE.match(code)
+        if match:
+            extends = None
+            if match.group(2):
+                extends = content[base + match.start(2):base + match.end(2)].strip()
+            symbols.append(Symbol('class_name', match.group(1), statement, parent, extends))
+            continue
+
+        match = _EXTENDS_RE.match(code)
+        if match:
+            extends = content[base + match.start(1):base + match.end(1)].strip()
+            symbols.append(Symbol('extends', '', statement, parent, extends))
+
+    return symbols
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Universal Being Git Change Scope
+================================
+Limits a tool run to the scripts touched since a git ref, for pre-commit
+hooks and pull-request pipelines:
+
+    scope = changed_scripts(index, 'origin/main')
+    PentagonValidator(root, index=index, only_files=scope).validate_project()
+
+The changed set is everything `git diff --name-only <ref>` reports
+(committed, staged and unstaged edits, deletions included) plus untracked
+files. It is then widened through the class hierarchy: when a base class
+changes, every script inheriting from it is re-checked as well, including
+scripts that extended a class_name the change renamed or removed. The old
+class names are read from the scripts as they were at the ref (git
+cat-file), so a fresh checkout without .ub_cache/ gets the same scope.
+"""
+
+import subprocess
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+from gdscript_outline import parse_outline
+from script_facts import decode_source
+
+
+class GitScopeError(Exception):
+    """git is missing, the project is not a repository, or the ref is unknown"""
+
+
+def _git(project_root: Path, *args) -> List[str]:
+    try:
+        completed = subprocess.run(['git', '-C', str(project_root), *args],
+                                   capture_output=True, text=True, encoding='utf-8')
+    except OSError as e:
+        raise GitScopeError(f"Cannot run git: {e}")
+    if completed.returncode != 0:
+        raise GitScopeError(completed.stderr.strip() or f"git {' '.join(args)} failed")
+    return [line for line in completed.stdout.split('\0') if line]
+
+
+def git_changed_paths(project_root, ref: str) -> List[Path]:
+    """Absolute paths changed since ref (existing or deleted) plus untracked files"""
+    project_root = Path(project_root).resolve()
+    # --relative: paths relative to (and limited to) the project, even inside a bigger repository
+    changed = _git(project_root, 'diff', '--name-only', '--relative', '-z', ref, '--')
+    untracked = _git(project_root, 'ls-files', '--others', '--exclude-standard', '-z')
+    return [project_root / path for path in dict.fromkeys(changed + untracked)]
+
+
+def git_file_contents(project_root, ref: str, paths: List[str]) -> Dict[str, Optional[bytes]]:
+    """Contents of project-relative paths as of ref (None where the file did not exist)"""
+    project_root = Path(project_root).resolve()
+    if not paths:
+        return {}
+    prefix = ''.join(_git(project_root, 'rev-parse', '--show-prefix')).strip()
+    request = ''.join(f"{ref}:{prefix}{path}\n" for path in paths).encode('utf-8')
+    try:
+        completed = subprocess.run(['git', '-C', str(project_root), 'cat-file', '--batch'],
+                                   input=request, capture_output=True)
+    except OSError as e:
+        raise GitScopeError(f"Cannot run git: {e}")
+    if completed.returncode != 0:
+        raise GitScopeError(completed.stderr.decode('utf-8', 'replace').strip() or "git cat-file failed")
+
+    # One "<oid> <type> <size>\n<content>\n" or "<name> missing\n" per request line
+    contents = {}
+    output = completed.stdout
+    pos = 0
+    for path in paths:
+        end = output.index(b'\n', pos)
+        header = output[pos:end].split()
+        pos = end + 1
+        if len(header) == 3 and header[1] == b'blob':
+            size = int(header[2])
+            contents[path] = output[pos:pos + size]
+            pos += size + 1
+        else:
+            contents[path] = None
+    return contents
+
+
+def changed_scripts(index, ref: str, jobs: int = 1) -> Set[Path]:
+    """Scripts changed since ref, plus every script inheriting from one of them.
+
+    Each changed script's class_name at ref is read from git, so subclasses
+    of a renamed or deleted class are found too. Stale facts are then parsed
+    across `jobs` workers to build the class hierarchy.
+    """
+    root = Path(index.root)
+    resolved_root = root.resolve()
+    changed = [root / path.relative_to(resolved_root)
+               for path in git_changed_paths(root, ref) if path.suffix == '.gd']
+
+    targets = set()
+    relative = {path: path.relative_to(root).as_posix() for path in changed}
+    before = git_file_contents(root, ref, list(relative.values()))
+    for path, rel in relative.items():
+        targets.add('res://' + rel)
+        text = decode_source(before[rel])['text'] if before.get(rel) is not None else None
+        class_name = parse_outline(text).class_name if text is not None else None
+        if class_name:
+            targets.add(class_name)  # As it was at ref
+
+    index.prefetch_facts(index.scripts(), jobs)
+    hierarchy = index.class_hierarchy
+    scope = {path for path in changed if path.is_file()}
+    scope.update(root / res_path[len('res://'):] for res_path in hierarchy.subclasses(targets))
+    return scope
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Universal Being Streaming JSON Writer
+=====================================
+Writes a top-level JSON object one section at a time, as each analysis
+phase finishes, instead of json.dump()-ing one big dict at the end.
+
+    writer = JsonSectionWriter('architecture_analysis.json', compact=False)
+    writer.write_section('timestamp', '2025-06-06 12:00:00')
+    writer.write_section('pentagon_compliance', compliance)
+    writer.close()
+
+- Sections are encoded incrementally (JSONEncoder.iterencode), so no
+  full-document string is ever built.
+- After every section the file is closed off with '}' and flushed, so it
+  is valid JSON at all times: if a later phase crashes, the finished
+  sections are still readable.
+- compact=True drops indentation and spaces after separators.
+
+Output with compact=False matches json.dump(obj, f, indent=2).
+"""
+
+import json
+from pathlib import Path
+
+
+class JsonSectionWriter:
+    def __init__(self, path, compact: bool = False, default=str):
+        self.path = Path(path)
+        self.compact = compact
+        if compact:
+            self._encoder = json.JSONEncoder(separators=(',', ':'), default=default)
+        else:
+            self._encoder = json.JSONEncoder(indent=2, default=default)
+        self.sections = []
+
+        self._file = open(self.path, 'wb')
+        self._file.write(b'{')
+        self._end = self._file.tell()  # Where the closing brace goes
+        self._close_object()
+
+    def write_section(self, key: str, value):
+        """Append one top-level key; the file stays valid JSON afterwards"""
+        if self._file is None:
+            raise ValueError(f"{self.path} is already closed")
+
+        f = self._file
+        f.seek(self._end)
+        f.truncate()
+
+        separator = ',' if self.sections else ''
+        if self.compact:
+            f.write(f"{separator}{json.dumps(key)}:".encode('utf-8'))
+        else:
+            f.write(f"{separator}\n  {json.dumps(key)}: ".encode('utf-8'))
+
+        for chunk in self._encoder.iterencode(value):
+            if not self.compact:
+                # Nest one level deeper; raw newlines only occur as indentation (strings escape them)
+                chunk = chunk.replace('\n', '\n  ')
+            f.write(chunk.encode('utf-8'))
+
+        self.sections.append(key)
+        self._end = f.tell()
+        self._close_object()
+
+    def _close_object(self):
+        if self.compact or not self.sections:
+            self._file.write(b'}')
+        else:
+            self._file.write(b'\n}')
+        self._file.flush()
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+"""
+Universal Being Metrics History
+===============================
+Keeps every architecture analysis run in a local SQLite store, so trends
+and regressions come from indexed queries instead of re-parsing archived
+architecture_analysis.json reports.
+
+    history = MetricsHistory(project_root)
+    history.record_run(analysis, seconds=12.3)
+    history.trend('compliance_percentage', directory='beings')
+
+Tables:
+- runs: one row per analysis (organization score, compliance, scripts,
+  conscious beings, Akashic/autoload health, wall time, peak RSS)
+- directory_metrics: per top-level directory compliance, script count, size_kb
+- consciousness_counts: consciousness level distribution per run
+- phase_timings: per-phase seconds when the run was profiled
+
+Usage:
+    python metrics_history.py trend --metric organization_score
+    python metrics_history.py trend --metric compliance_percentage --directory beings
+    python metrics_history.py trend --level 3
+    python metrics_history.py regressions --tolerance 0.2
+"""
+
+import argparse
+import sqlite3
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from project_root import find_project_root
+
+HISTORY_FILE = 'ub_history.sqlite'
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    project TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    organization_score INTEGER,
+    compliance_percentage REAL,
+    total_scripts INTEGER,
+    compliant_scripts INTEGER,
+    conscious_beings INTEGER,
+    akashic_health TEXT,
+    autoload_health TEXT,
+    seconds REAL,
+    peak_rss_mb REAL
+);
+CREATE TABLE IF NOT EXISTS directory_metrics (
+    run_id INTEGER NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+    directory TEXT NOT NULL,
+    total INTEGER,
+    compliant INTEGER,
+    compliance_percentage REAL,
+    script_count INTEGER,
+    size_kb REAL,
+    PRIMARY KEY (run_id, directory)
+);
+CREATE TABLE IF NOT EXISTS consciousness_counts (
+    run_id INTEGER NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+    level INTEGER NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (run_id, level)
+);
+CREATE TABLE IF NOT EXISTS phase_timings (
+    run_id INTEGER NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+    phase TEXT NOT NULL,
+    seconds REAL,
+    PRIMARY KEY (run_id, phase)
+);
+CREATE INDEX IF NOT EXISTS runs_by_project_time ON runs(project, timestamp);
+CREATE INDEX IF NOT EXISTS directory_metrics_by_directory ON directory_metrics(directory, run_id);
+CREATE INDEX IF NOT EXISTS consciousness_counts_by_level ON consciousness_counts(level, run_id);
+CREATE INDEX IF NOT EXISTS phase_timings_by_phase ON phase_timings(phase, run_id);
+"""
+
+# Metrics `trend` can follow: run-level columns, and per-directory ones with --directory
+RUN_METRICS = ['organization_score', 'compliance_percentage', 'total_scripts', 'compliant_scripts',
+               'conscious_beings', 'seconds', 'peak_rss_mb']
+DIRECTORY_METRICS = ['compliance_percentage', 'total', 'compliant', 'script_count', 'size_kb']
+
+# Health strings ranked worst to best, by their leading word
+HEALTH_RANK = {'Poor': 0, 'No': 0, 'Good': 1, 'Excellent': 2}
+
+
+def _health_rank(health: Optional[str]) -> Optional[int]:
+    if not health:
+        return None
+    return HEALTH_RANK.get(health.split()[0])
+
+
+class MetricsHistory:
+    def __init__(self, project_root, path=None):
+        self.project_root = Path(project_root)
+        self.project = str(self.project_root.resolve())
+        self.path = Path(path) if path else self.project_root / HISTORY_FILE
+        self.conn = sqlite3.connect(self.path)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA foreign_keys = ON")
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def record_run(self, analysis: Dict, seconds: float = None, phases: List[Dict] = None,
+                   peak_rss_mb: float = None) -> int:
+        """Append one ArchitectureAnalyzer run; returns its run id"""
+        structure = analysis.get("project_structure", {})
+        compliance = analysis.get("pentagon_compliance", {})
+        consciousness = analysis.get("consciousness_levels", {})
+
+        with self.conn:
+            cursor = self.conn.execute(
+                "INSERT INTO runs (project, timestamp, organization_score, compliance_percentage, "
+                "total_scripts, compliant_scripts, conscious_beings, akashic_health, autoload_health, "
+                "seconds, peak_rss_mb) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (self.project, analysis["timestamp"],
+                 analysis.get("architecture_health", {}).get("structure", {}).get("organization_score"),
+                 compliance.get("compliance_percentage"),
+                 compliance.get("total_scripts"),
+                 compliance.get("compliant_scripts"),
+                 consciousness.get("total_conscious_beings"),
+                 analysis.get("akashic_integration", {}).get("integration_health"),
+                 analysis.get("autoload_analysis", {}).get("autoload_health"),
+                 seconds, peak_rss_mb))
+            run_id = cursor.lastrowid
+
+            # Compliance is grouped by top-level directory; structure only covers the main folders
+            by_directory = compliance.get("compliance_by_directory", {})
+            rows = []
+            for directory in sorted(set(by_directory) | set(structure)):
+                counts = by_directory.get(directory, {})
+                folder = structure.get(directory, {})
+                total = counts.get("total")
+                compliant = counts.get("compliant")
+                percentage = round(compliant / total * 100, 1) if total else None
+                rows.append((run_id, directory, total, compliant, percentage,
+                             folder.get("script_count"), folder.get("size_kb")))
+            self.conn.executemany(
+                "INSERT INTO directory_metrics VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+
+            self.conn.executemany(
+                "INSERT INTO consciousness_counts VALUES (?, ?, ?)",
+                [(run_id, int(level), count)
+                 for level, count in consciousness.get("level_distribution", {}).items()])
+
+            self.conn.executemany(
+                "INSERT INTO phase_timings VALUES (?, ?, ?)",
+                [(run_id, phase["phase"], phase["seconds"]) for phase in phases or []])
+        return run_id
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def trend(self, metric: str, directory: str = None, limit: int = 20) -> List[sqlite3.Row]:
+        """(timestamp, value) for the latest `limit` runs, oldest first"""
+        if directory:
+            if metric not in DIRECTORY_METRICS:
+                raise ValueError(f"Per-directory metric must be one of: {', '.join(DIRECTORY_METRICS)}")
+            sql = (f"SELECT runs.id, runs.timestamp, d.{metric} AS value FROM directory_metrics d "
+                   f"JOIN runs ON runs.id = d.run_id "
+                   f"WHERE d.directory = ? AND runs.project = ? ORDER BY runs.id DESC LIMIT ?")
+            params = (directory, self.project, limit)
+        else:
+            if metric not in RUN_METRICS:
+                raise ValueError(f"Metric must be one of: {', '.join(RUN_METRICS)}")
+            sql = f"SELECT id, timestamp, {metric} AS value FROM runs WHERE project = ? ORDER BY id DESC LIMIT ?"
+            params = (self.project, limit)
+        return list(reversed(self.conn.execute(sql, params).fetchall()))
+
+    def level_trend(self, level: int, limit: int = 20) -> List[sqlite3.Row]:
+        """Beings at one consciousness level for the latest `limit` runs, oldest first"""
+        rows = self.conn.execute(
+            "SELECT runs.id, runs.timestamp, COALESCE(c.count, 0) AS value FROM runs "
+            "LEFT JOIN consciousness_counts c ON c.run_id = runs.id AND c.level = ? "
+            "WHERE runs.project = ? ORDER BY runs.id DESC LIMIT ?",
+            (level, self.project, limit)).fetchall()
+        return list(reversed(rows))
+
+    def latest_runs(self, count: int = 2) -> List[sqlite3.Row]:
+        return self.conn.execute(
+            "SELECT * FROM runs WHERE project = ? ORDER BY id DESC LIMIT ?",
+            (self.project, count)).fetchall()
+
+    def regressions(self, tolerance: float = 0.25, against: int = 1) -> List[str]:
+        """Describe what got worse in the latest run versus the run `against` runs before it"""
+        runs = self.latest_runs(against + 1)
+        if len(runs) < against + 1:
+            return []
+        new, old = runs[0], runs[against]
+        found = []
+
+        for metric in ('organization_score', 'compliance_percentage', 'conscious_beings'):
+            if old[metric] is not None and new[metric] is not None and new[metric] < old[metric]:
+                found.append(f"{metric}: {old[metric]} -> {new[metric]}")
+
+        for health in ('akashic_health', 'autoload_health'):
+            old_rank, new_rank = _health_rank(old[health]), _health_rank(new[health])
+            if old_rank is not None and new_rank is not None and new_rank < old_rank:
+                found.append(f"{health}: {old[health]} -> {new[health]}")
+
+        if old['seconds'] and new['seconds'] and new['seconds'] > old['seconds'] * (1 + tolerance):
+            found.append(f"seconds: {old['seconds']:.2f} -> {new['seconds']:.2f} "
+                         f"(+{(new['seconds'] / old['seconds'] - 1) * 100:.0f}%)")
+
+        rows = self.conn.execute(
+            "SELECT new.directory, old.compliance_percentage AS before, new.compliance_percentage AS after "
+            "FROM directory_metrics new JOIN directory_metrics old "
+            "ON old.directory = new.directory AND old.run_id = ? "
+            "WHERE new.run_id = ? AND new.compliance_percentage < old.compliance_percentage "
+            "ORDER BY new.directory",
+            (old['id'], new['id'])).fetchall()
+        for row in rows:
+            found.append(f"{row['directory']} compliance: {row['before']}% -> {row['after']}%")
+
+        rows = self.conn.execute(
+            "SELECT new.phase, old.seconds AS before, new.seconds AS after "
+            "FROM phase_timings new JOIN phase_timings old ON old.phase = new.phase AND old.run_id = ? "
+            "WHERE new.run_id = ? AND new.seconds > old.seconds * ? AND new.seconds - old.seconds > 0.05 "
+            "ORDER BY new.phase",
+            (old['id'], new['id'], 1 + tolerance)).fetchall()
+        for row in rows:
+            found.append(f"phase {row['phase']}: {row['before']:.3f}s -> {row['after']:.3f}s")
+
+        return found
+
+
+def print_trend(rows: List[sqlite3.Row], label: str):
+    if not rows:
+        print("No runs recorded yet - run analyze_project_architecture.py first")
+        return
+
+    print(f"📈 {label} over the last {len(rows)} run(s)")
+    previous = None
+    for row in rows:
+        value = row['value']
+        change = ""
+        if previous is not None and value is not None:
+            difference = value - previous
+            change = f" ({difference:+g})" if difference else ""
+        print(f"   #{row['id']:<5} {row['timestamp']}  {'n/a' if value is None else value}{change}")
+        if value is not None:
+            previous = value
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Query the architecture metrics history')
+    parser.add_argument('--root', metavar='PATH', help='Godot project (default: the one holding these tools)')
+    parser.add_argument('--db', metavar='PATH', help=f'History database (default: <project>/{HISTORY_FILE})')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    trend = commands.add_parser('trend', help='Show one metric across recent runs')
+    trend.add_argument('--metric', default='compliance_percentage',
+                       help=f"Run metric ({', '.join(RUN_METRICS)}) or, with --directory, "
+                            f"a directory metric ({', '.join(DIRECTORY_METRICS)})")
+    trend.add_argument('--directory', help='Follow one top-level directory, e.g. beings')
+    trend.add_argument('--level', type=int, help='Follow the number of beings at one consciousness level')
+    trend.add_argument('--limit', type=int, default=20, help='Number of runs to show (default: 20)')
+
+    regressions = commands.add_parser('regressions', help='What got worse in the latest run (exit 1 if anything)')
+    regressions.add_argument('--against', type=int, default=1, metavar='N',
+                             help='Compare with the run N runs before the latest (default: 1)')
+    regressions.add_argument('--tolerance', type=float, default=0.25,
+                             help='Allowed slowdown before timings count (default: 0.25 = 25%%)')
+    args = parser.parse_args(argv)
+
+    history = MetricsHistory(find_project_root(args.root), args.db)
+    try:
+        if args.command == 'trend':
+            if args.level is not None:
+                print_trend(history.level_trend(args.level, args.limit), f"Consciousness level {args.level} beings")
+            else:
+                try:
+                    rows = history.trend(args.metric, args.directory, args.limit)
+                except ValueError as e:
+                    parser.error(str(e))
+                label = f"{args.directory}/ {args.metric}" if args.directory else args.metric
+                print_trend(rows, label)
+            return 0
+
+        found = history.regressions(args.tolerance, args.against)
+        if not found:
+            print("✅ No regressions in the latest run")
+            return 0
+        print(f"🚨 {len(found)} regression(s) in the latest run:")
+        for regression in found:
+            print(f"   - {regression}")
+        return 1
+    finally:
+        history.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
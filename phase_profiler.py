@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Universal Being Phase Profiler
+==============================
+Measures where a tool run spends its time, phase by phase.
+
+    profiler = PhaseProfiler(enabled=args.profile, dump_dir=args.profile_dump)
+    profiler.attach(index)
+    with profiler.phase('analyze_scripts'):
+        self.analyze_scripts()
+    analysis['profile'] = profiler.report()
+
+For every phase it records:
+- wall time
+- files processed (fact lookups and text reads, cached or not)
+- files and bytes actually read from disk
+- peak traced Python memory (tracemalloc) and process peak RSS
+
+With dump_dir set, each phase also gets a cProfile dump
+(<tool>.<phase>.pstats) that can be opened with pstats or snakeviz.
+
+A disabled profiler costs nothing: phase() just yields. tracemalloc is
+only started when profiling, since it slows allocation-heavy code down.
+"""
+
+import cProfile
+import json
+import time
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, List, Optional
+
+_MB = 1024 * 1024
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Peak resident set size of this process in MB (None where unsupported)"""
+    # VmHWM is per process image; ru_maxrss on Linux keeps the parent's peak across fork+exec
+    try:
+        with open('/proc/self/status', 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return round(int(line.split()[1]) / 1024, 1)
+    except OSError:
+        pass
+
+    try:
+        import resource
+        import sys
+    except ImportError:
+        return None  # Windows
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return round(peak / (_MB if sys.platform == 'darwin' else 1024), 1)
+
+
+class PhaseProfiler:
+    def __init__(self, enabled: bool = False, dump_dir: Optional[str] = None, tool: str = 'tool'):
+        self.enabled = enabled or dump_dir is not None
+        self.dump_dir = Path(dump_dir) if dump_dir else None
+        self.tool = tool
+        self.index = None
+        self.phases: List[Dict] = []
+        self._started = time.perf_counter()
+
+        if self.enabled and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def attach(self, index):
+        """Count file and byte reads through this ProjectIndex"""
+        self.index = index
+
+    @contextmanager
+    def phase(self, name: str):
+        """Measure the enclosed block as one phase (phases must not nest)"""
+        if not self.enabled:
+            yield
+            return
+
+        io_before = self._io_stats()
+        traced_before = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+
+        profile = cProfile.Profile() if self.dump_dir else None
+        if profile:
+            profile.enable()
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - started
+            if profile:
+                profile.disable()
+            traced_after, traced_peak = tracemalloc.get_traced_memory()
+            io_after = self._io_stats()
+
+            record = {
+                'phase': name,
+                'tool': self.tool,
+                'seconds': round(seconds, 4),
+                'files_processed': io_after['files_processed'] - io_before['files_processed'],
+                'files_read': io_after['files_read'] - io_before['files_read'],
+                'bytes_read': io_after['bytes_read'] - io_before['bytes_read'],
+                'allocated_mb': round((traced_after - traced_before) / _MB, 2),
+                'peak_traced_mb': round(traced_peak / _MB, 2),
+                'peak_rss_mb': peak_rss_mb(),
+            }
+            if profile:
+                record['pstats'] = str(self._dump(profile, name))
+            self.phases.append(record)
+
+    def _io_stats(self) -> Dict[str, int]:
+        if self.index is None:
+            return {'files_processed': 0, 'files_read': 0, 'bytes_read': 0}
+        return self.index.io_stats()
+
+    def _dump(self, profile: cProfile.Profile, name: str) -> Path:
+        self.dump_dir.mkdir(parents=True, exist_ok=True)
+        path = self.dump_dir / f"{self.tool}.{name}.pstats"
+        profile.dump_stats(str(path))
+        return path
+
+    def report(self) -> Dict:
+        """Profile section for a tool's JSON output"""
+        return {
+            'tool': self.tool,
+            'total_seconds': round(time.perf_counter() - self._started, 4),
+            'peak_rss_mb': peak_rss_mb(),
+            'phases': list(self.phases),
+        }
+
+    def save(self, path):
+        """Write the profile on its own, for tools without a JSON output"""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.report(), f, indent=2)
+
+    def print_summary(self):
+        if not self.enabled:
+            return
+
+        print("\n⏱️ PHASE PROFILE")
+        print(f"   {'phase':32} {'seconds':>8} {'files':>7} {'read':>7} {'KB read':>9} {'peak MB':>8}")
+        for p in self.phases:
+            print(f"   {p['phase']:32} {p['seconds']:8.3f} {p['files_processed']:7} {p['files_read']:7} "
+                  f"{p['bytes_read'] / 1024:9.1f} {p['peak_traced_mb']:8.1f}")
+        rss = peak_rss_mb()
+        print(f"   total {time.perf_counter() - self._started:.3f}s" +
+              (f", peak RSS {rss:.1f} MB" if rss is not None else ""))
+        if self.dump_dir:
+            print(f"   cProfile dumps: {self.dump_dir}/{self.tool}.*.pstats")
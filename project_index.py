@@ -0,0 +1,397 @@
+#!/usr/bin/env python3
+"""
+Universal Being Project Index
+=============================
+Walks the project tree ONCE and shares the result with every tool.
+
+The analyzers and validators used to run their own rglob() over the
+whole project and reopen every script per phase. A ProjectIndex is built
+once per run and handed to each tool:
+
+    index = ProjectIndex(project_root)
+    PentagonValidator(project_root, index=index).validate_project()
+    ArchitectureAnalyzer(project_root, index=index).run_analysis()
+
+Files are listed in the same depth-first order rglob() produced, and file
+contents are read lazily and cached, so a file is read at most once no
+matter how many tools or phases look at it. Per-script facts come from the
+persistent FactCache (see script_facts.py), so unchanged scripts are not
+even opened on later runs.
+"""
+
+import os
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from class_hierarchy import ClassHierarchy
+from script_facts import FactCache
+
+# Directories never worth walking (VCS data, Godot import cache, bytecode)
+SKIP_DIRS = {'.git', '.godot', '__pycache__'}
+
+
+class ProjectIndex:
+    def __init__(self, project_root, use_cache: bool = True):
+        self.root = Path(project_root)
+        self.all_files: List[Path] = []
+        self.all_dirs: List[Path] = []
+        self._by_suffix: Dict[str, List[Path]] = {}
+        self._text_cache: Dict[tuple, str] = {}
+        self._scene_info: Dict[Path, Optional[Dict]] = {}
+        self._project_settings = None
+        self._class_hierarchy = None
+        self._call_graph = None
+        self._resource_graph = None
+        self._uid_index = None
+        # Per-run stat and directory listing caches (see stat / list_dir)
+        self._stats: Dict[str, os.stat_result] = {}
+        self._listings: Dict[str, List[Tuple[str, bool, bool]]] = {}
+        self.fact_cache = FactCache(self.root, persistent=use_cache)
+
+        # I/O counters (see io_stats / phase_profiler.py)
+        self.files_processed = 0
+        self.files_read = 0
+        self.bytes_read = 0
+
+        self._walk()
+
+    def _walk(self):
+        """Walk the project tree once, recording every file in rglob order"""
+        for dirpath, dirnames, filenames in os.walk(self.root):
+            dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS]
+            base = Path(dirpath)
+            self.all_dirs.extend(base / d for d in dirnames)
+            for filename in filenames:
+                path = base / filename
+                self.all_files.append(path)
+                self._by_suffix.setdefault(path.suffix, []).append(path)
+
+    # ------------------------------------------------------------------
+    # File listings
+    # ------------------------------------------------------------------
+
+    def files(self, suffix: str, directory: Optional[str] = None) -> List[Path]:
+        """Files ending with suffix (e.g. '.gd' or '.ub.zip'), optionally under a directory"""
+        if suffix.count('.') == 1:
+            candidates = self._by_suffix.get(suffix, [])
+        else:
+            candidates = [p for p in self.all_files if p.name.endswith(suffix)]
+
+        return self._under(candidates, directory)
+
+    def dirs(self, suffix: str, directory: Optional[str] = None) -> List[Path]:
+        """Directories whose name ends with suffix (unpacked .ub.zip packages live as folders)"""
+        return self._under([p for p in self.all_dirs if p.name.endswith(suffix)], directory)
+
+    def _under(self, paths: List[Path], directory: Optional[str]) -> List[Path]:
+        if directory is None:
+            return list(paths)
+
+        prefix = str(self.root / directory) + os.sep
+        return [p for p in paths if str(p).startswith(prefix)]
+
+    def scripts(self, directory: Optional[str] = None) -> List[Path]:
+        """All .gd scripts, optionally restricted to a project subdirectory"""
+        return self.files('.gd', directory)
+
+    def scenes(self, directory: Optional[str] = None) -> List[Path]:
+        """All .tscn scenes, optionally restricted to a project subdirectory"""
+        return self.files('.tscn', directory)
+
+    def resources(self, directory: Optional[str] = None) -> List[Path]:
+        """All .tres resources, optionally restricted to a project subdirectory"""
+        return self.files('.tres', directory)
+
+    def refresh_file(self, path: Path):
+        """Bring one file's listing, stat and cached text up to date after it changed on disk"""
+        path = Path(path)
+        for key in [k for k in self._text_cache if k[0] == path]:
+            del self._text_cache[key]
+        self._scene_info.pop(path, None)
+        self._stats.pop(str(path), None)
+        self._listings.pop(str(path.parent), None)
+        if path.suffix == '.gd':
+            self._class_hierarchy = None  # class_name / extends may have changed
+            self._call_graph = None
+        if path.suffix in ('.gd', '.tscn', '.tres'):
+            self._resource_graph = None  # load edges may have changed
+
+        bucket = self._by_suffix.setdefault(path.suffix, [])
+        listed = path in bucket
+        if path.is_file() and not listed:
+            self.all_files.append(path)
+            bucket.append(path)
+        elif not path.is_file() and listed:
+            self.all_files.remove(path)
+            bucket.remove(path)
+
+        if self._uid_index is not None:
+            self._uid_index.refresh([path])  # The file itself and its .uid/.import sidecars
+
+    # ------------------------------------------------------------------
+    # Directory scans and stat results (cached for the whole run)
+    # ------------------------------------------------------------------
+
+    def stat(self, path) -> Optional[os.stat_result]:
+        """os.stat() of a file, taken at most once per run (None if it cannot be stat'ed)"""
+        key = str(path)
+        result = self._stats.get(key)
+        if result is None:
+            try:
+                result = os.stat(key)
+            except OSError:
+                return None
+            self._stats[key] = result
+        return result
+
+    def list_dir(self, directory, stat_suffix: Optional[str] = None) -> List[Tuple[str, bool, bool]]:
+        """(name, is_dir, is_file) for each entry of a directory, scanned at most once per run.
+
+        Files ending with stat_suffix get their stat result cached from the
+        scan's DirEntry, so a following stat() needs no system call.
+        Raises OSError when the directory cannot be listed.
+        """
+        key = str(directory)
+        entries = self._listings.get(key)
+        if entries is None:
+            entries = self._scan_dir(key, stat_suffix)
+        return entries
+
+    def _scan_dir(self, directory: str, stat_suffix: Optional[str]) -> List[Tuple[str, bool, bool]]:
+        entries = []
+        with os.scandir(directory) as it:
+            for entry in it:
+                is_file = entry.is_file()
+                entries.append((entry.name, entry.is_dir(), is_file))
+                if is_file and stat_suffix and entry.name.endswith(stat_suffix) and entry.path not in self._stats:
+                    try:
+                        self._stats[entry.path] = entry.stat()
+                    except OSError:
+                        pass
+        self._listings[directory] = entries
+        return entries
+
+    def prefetch_tree(self, directory, stat_suffix: Optional[str] = None, jobs: int = 1):
+        """Scan a whole tree across `jobs` threads, filling the listing and stat caches.
+
+        Meant for wide trees (akashic_library/): scandir and stat release
+        the GIL, so directories are listed concurrently. Hidden directories
+        are not entered, matching the analyzers' own recursion.
+        """
+        if jobs == 0:
+            jobs = os.cpu_count() or 1
+        if jobs <= 1 or not os.path.isdir(directory):
+            return
+
+        # Imported here: serial runs never need the thread pool machinery
+        from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+        def scan(path):
+            try:
+                return path, self.list_dir(path, stat_suffix)
+            except OSError:
+                return path, []  # The serial pass reports the error
+
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            pending = {pool.submit(scan, str(directory))}
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    path, entries = future.result()
+                    for name, is_dir, _is_file in entries:
+                        if is_dir and not name.startswith('.'):
+                            pending.add(pool.submit(scan, os.path.join(path, name)))
+
+    def relative(self, path: Path) -> str:
+        """Project-relative path string for a file in the index"""
+        return str(path.relative_to(self.root))
+
+    # ------------------------------------------------------------------
+    # File contents
+    # ------------------------------------------------------------------
+
+    def read_text(self, path: Path, encoding: str = 'utf-8') -> str:
+        """Read a file once and serve later requests from memory.
+
+        Errors (missing file, bad encoding) propagate unchanged so each tool
+        keeps its own error handling.
+        """
+        self.files_processed += 1
+        key = (path, encoding)
+        text = self._text_cache.get(key)
+        if text is None:
+            with open(path, 'rb') as f:
+                data = f.read()
+            self.files_read += 1
+            self.bytes_read += len(data)
+            # Same result as open(path, 'r'): decode, then universal newlines
+            text = data.decode(encoding).replace('\r\n', '\n').replace('\r', '\n')
+            self._text_cache[key] = text
+        return text
+
+    def scene_info(self, path: Path) -> Optional[Dict]:
+        """Summary of a .tscn/.tres from one streaming parse per run (None if unreadable).
+
+        See scene_parser.summarize_scene for the keys.
+        """
+        self.files_processed += 1
+        path = Path(path)
+        if path not in self._scene_info:
+            from scene_parser import summarize_scene
+            try:
+                self._scene_info[path] = summarize_scene(path)
+            except (OSError, UnicodeDecodeError):
+                self._scene_info[path] = None
+            else:
+                stat = self.stat(path)
+                self.files_read += 1
+                self.bytes_read += stat.st_size if stat else 0
+        return self._scene_info[path]
+
+    def facts(self, path: Path) -> Dict:
+        """Cached Pentagon facts for a script (see script_facts.extract_facts)"""
+        self.files_processed += 1
+        return self.fact_cache.get(path, self.stat(path))
+
+    def fingerprint(self, path: Path) -> Optional[Dict]:
+        """mtime_ns, size and sha1 recorded when the script's facts were last fetched"""
+        entry = self.fact_cache.entries.get(self.relative(path))
+        if entry is None:
+            return None
+        return {'mtime_ns': entry['mtime_ns'], 'size': entry['size'], 'sha1': entry['sha1']}
+
+    @property
+    def class_hierarchy(self) -> ClassHierarchy:
+        """class_name/extends index over every script, built on first use"""
+        if self._class_hierarchy is None:
+            self._class_hierarchy = ClassHierarchy(self)
+        return self._class_hierarchy
+
+    @property
+    def call_graph(self):
+        """Resolved function -> caller index over every script, built on first use"""
+        if self._call_graph is None:
+            from call_graph import CallGraph
+            self._call_graph = CallGraph(self)
+        return self._call_graph
+
+    @property
+    def resource_graph(self):
+        """Load dependency graph over scenes, resources and scripts, built on first use"""
+        if self._resource_graph is None:
+            from resource_graph import ResourceGraph
+            self._resource_graph = ResourceGraph(self)
+        return self._resource_graph
+
+    @property
+    def uid_index(self):
+        """uid:// <-> res:// index from .uid/.import sidecars and scene headers, built on first use"""
+        if self._uid_index is None:
+            from uid_index import UidIndex
+            self._uid_index = UidIndex(self, persistent=self.fact_cache.persistent)
+        return self._uid_index
+
+    def prefetch_facts(self, paths: List[Path], jobs: int = 1):
+        """Extract facts for stale scripts in parallel (jobs=0: one worker per core)"""
+        self.fact_cache.prefetch(paths, jobs)
+
+    def io_stats(self) -> Dict[str, int]:
+        """Files looked at and files/bytes actually read from disk so far"""
+        return {
+            'files_processed': self.files_processed,
+            'files_read': self.files_read + self.fact_cache.files_read,
+            'bytes_read': self.bytes_read + self.fact_cache.bytes_read,
+        }
+
+    def save_cache(self):
+        """Persist the fact cache (forgetting scripts that no longer exist) and the uid index"""
+        self.fact_cache.save({self.relative(p) for p in self.scripts()})
+        if self._uid_index is not None:
+            self._uid_index.save()
+
+    # ------------------------------------------------------------------
+    # project.godot
+    # ------------------------------------------------------------------
+
+    @property
+    def project_settings(self) -> Dict[str, Dict[str, str]]:
+        """project.godot parsed into {section: {key: raw value}}"""
+        if self._project_settings is None:
+            self._project_settings = self._parse_project_file()
+        return self._project_settings
+
+    def _parse_project_file(self) -> Dict[str, Dict[str, str]]:
+        settings: Dict[str, Dict[str, str]] = {}
+        project_path = self.root / 'project.godot'
+        if not project_path.exists():
+            return settings
+
+        section = ''
+        key = None
+        value_lines: List[str] = []
+        depth = 0
+
+        for line in self.read_text(project_path).split('\n'):
+            if key is not None:
+                # Continuation of a multi-line value such as an input map
+                value_lines.append(line)
+                depth += _bracket_depth(line)
+                if depth <= 0:
+                    settings[section][key] = '\n'.join(value_lines)
+                    key = None
+                continue
+
+            stripped = line.strip()
+            if not stripped or stripped.startswith(';'):
+                continue
+            if stripped.startswith('[') and stripped.endswith(']'):
+                section = stripped[1:-1]
+                settings.setdefault(section, {})
+                continue
+            if '=' not in line:
+                continue
+
+            name, value = line.split('=', 1)
+            settings.setdefault(section, {})
+            depth = _bracket_depth(value)
+            if depth > 0:
+                key = name.strip()
+                value_lines = [value]
+            else:
+                settings[section][name.strip()] = value.strip()
+
+        return settings
+
+    @property
+    def main_scene(self) -> str:
+        """res:// path of the main scene, or '' when none is configured"""
+        value = self.project_settings.get('application', {}).get('run/main_scene', '')
+        return value.strip('"')
+
+    @property
+    def autoloads(self) -> Dict[str, str]:
+        """Autoload name -> res:// script path (quotes and '*' stripped)"""
+        entries = self.project_settings.get('autoload', {})
+        return {name: value.strip('"').replace('*', '') for name, value in entries.items()}
+
+
+def _bracket_depth(text: str) -> int:
+    """Net count of opening brackets outside string literals"""
+    depth = 0
+    in_string = False
+    escaped = False
+    for ch in text:
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == '\\':
+                escaped = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch in '{[(':
+            depth += 1
+        elif ch in '}])':
+            depth -= 1
+    return depth
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+Universal Being Project Root
+============================
+One place that decides which Godot project the tools work on.
+
+Every tool used to compute its own root (usually the folder the script
+lives in, once a hardcoded Windows path). They now all ask:
+
+    project_root = find_project_root()
+
+Resolution order:
+1. an explicit start directory (e.g. `ubtool --root PATH`)
+2. the UB_PROJECT_ROOT environment variable
+3. the folder these tools live in
+
+From the chosen start the nearest directory containing project.godot is
+used, searching upward, so tools kept in a subfolder such as tools/ still
+find the project. Kept import-light on purpose: ubtool imports it at
+startup.
+"""
+
+import os
+from pathlib import Path
+
+TOOLKIT_DIR = Path(__file__).resolve().parent
+
+
+def find_project_root(start=None) -> Path:
+    """Directory holding project.godot at or above the start directory"""
+    if start is None:
+        start = os.environ.get('UB_PROJECT_ROOT') or TOOLKIT_DIR
+
+    base = Path(start).expanduser().resolve()
+    for directory in [base, *base.parents]:
+        if (directory / 'project.godot').is_file():
+            return directory
+
+    # No Godot project above it - trust the caller's choice
+    return base
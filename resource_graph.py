@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""
+Universal Being Resource Graph
+==============================
+Dependency graph over the project's scenes (.tscn), resources (.tres) and
+scripts (.gd), built once per run from the parsed scene headers (see
+scene_parser.py) and the cached script facts (see script_facts.py).
+
+    graph = index.resource_graph
+    graph.cost('res://scenes/PERFECT_ULTIMATE_UNIVERSAL_BEING.tscn')
+    # {'resources': 7, 'bytes': 99602}
+    graph.load_order('res://scenes/PERFECT_ULTIMATE_UNIVERSAL_BEING.tscn')
+
+Edges and their kinds:
+- ext_resource  [ext_resource ... path="res://..."] in a .tscn/.tres
+- preload       preload("res://...") in a script
+- extends       extends "res://..." in a script
+- load          load("res://...") in a script (runtime, not part of the load cost)
+- path          any other "res://..." literal in a script's code, e.g. a
+                table of paths handed to load() later (runtime)
+- class_name    a script naming another script's class_name (type hint,
+                extends, is/as, Foo.new()); not part of the load cost either
+
+reachable()/unreachable() follow every edge kind from the project's roots:
+run/main_scene, the autoloads and the scripts of enabled editor plugins.
+
+Loading a scene pulls in everything reachable over the load-time edges
+(ext_resource, preload, extends). Those edges are condensed into strongly
+connected components, so dependency cycles are reported instead of
+recursing forever, and every closure is computed once per component, in
+topological order, and shared by all resources that reach it.
+"""
+
+import os
+import re
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
+
+# Edge kinds that are resolved when the resource itself is loaded
+LOAD_TIME_KINDS = frozenset(('ext_resource', 'preload', 'extends'))
+
+_QUOTED_RE = re.compile(r'''^(["'])(.+?)\1''')
+_PLUGIN_SCRIPT_RE = re.compile(r'^script="([^"]+)"', re.MULTILINE)
+_QUOTED_PATH_RE = re.compile(r'"(res://[^"]+)"')
+
+
+class ResourceGraph:
+    def __init__(self, index):
+        self.index = index
+        self.root = index.root
+
+        self.nodes: List[str] = []                         # project .tscn/.tres/.gd, in walk order
+        self.edges: Dict[str, List[Tuple[str, str]]] = {}  # res:// path -> [(target, kind)]
+        self.missing: Dict[str, List[str]] = {}            # res:// path -> referenced files that do not exist
+        self.sizes: Dict[str, Optional[int]] = {}          # res:// path -> bytes on disk (None: missing)
+        self.scanned_dirs: Dict[str, List[str]] = {}       # "res://dir/" literal -> scripts naming it
+
+        self.components: List[List[str]] = []     # strongly connected components, dependencies first
+        self._component_of: Dict[str, int] = {}
+        self._closures: List[FrozenSet[str]] = []  # per component: everything its members load
+        self._costs: Dict[str, Dict[str, int]] = {}
+
+        self._build()
+        self._condense()
+        for scene in self.scenes():
+            self.cost(scene)
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+
+    def res_path(self, path) -> str:
+        return 'res://' + os.path.relpath(path, self.root).replace(os.sep, '/')
+
+    def _add_node(self, path) -> str:
+        res_path = self.res_path(path)
+        self.nodes.append(res_path)
+        stat = self.index.stat(path)
+        self.sizes[res_path] = stat.st_size if stat else None
+        return res_path
+
+    def _build(self):
+        for path in self.index.scenes() + self.index.resources():
+            res_path = self._add_node(path)
+            info = self.index.scene_info(path)
+            if info is None:
+                continue
+            for ext in info['ext_resources']:
+                if ext['path']:
+                    self._add_edge(res_path, self.resolve(ext['path'], res_path), 'ext_resource')
+
+        for path in self.index.scripts():
+            res_path = self._add_node(path)
+            facts = self.index.facts(path)
+            if facts['encoding'] is None:
+                continue
+            quoted = _QUOTED_RE.match(facts.get('extends') or '')
+            if quoted:
+                self._add_edge(res_path, self.resolve(quoted.group(2), res_path), 'extends')
+            for kind, target in facts['resource_loads']:
+                if target.endswith('/'):
+                    # A folder listed at runtime: its contents cannot be resolved statically
+                    self.scanned_dirs.setdefault(target, []).append(res_path)
+                    continue
+                self._add_edge(res_path, self.resolve(target, res_path), kind)
+            class_files = self.index.class_hierarchy.class_files
+            for name in facts['type_refs']:
+                if name in class_files:
+                    self._add_edge(res_path, class_files[name], 'class_name')
+
+        for res_path in self.nodes:
+            self.edges.setdefault(res_path, [])
+
+    def resolve(self, target: str, from_res_path: str) -> str:
+        """res:// form of a referenced path (relative paths are relative to the referencing file)"""
+        if target.startswith('res://'):
+            return target
+        base = os.path.dirname(from_res_path[len('res://'):])
+        return 'res://' + os.path.normpath(os.path.join(base, target)).replace(os.sep, '/')
+
+    def _add_edge(self, source: str, target: str, kind: str):
+        if target not in self.sizes:
+            stat = self.index.stat(self.root / target[len('res://'):])
+            self.sizes[target] = stat.st_size if stat else None
+        if self.sizes[target] is None:
+            if kind == 'path':
+                return  # Not necessarily a file path (a pattern, a prefix, a save location)
+            missing = self.missing.setdefault(source, [])
+            if target not in missing:
+                missing.append(target)
+            return
+        edges = self.edges.setdefault(source, [])
+        if (target, kind) not in edges:
+            edges.append((target, kind))
+
+    def _condense(self):
+        """Tarjan's algorithm over the load-time edges, iteratively (no recursion limit)"""
+        order: Dict[str, int] = {}
+        low: Dict[str, int] = {}
+        stack: List[str] = []
+        on_stack: Set[str] = set()
+
+        for start in self.nodes + [t for targets in self.edges.values() for t, _ in targets]:
+            if start in order:
+                continue
+            work = [(start, iter(self.dependencies(start)))]
+            order[start] = low[start] = len(order)
+            stack.append(start)
+            on_stack.add(start)
+            while work:
+                node, children = work[-1]
+                child = next(children, None)
+                if child is not None:
+                    if child not in order:
+                        order[child] = low[child] = len(order)
+                        stack.append(child)
+                        on_stack.add(child)
+                        work.append((child, iter(self.dependencies(child))))
+                    elif child in on_stack:
+                        low[node] = min(low[node], order[child])
+                    continue
+
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[node])
+                if low[node] == order[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    self._add_component(component)
+
+    def _add_component(self, component: List[str]):
+        """Components arrive dependencies first, so every successor's closure already exists"""
+        number = len(self.components)
+        members = set(component)
+        closure = set(members)
+        for member in component:
+            self._component_of[member] = number
+            for dependency in self.dependencies(member):
+                if dependency not in members:
+                    closure.update(self._closures[self._component_of[dependency]])
+        self.components.append(sorted(component))
+        self._closures.append(frozenset(closure))
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def dependencies(self, res_path: str) -> List[str]:
+        """Direct load-time dependencies"""
+        return [target for target, kind in self.edges.get(res_path, ()) if kind in LOAD_TIME_KINDS]
+
+    def closure(self, res_path: str) -> FrozenSet[str]:
+        """Everything loading res_path pulls in (res_path itself excluded)"""
+        number = self._component_of.get(res_path)
+        if number is None:
+            return frozenset()
+        return self._closures[number] - {res_path}
+
+    def load_order(self, res_path: str) -> List[str]:
+        """The closure of res_path, dependencies before the resources that need them"""
+        closure = self.closure(res_path)
+        return sorted(closure, key=lambda node: (self._component_of[node], node))
+
+    def cost(self, res_path: str) -> Dict[str, int]:
+        """Resources and bytes transitively loaded with res_path (itself included)"""
+        cost = self._costs.get(res_path)
+        if cost is None:
+            closure = self.closure(res_path) | {res_path}
+            cost = {
+                'resources': len(closure) - 1,
+                'bytes': sum(self.sizes.get(node) or 0 for node in closure),
+            }
+            self._costs[res_path] = cost
+        return cost
+
+    def cycles(self) -> List[List[str]]:
+        """Groups of resources that load each other"""
+        return [component for component in self.components
+                if len(component) > 1 or component[0] in self.dependencies(component[0])]
+
+    def scenes(self) -> List[str]:
+        return [node for node in self.nodes if node.endswith('.tscn')]
+
+    # ------------------------------------------------------------------
+    # Reachability
+    # ------------------------------------------------------------------
+
+    def roots(self) -> List[str]:
+        """What the engine loads on its own: main scene, autoloads, enabled editor plugins"""
+        roots = []
+        if self.index.main_scene:
+            roots.append(self.index.main_scene)
+        roots.extend(self.index.autoloads.values())
+
+        plugins = self.index.project_settings.get('editor_plugins', {}).get('enabled', '')
+        for plugin_cfg in _QUOTED_PATH_RE.findall(plugins):
+            try:
+                config = self.index.read_text(self.root / plugin_cfg[len('res://'):])
+            except (OSError, UnicodeDecodeError):
+                continue
+            for script in _PLUGIN_SCRIPT_RE.findall(config):
+                roots.append(self.resolve(script, plugin_cfg))
+
+        return [root for root in dict.fromkeys(roots) if self.sizes.get(root, 0) is not None]
+
+    def reachable(self, roots: List[str] = None) -> Set[str]:
+        """Every resource reachable from the roots over any edge kind"""
+        seen = set(self.roots() if roots is None else roots)
+        queue = list(seen)
+        while queue:
+            for target, _ in self.edges.get(queue.pop(), ()):
+                if target not in seen:
+                    seen.add(target)
+                    queue.append(target)
+        return seen
+
+    def unreachable(self, roots: List[str] = None) -> List[str]:
+        """Project scripts, scenes and resources nothing reachable ever loads, in walk order"""
+        reachable = self.reachable(roots)
+        return [node for node in self.nodes if node not in reachable]
+
+    def scanned_dir(self, res_path: str) -> Optional[str]:
+        """Folder literal ("res://beings/") under which res_path might be found by a runtime scan.
+
+        The bare "res://" is ignored: it would excuse every file in the project.
+        """
+        best = None
+        for folder in self.scanned_dirs:
+            if folder != 'res://' and res_path.startswith(folder) and (best is None or len(folder) > len(best)):
+                best = folder
+        return best
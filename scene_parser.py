@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Godot Scene Parser
+==================
+Streaming section/property parser for Godot text scenes (.tscn) and
+resources (.tres), format 3 (Godot 4) and format 2 (Godot 3).
+
+The file is read line by line and one record is yielded per section, so a
+scene is never held in memory as a whole:
+
+    for record in parse_scene(path):
+        if record.kind == 'ext_resource':
+            print(record.line, record.attrs['type'], record.attrs['path'])
+
+Record kinds are the section tags: gd_scene / gd_resource (the file
+header), ext_resource, sub_resource, resource, node, connection,
+editable. Each record carries:
+- attrs       header attributes, quoted values unquoted
+              ({'type': 'Script', 'path': 'res://x.gd', 'id': '1_ab'})
+- properties  key -> raw value text (may span several lines)
+- line / end_line and property_lines (key -> (first, last) line), 1-based
+
+Values are kept as written; ext_resource_id() / sub_resource_id() read
+the id out of an ExtResource("...") / SubResource("...") value.
+
+summarize_scene() condenses one pass over a file into the small summary
+the tools share through ProjectIndex.scene_info(); node_depth() turns a
+node's parent attribute into its depth in the scene tree.
+"""
+
+import re
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+# key=value inside a [section header]; values are quoted strings or bare tokens with optional (...) arguments
+_ATTR_RE = re.compile(r'([\w/]+)=("(?:[^"\\]|\\.)*"|[^\s\]"(]+(?:\([^)]*\))?)')
+_TAG_RE = re.compile(r'\[(\w+)')
+_PROPERTY_RE = re.compile(r'([^\s=][^=]*?)\s*=\s*(.*)', re.DOTALL)
+_RESOURCE_ID_RE = re.compile(r'^(?:Ext|Sub)Resource\(\s*"?([^")\s]+)"?\s*\)')
+
+
+class SceneRecord:
+    """One [section] of a .tscn/.tres file with its properties"""
+
+    __slots__ = ('kind', 'attrs', 'properties', 'property_lines', 'line', 'end_line')
+
+    def __init__(self, kind: str, attrs: Dict[str, str], line: int):
+        self.kind = kind
+        self.attrs = attrs
+        self.properties: Dict[str, str] = {}
+        self.property_lines: Dict[str, Tuple[int, int]] = {}
+        self.line = line
+        self.end_line = line
+
+    def __repr__(self):
+        return f"SceneRecord({self.kind} {self.attrs}, lines {self.line}-{self.end_line})"
+
+
+def parse_scene(source) -> Iterator[SceneRecord]:
+    """Yield the records of a .tscn/.tres file (a path, or any iterable of lines)"""
+    if isinstance(source, (str, Path)):
+        with open(source, 'r', encoding='utf-8') as f:
+            yield from _parse_lines(f)
+    else:
+        yield from _parse_lines(source)
+
+
+def _parse_lines(lines: Iterable[str]) -> Iterator[SceneRecord]:
+    record: Optional[SceneRecord] = None
+    key = None          # property whose value continues on the next line
+    value_lines = []
+    value_start = 0
+    state = _ValueState()
+
+    for number, line in enumerate(lines, 1):
+        if key is not None:
+            value_lines.append(line)
+            if state.feed(line):
+                _set_property(record, key, value_lines, value_start, number)
+                key = None
+            continue
+
+        stripped = line.strip()
+        if not stripped or stripped.startswith(';'):
+            continue
+
+        if stripped.startswith('['):
+            if record is not None:
+                yield record
+            tag = _TAG_RE.match(stripped)
+            record = SceneRecord(tag.group(1) if tag else '', _parse_attrs(stripped), number)
+            continue
+
+        match = _PROPERTY_RE.match(line.lstrip())
+        if record is None or not match:
+            continue
+        key = match.group(1).rstrip()
+        value_lines = [match.group(2)]
+        value_start = number
+        state = _ValueState()
+        if state.feed(match.group(2)):
+            _set_property(record, key, value_lines, value_start, number)
+            key = None
+
+    if record is not None:
+        if key is not None:  # Unterminated value at end of file
+            _set_property(record, key, value_lines, value_start, value_start + len(value_lines) - 1)
+        yield record
+
+
+def _set_property(record: SceneRecord, key: str, value_lines, first: int, last: int):
+    record.properties[key] = ''.join(value_lines).rstrip('\n')
+    record.property_lines[key] = (first, last)
+    record.end_line = last
+
+
+def _parse_attrs(header: str) -> Dict[str, str]:
+    attrs = {}
+    for name, value in _ATTR_RE.findall(header):
+        attrs[name] = unquote(value)
+    return attrs
+
+
+class _ValueState:
+    """Tracks brackets and string literals across the lines of one property value"""
+
+    __slots__ = ('depth', 'in_string', 'escaped')
+
+    def __init__(self):
+        self.depth = 0
+        self.in_string = False
+        self.escaped = False
+
+    def feed(self, text: str) -> bool:
+        """Consume one line; True once the value is complete"""
+        for ch in text:
+            if self.in_string:
+                if self.escaped:
+                    self.escaped = False
+                elif ch == '\\':
+                    self.escaped = True
+                elif ch == '"':
+                    self.in_string = False
+            elif ch == '"':
+                self.in_string = True
+            elif ch in '([{':
+                self.depth += 1
+            elif ch in ')]}':
+                self.depth -= 1
+        return not self.in_string and self.depth <= 0
+
+
+def unquote(value: str) -> str:
+    """"res://x.gd" -> res://x.gd; bare values are returned unchanged"""
+    if len(value) >= 2 and value[0] == '"' and value[-1] == '"':
+        return value[1:-1].replace('\\"', '"').replace('\\\\', '\\')
+    return value
+
+
+def ext_resource_id(value: str) -> Optional[str]:
+    """'1_ab' from ExtResource("1_ab") (or ExtResource(1) in format 2)"""
+    return _resource_id(value, 'ExtResource')
+
+
+def sub_resource_id(value: str) -> Optional[str]:
+    return _resource_id(value, 'SubResource')
+
+
+def _resource_id(value: str, kind: str) -> Optional[str]:
+    value = value.strip()
+    if not value.startswith(kind):
+        return None
+    match = _RESOURCE_ID_RE.match(value)
+    return match.group(1) if match else None
+
+
+def node_depth(parent: Optional[str]) -> int:
+    """Depth of a node from its parent="..." attribute (the root node has none)"""
+    if parent is None:
+        return 0
+    if parent == '.':
+        return 1
+    return parent.count('/') + 2
+
+
+def summarize_scene(source) -> Dict:
+    """Header, external/sub resources and node/connection counts of a .tscn/.tres"""
+    summary = {
+        'kind': None,
+        'uid': None,
+        'ext_resources': [],   # {'id', 'type', 'path', 'uid', 'line'}
+        'sub_resources': [],   # {'id', 'type', 'line'}
+        'nodes': 0,
+        'max_depth': 0,        # root node = 0, its children = 1, ...
+        'instances': [],       # [ext_resource id, depth] per node instancing a scene
+        'connections': 0,
+    }
+    ext_resources: List[Dict] = summary['ext_resources']
+
+    for record in parse_scene(source):
+        attrs = record.attrs
+        if record.kind in ('gd_scene', 'gd_resource'):
+            summary['kind'] = record.kind
+            summary['uid'] = attrs.get('uid')
+        elif record.kind == 'ext_resource':
+            ext_resources.append({
+                'id': attrs.get('id'),
+                'type': attrs.get('type'),
+                'path': attrs.get('path'),
+                'uid': attrs.get('uid'),
+                'line': record.line,
+            })
+        elif record.kind == 'sub_resource':
+            summary['sub_resources'].append({'id': attrs.get('id'), 'type': attrs.get('type'), 'line': record.line})
+        elif record.kind == 'node':
+            summary['nodes'] += 1
+            depth = node_depth(attrs.get('parent'))
+            summary['max_depth'] = max(summary['max_depth'], depth)
+            instance = ext_resource_id(attrs.get('instance', ''))
+            if instance:
+                summary['instances'].append([instance, depth])
+        elif record.kind == 'connection':
+            summary['connections'] += 1
+
+    return summary
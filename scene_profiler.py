@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Universal Being Scene Profiler
+==============================
+Per-scene complexity and load cost, from the parsed scenes (scene_parser.py
+through ProjectIndex.scene_info) and the resource graph (resource_graph.py).
+
+    python scene_profiler.py                                  # scenes/, heaviest first
+    python scene_profiler.py scenes/MATRIX_INFINITE_CHUNKS.tscn
+    python scene_profiler.py --budget tree_nodes=300 --budget load_kb=512
+    python ubtool.py scenes --top 10
+
+Metrics per scene:
+- nodes, depth               the scene's own node tree
+- tree_nodes, tree_depth     with every instanced scene expanded, once per instance
+- sub_resources, inline_scripts, ext_resources, connections
+- dependencies, load_kb      everything loading the scene pulls in (ResourceGraph.cost)
+
+Any metric can be given a budget. Scenes over budget are flagged and the
+command exits with 1, so it can guard a CI run instead of finding
+scene-load hitches in the editor.
+"""
+
+import argparse
+import json
+import os
+import sys
+from typing import Dict, List, Optional, Set, Tuple
+
+METRICS = ('nodes', 'depth', 'tree_nodes', 'tree_depth', 'sub_resources', 'inline_scripts',
+           'ext_resources', 'connections', 'dependencies', 'load_kb')
+
+DEFAULT_BUDGETS = {
+    'tree_nodes': 1000,
+    'tree_depth': 16,
+    'sub_resources': 200,
+    'inline_scripts': 3,
+    'load_kb': 2048,
+}
+
+DEFAULT_DIRECTORY = 'scenes'
+
+
+class SceneProfiler:
+    def __init__(self, index, budgets: Optional[Dict[str, float]] = None):
+        self.index = index
+        self.root = index.root
+        self.graph = index.resource_graph
+        self.budgets = dict(DEFAULT_BUDGETS if budgets is None else budgets)
+        self._trees: Dict[str, Tuple[int, int]] = {}  # res:// scene -> (tree_nodes, tree_depth)
+
+    def profile(self, scene_file) -> Optional[Dict]:
+        """Metrics for one scene (None if it cannot be parsed)"""
+        info = self.index.scene_info(scene_file)
+        if info is None:
+            return None
+        res_path = self.graph.res_path(scene_file)
+        tree_nodes, tree_depth = self._tree(res_path, set())
+        cost = self.graph.cost(res_path)
+        return {
+            'scene': res_path,
+            'nodes': info['nodes'],
+            'depth': info['max_depth'],
+            'tree_nodes': tree_nodes,
+            'tree_depth': tree_depth,
+            'sub_resources': len(info['sub_resources']),
+            'inline_scripts': sum(1 for sub in info['sub_resources'] if sub['type'] == 'GDScript'),
+            'ext_resources': len(info['ext_resources']),
+            'connections': info['connections'],
+            'dependencies': cost['resources'],
+            'load_kb': round(cost['bytes'] / 1024, 1),
+            'file_kb': round((self.graph.sizes.get(res_path) or 0) / 1024, 1),
+        }
+
+    def profile_all(self, scene_files: Optional[List] = None, directory: str = DEFAULT_DIRECTORY) -> List[Dict]:
+        """Profiles of the given scenes (default: every scene under directory), heaviest load first"""
+        if scene_files is None:
+            scene_files = self.index.scenes(directory)
+        profiles = [p for p in (self.profile(f) for f in scene_files) if p is not None]
+        profiles.sort(key=lambda p: (-p['load_kb'], -p['tree_nodes'], p['scene']))
+        return profiles
+
+    def _tree(self, res_path: str, instancing: Set[str]) -> Tuple[int, int]:
+        """(nodes, depth) of a scene with its instanced scenes expanded; a cyclic instance adds nothing"""
+        if res_path in self._trees:
+            return self._trees[res_path]
+        if res_path in instancing:
+            return 0, 0
+        info = self.index.scene_info(self.root / res_path[len('res://'):])
+        if info is None:
+            return 0, 0
+
+        instancing.add(res_path)
+        paths = {ext['id']: ext['path'] for ext in info['ext_resources'] if ext['path']}
+        nodes, depth = info['nodes'], info['max_depth']
+        for ext_id, node_depth in info['instances']:
+            child = paths.get(ext_id)
+            if not child or not child.endswith('.tscn'):
+                continue
+            child_nodes, child_depth = self._tree(self.graph.resolve(child, res_path), instancing)
+            # The instancing node is the child scene's root, so it is counted once
+            nodes += max(child_nodes - 1, 0)
+            depth = max(depth, node_depth + child_depth)
+        instancing.discard(res_path)
+
+        self._trees[res_path] = (nodes, depth)
+        return nodes, depth
+
+    def over_budget(self, profile: Dict) -> List[Tuple[str, float, float]]:
+        """(metric, value, budget) for every budget the scene exceeds"""
+        return [(metric, profile[metric], limit) for metric, limit in self.budgets.items()
+                if profile.get(metric, 0) > limit]
+
+
+def parse_budgets(specs: List[str], defaults: bool = True) -> Dict[str, float]:
+    """'metric=value' strings on top of (or instead of) DEFAULT_BUDGETS"""
+    budgets = dict(DEFAULT_BUDGETS) if defaults else {}
+    for spec in specs:
+        metric, _, value = spec.partition('=')
+        metric = metric.strip()
+        if metric not in METRICS:
+            raise ValueError(f"unknown metric '{metric}' (one of: {', '.join(METRICS)})")
+        try:
+            budgets[metric] = float(value)
+        except ValueError:
+            raise ValueError(f"budget for '{metric}' is not a number: '{value}'")
+    return budgets
+
+
+def print_profiles(profiler: SceneProfiler, profiles: List[Dict], top: int = 15) -> int:
+    """Ranked table plus budget violations; returns the number of scenes over budget"""
+    print(f"🎬 SCENE PROFILE: {len(profiles)} scenes, heaviest load first")
+    print(f"{'load KB':>9} {'deps':>5} {'nodes':>6} {'tree':>6} {'depth':>5} {'subres':>6} {'inline':>6}  scene")
+    for profile in profiles[:top]:
+        flag = ' ⚠️' if profiler.over_budget(profile) else ''
+        print(f"{profile['load_kb']:>9.1f} {profile['dependencies']:>5} {profile['nodes']:>6} "
+              f"{profile['tree_nodes']:>6} {profile['tree_depth']:>5} {profile['sub_resources']:>6} "
+              f"{profile['inline_scripts']:>6}  {profile['scene'].replace('res://', '')}{flag}")
+    if len(profiles) > top:
+        print(f"   ... and {len(profiles) - top} more")
+
+    over = [(profile, profiler.over_budget(profile)) for profile in profiles]
+    over = [(profile, violations) for profile, violations in over if violations]
+    if not profiler.budgets:
+        return 0
+    budgets = ', '.join(f"{metric} ≤ {limit:g}" for metric, limit in profiler.budgets.items())
+    if not over:
+        print(f"\n✅ Every scene is within budget ({budgets})")
+        return 0
+    print(f"\n🚨 {len(over)} scene(s) over budget ({budgets}):")
+    for profile, violations in over:
+        details = ', '.join(f"{metric} {value:g} > {limit:g}" for metric, value, limit in violations)
+        print(f"   {profile['scene'].replace('res://', '')}: {details}")
+    return len(over)
+
+
+def run(index, scenes: List[str], budgets: Dict[str, float], directory: str = DEFAULT_DIRECTORY,
+        top: int = 15, as_json: bool = False) -> int:
+    """Profile and report; exit status 1 if any scene is over budget"""
+    profiler = SceneProfiler(index, budgets)
+    scene_files = None
+    if scenes:
+        scene_files = []
+        for scene in scenes:
+            path = index.root / scene.replace('res://', '')
+            if not os.path.isfile(path):
+                print(f"❌ Scene not found: {scene}")
+                return 2
+            scene_files.append(path)
+    profiles = profiler.profile_all(scene_files, directory)
+
+    if as_json:
+        for profile in profiles:
+            profile['over_budget'] = [{'metric': m, 'value': v, 'budget': b}
+                                      for m, v, b in profiler.over_budget(profile)]
+        print(json.dumps(profiles, indent=2))
+        over = sum(1 for profile in profiles if profile['over_budget'])
+    else:
+        over = print_profiles(profiler, profiles, top)
+    return 1 if over else 0
+
+
+def add_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument('scenes', nargs='*', help='Scenes to profile (default: every scene under --directory)')
+    parser.add_argument('--directory', default=DEFAULT_DIRECTORY,
+                        help=f'Project folder to profile (default: {DEFAULT_DIRECTORY})')
+    parser.add_argument('--budget', action='append', default=[], metavar='METRIC=VALUE',
+                        help=f"Cap a metric ({', '.join(METRICS)}); repeatable")
+    parser.add_argument('--no-default-budgets', action='store_true',
+                        help='Only apply the --budget caps given on the command line')
+    parser.add_argument('--top', type=int, default=15, help='Rows in the ranking (default: 15)')
+    parser.add_argument('--json', action='store_true', help='Print every profile as JSON instead')
+
+
+def main(argv=None):
+    from project_index import ProjectIndex
+    from project_root import find_project_root
+
+    parser = argparse.ArgumentParser(description='Scene complexity and load-cost profiler with budgets')
+    parser.add_argument('--root', metavar='PATH', help='Godot project (default: the one holding these tools)')
+    add_arguments(parser)
+    args = parser.parse_args(argv)
+    try:
+        budgets = parse_budgets(args.budget, defaults=not args.no_default_budgets)
+    except ValueError as e:
+        parser.error(str(e))
+
+    index = ProjectIndex(find_project_root(args.root))
+    status = run(index, args.scenes, budgets, args.directory, args.top, args.json)
+    index.save_cache()
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+GDScript Span Edits
+===================
+Collects every fix for a script as a character-span edit, applies them in
+memory in one pass and writes the file once, atomically.
+
+The fixers used to re-open a script per issue and rewrite it with a regex
+substitution, so one script could be read and written three times and a
+later fix could undo or shift an earlier one. Spans come from the outline
+parser (gdscript_outline.py), so a match inside a comment or a string is
+never edited.
+
+    edits = FileEdits(path, index.read_text(path))
+    statement = edits.outline.symbols[0].header
+    edits.replace(statement.code_start, statement.end, "extends UniversalBeing", "Fixed extends")
+    print(edits.diff('beings/x.gd'))   # dry run
+    edits.write()                      # temp file + os.replace
+
+Edits must not overlap; an insertion may sit on the boundary of a
+replacement. An overlapping edit raises EditConflict and leaves the
+already accepted edits untouched.
+"""
+
+import difflib
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Iterable, List, NamedTuple, Optional, Union
+
+from gdscript_outline import Outline, parse_outline
+
+
+class EditConflict(Exception):
+    """An edit overlaps one that was already accepted for the same file"""
+
+
+class SpanEdit(NamedTuple):
+    start: int
+    end: int
+    text: str
+    description: str
+
+
+class FileEdits:
+    """Pending non-overlapping edits against one script's current content"""
+
+    def __init__(self, path, content: str):
+        self.path = Path(path)
+        self.content = content
+        self.edits: List[SpanEdit] = []
+        self._outline: Optional[Outline] = None
+
+    @property
+    def outline(self) -> Outline:
+        """Outline of the original content (edit offsets always refer to it)"""
+        if self._outline is None:
+            self._outline = parse_outline(self.content)
+        return self._outline
+
+    def replace(self, start: int, end: int, text: str, description: str) -> SpanEdit:
+        edit = SpanEdit(start, end, text, description)
+        for other in self.edits:
+            if _overlaps(edit, other):
+                raise EditConflict(f"'{description}' overlaps '{other.description}' "
+                                   f"in {self.path.name} at offset {start}")
+        self.edits.append(edit)
+        return edit
+
+    def insert(self, offset: int, text: str, description: str) -> SpanEdit:
+        return self.replace(offset, offset, text, description)
+
+    def apply(self) -> str:
+        """The content with every edit applied"""
+        pieces = []
+        pos = 0
+        for edit in sorted(self.edits, key=lambda e: (e.start, e.end)):
+            pieces.append(self.content[pos:edit.start])
+            pieces.append(edit.text)
+            pos = edit.end
+        pieces.append(self.content[pos:])
+        return ''.join(pieces)
+
+    def diff(self, name: str) -> str:
+        """Unified diff of the pending edits, with git-style a/ b/ file names"""
+        lines = difflib.unified_diff(self.content.splitlines(keepends=True),
+                                     self.apply().splitlines(keepends=True),
+                                     f"a/{name}", f"b/{name}")
+        return ''.join(line if line.endswith('\n') else line + '\n\\ No newline at end of file\n'
+                       for line in lines)
+
+    def write(self):
+        """Replace the file with the edited content in one atomic step"""
+        write_atomic(self.path, self.apply())
+
+
+def _overlaps(a: SpanEdit, b: SpanEdit) -> bool:
+    if a.start == a.end and b.start == b.end:
+        return a.start == b.start  # Two insertions at one point have no defined order
+    return a.start < b.end and b.start < a.end
+
+
+def write_atomic(path, text: Union[str, Iterable[str]]):
+    """Write text (or an iterable of chunks) next to path and rename it over the original, keeping its permissions"""
+    path = Path(path)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8', newline='') as f:
+            if isinstance(text, str):
+                f.write(text)
+            else:
+                f.writelines(text)
+        if path.exists():
+            shutil.copymode(path, tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
@@ -0,0 +1,467 @@
+#!/usr/bin/env python3
+"""
+Universal Being Script Facts
+============================
+Extracts the facts every Pentagon tool needs from a GDScript file and
+keeps them in a persistent on-disk cache, so repeated runs only re-parse
+files that actually changed.
+
+Facts extracted per script:
+- extends target and class_name, with the lines declaring them
+- pentagon_* method spans and super() call positions
+- consciousness_level assignments
+- being_type / being_name assignments
+- AkashicRecords references and save/load operations
+- declared functions, called names and signal emissions
+- call sites (calling function, receiver, callee, line) and typed
+  variables, for the call graph (see call_graph.py)
+- preload()/load() resource paths, other res:// string literals and
+  referenced class names, for the resource graph (see resource_graph.py)
+
+Parsing can be spread over worker processes (FactCache.prefetch); results
+are merged back in input order, so reports never depend on scheduling.
+
+Cache entries are keyed by project-relative path and validated by
+(mtime, size) first and content hash second, so an untouched file is
+never opened and a touched-but-identical file is never re-parsed.
+"""
+
+import hashlib
+import json
+import os
+import re
+from bisect import bisect_right
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from gdscript_outline import Outline, parse_outline
+
+# Bump whenever extract_facts() output changes shape or meaning
+FACTS_VERSION = 8
+
+CACHE_DIR = '.ub_cache'
+CACHE_FILE = 'script_facts.json'
+
+PENTAGON_METHODS = {
+    'pentagon_init': {
+        'signature': r'func\s+pentagon_init\s*\(\s*\)\s*->\s*void:',
+        'super_call': r'super\.pentagon_init\(\)',
+        'super_position': 'first'
+    },
+    'pentagon_ready': {
+        'signature': r'func\s+pentagon_ready\s*\(\s*\)\s*->\s*void:',
+        'super_call': r'super\.pentagon_ready\(\)',
+        'super_position': 'first'
+    },
+    'pentagon_process': {
+        'signature': r'func\s+pentagon_process\s*\(\s*delta\s*:\s*float\s*\)\s*->\s*void:',
+        'super_call': r'super\.pentagon_process\s*\(\s*delta\s*\)',
+        'super_position': 'first'
+    },
+    'pentagon_input': {
+        'signature': r'func\s+pentagon_input\s*\(\s*event\s*:\s*InputEvent\s*\)\s*->\s*void:',
+        'super_call': r'super\.pentagon_input\s*\(\s*event\s*\)',
+        'super_position': 'first'
+    },
+    'pentagon_sewers': {
+        'signature': r'func\s+pentagon_sewers\s*\(\s*\)\s*->\s*void:',
+        'super_call': r'super\.pentagon_sewers\s*\(\)',
+        'super_position': 'last'
+    }
+}
+
+_SIGNATURE_RES = {name: re.compile(rules['signature']) for name, rules in PENTAGON_METHODS.items()}
+_SUPER_CALL_RES = {name: re.compile(rules['super_call']) for name, rules in PENTAGON_METHODS.items()}
+_ANY_SUPER_RES = {name: re.compile(rf'super\.{name}\s*\(') for name in PENTAGON_METHODS}
+
+# Every per-statement fact in one scan of the masked code: each identifier is
+# matched once (from its first character, thanks to the lookbehind) with what
+# follows it - '(' for a call, '= <digits>' or '= <quote>' for the
+# consciousness_level / being_type / being_name assignments.
+_CODE_SCAN_RE = re.compile(
+    r'(?<!\w)(?P<name>\w+)\s*(?:(?P<call>\()|=\s*(?:(?P<level>\d+)|(?P<quote>["\'])))'
+)
+# Words followed by '(' that are syntax, not calls
+_NOT_CALLS = frozenset((
+    'if', 'elif', 'while', 'for', 'match', 'return', 'and', 'or', 'not', 'in', 'is', 'as',
+    'await', 'assert', 'func', 'signal',
+))
+# First argument of preload()/load(), read back from the source (string contents are masked)
+_LOAD_PATH_RE = re.compile(r'\s*(["\'])([^"\'\n]+)\1')
+# Any res:// string literal: paths kept in tables and passed to load() later
+_RES_LITERAL_RE = re.compile(r'(["\'])(res://[^"\'\n]*)\1')
+# Capitalized identifiers: every way a script can use a class_name (types, extends, is/as, .new())
+_TYPE_REF_RE = re.compile(r'(?<![\w.])[A-Z]\w*')
+_FUNC_DEF_RE = re.compile(r'func\s+$')
+# var x: Type / var x := Type.new() / var x = Type.new()
+_TYPED_VAR_RE = re.compile(r'var\s+(\w+)\s*(?::\s*([A-Za-z_]\w*)|:?=\s*([A-Za-z_]\w*)\.new\s*\()')
+# String contents are blanked in the masked code, so literals are read back from the source
+_BEING_TYPE_RE = re.compile(r'being_type\s*=\s*["\']([\w_]+)["\']')
+_BEING_NAME_RE = re.compile(r'being_name\s*=\s*["\']([^"\']+)["\']')
+
+
+class CodeScan(NamedTuple):
+    """Result of the single combined-regex pass over a script's code"""
+    consciousness_levels: List[List[int]]  # [line, level] per assignment
+    being_type: Optional[str]
+    being_name: Optional[str]
+    calls: List[str]                       # distinct called names, sorted
+    signal_emits: int                      # .emit( calls
+    call_sites: List[List]                 # [caller, receiver, name, line] per call
+    resource_loads: List[List[str]]        # ['preload' | 'load' | 'path', path] per string literal
+
+
+def extract_facts(content: str) -> Dict:
+    """Extract the Pentagon-relevant facts from GDScript source.
+
+    Structure comes from the outline parser and every pattern runs on its
+    masked source, so comments and strings never produce false matches.
+    """
+    outline = parse_outline(content)
+    scan = scan_code(outline)
+    functions = outline.functions(any_level=True)
+    function_lines = {}
+    for func in functions:
+        function_lines.setdefault(func.name, func.line)
+    extends_line = class_name_line = None
+    for symbol in outline.symbols:
+        if symbol.parent is not None:
+            continue
+        if extends_line is None and symbol.kind in ('extends', 'class_name') and symbol.value:
+            extends_line = symbol.line
+        if class_name_line is None and symbol.kind == 'class_name':
+            class_name_line = symbol.line
+
+    return {
+        'extends': outline.extends,
+        'extends_line': extends_line,
+        'class_name': outline.class_name,
+        'class_name_line': class_name_line,
+        'pentagon_methods': _pentagon_method_facts(outline),
+        'consciousness_levels': scan.consciousness_levels,
+        'being_type': scan.being_type,
+        'being_name': scan.being_name,
+        'akashic_references': [
+            i for i, line in enumerate(content.split('\n'), 1) if 'AkashicRecords' in line
+        ],
+        'save_operations': content.count('save_being_to_zip'),
+        'load_operations': content.count('load_being_from_zip'),
+        'functions': [f.name for f in functions],
+        'function_lines': function_lines,
+        'calls': scan.calls,
+        'signal_emits': scan.signal_emits,
+        'call_sites': scan.call_sites,
+        'typed_vars': _typed_vars(outline),
+        'resource_loads': scan.resource_loads,
+        'type_refs': sorted(set(_TYPE_REF_RE.findall(outline.code)) - {outline.class_name}),
+    }
+
+
+def scan_code(outline: Outline) -> CodeScan:
+    """consciousness_level/being_type/being_name assignments, calls and emits in one regex pass"""
+    code = outline.code
+    content = outline.content
+    levels = []
+    being_type = None
+    being_name = None
+    calls = set()
+    emits = 0
+    call_sites = []
+    resource_loads = []
+    load_args = set()
+    sites = _CallSites(outline)
+
+    for match in _CODE_SCAN_RE.finditer(code):
+        name = match.group('name')
+        if match.group('call'):
+            calls.add(name)
+            if name == 'emit' and code[match.start() - 1:match.start()] == '.':
+                emits += 1
+            site = sites.site(match.start(), name)
+            if site:
+                call_sites.append(site)
+            if name in ('preload', 'load'):
+                literal = _LOAD_PATH_RE.match(content, match.end())
+                if literal:
+                    resource_loads.append([name, literal.group(2)])
+                    load_args.add(literal.start(2))
+        elif match.group('level'):
+            if name.endswith('consciousness_level'):
+                levels.append([_line_of(content, match.start()), int(match.group('level'))])
+        elif name.endswith('being_type'):
+            if being_type is None:
+                literal = _BEING_TYPE_RE.match(content, match.end('name') - len('being_type'))
+                being_type = literal.group(1) if literal else None
+        elif name.endswith('being_name'):
+            if being_name is None:
+                literal = _BEING_NAME_RE.match(content, match.end('name') - len('being_name'))
+                being_name = literal.group(1) if literal else None
+
+    # Remaining res:// literals (string contents are masked, so only the opening quote is code)
+    if 'res://' in content:
+        for literal in _RES_LITERAL_RE.finditer(content):
+            if literal.start(2) not in load_args and outline.in_code(literal.start()):
+                resource_loads.append(['path', literal.group(2)])
+
+    return CodeScan(levels, being_type, being_name, sorted(calls), emits, call_sites, resource_loads)
+
+
+class _CallSites:
+    """Turns a call match into [caller, receiver, name, line]"""
+
+    def __init__(self, outline: Outline):
+        self.code = outline.code
+        self.content = outline.content
+        self.functions = outline.functions(any_level=True)
+        self.function_starts = [f.start for f in self.functions]
+        self._line_starts = None
+
+    def site(self, offset: int, name: str) -> Optional[List]:
+        code = self.code
+        if name in _NOT_CALLS or _FUNC_DEF_RE.search(code, max(0, offset - 16), offset):
+            return None
+
+        # Receiver: the identifier before a '.', '?' when it is not a plain name (a().b(), $Node.b())
+        receiver = None
+        if offset and code[offset - 1] == '.':
+            start = offset - 1
+            while start and (code[start - 1].isalnum() or code[start - 1] == '_'):
+                start -= 1
+            receiver = code[start:offset - 1]
+            if not receiver or receiver[0].isdigit() or (start and code[start - 1] in '.$%'):
+                receiver = '?'
+
+        # Calling function: functions never nest, so the last one starting before offset
+        caller = ''
+        i = bisect_right(self.function_starts, offset) - 1
+        if i >= 0 and offset < self.functions[i].end:
+            caller = self.functions[i].name
+
+        if self._line_starts is None:
+            self._line_starts = [0] + [m.end() for m in re.finditer('\n', self.content)]
+        return [caller, receiver, name, bisect_right(self._line_starts, offset)]
+
+
+def _typed_vars(outline: Outline) -> Dict[str, str]:
+    """Declared class of member and local variables, where the code states it"""
+    typed = {}
+    for statement in outline.statements:
+        match = _TYPED_VAR_RE.search(statement.code)
+        if match:
+            typed.setdefault(match.group(1), match.group(2) or match.group(3))
+    return typed
+
+
+def _pentagon_method_facts(outline: Outline) -> Dict[str, Dict]:
+    """Locate each script-level pentagon_* method, its body and its super() call"""
+    methods = {}
+
+    for name in PENTAGON_METHODS:
+        func = outline.function(name)
+        if func is None:
+            continue
+
+        body = outline.body(func)
+        facts = {
+            'line': func.line,
+            'signature': bool(_SIGNATURE_RES[name].search(func.header.code)),
+            'body': [func.line, func.end_line],
+            'super_line': None,
+            'super_args': False,
+            'super_index': None,
+            'code_lines': len(body),
+        }
+
+        # Position is counted in statements, so multi-line calls count once
+        for i, statement in enumerate(body):
+            if facts['super_line'] is None and _ANY_SUPER_RES[name].search(statement.code):
+                facts['super_line'] = statement.line
+            if _SUPER_CALL_RES[name].search(statement.code):
+                facts['super_args'] = True
+                facts['super_index'] = i
+                break
+
+        methods[name] = facts
+
+    return methods
+
+
+def _line_of(content: str, offset: int) -> int:
+    return content.count('\n', 0, offset) + 1
+
+
+def super_position_ok(method_facts: Dict, expected_position: str) -> bool:
+    """Check a method's super() call against its required position ('first'/'last')"""
+    if method_facts['code_lines'] == 0:
+        return True  # Only super() call, that's fine
+
+    if expected_position == 'first':
+        return method_facts['super_index'] == 0
+    elif expected_position == 'last':
+        return method_facts['super_index'] == method_facts['code_lines'] - 1
+
+    return True
+
+
+def decode_source(data: bytes) -> Dict:
+    """Decode raw script bytes the way open(..., 'r') would, recording the encoding used"""
+    try:
+        text = data.decode('utf-8')
+        return {'text': _universal_newlines(text), 'encoding': 'utf-8', 'error': None}
+    except UnicodeDecodeError as e:
+        error = str(e)
+
+    try:
+        text = data.decode('cp1252')
+        return {'text': _universal_newlines(text), 'encoding': 'cp1252', 'error': error}
+    except UnicodeDecodeError:
+        return {'text': None, 'encoding': None, 'error': error}
+
+
+def _universal_newlines(text: str) -> str:
+    return text.replace('\r\n', '\n').replace('\r', '\n')
+
+
+def facts_from_bytes(data: bytes) -> Dict:
+    """Decode and extract facts, carrying encoding/error information along"""
+    decoded = decode_source(data)
+    facts = extract_facts(decoded['text']) if decoded['text'] is not None else {}
+    facts['encoding'] = decoded['encoding']
+    facts['error'] = decoded['error']
+    return facts
+
+
+def facts_for_path(path: str) -> Tuple[Optional[str], Dict]:
+    """Read and extract one script - the process-pool worker for FactCache.prefetch"""
+    try:
+        with open(path, 'rb') as f:
+            data = f.read()
+    except OSError as e:
+        return None, {'encoding': None, 'error': str(e)}
+    return hashlib.sha1(data).hexdigest(), facts_from_bytes(data)
+
+
+class FactCache:
+    """Persistent path -> (mtime, size, sha1, facts) store under .ub_cache/"""
+
+    def __init__(self, project_root, persistent: bool = True):
+        self.root = Path(project_root)
+        self.path = self.root / CACHE_DIR / CACHE_FILE
+        self.persistent = persistent
+        self.entries: Dict[str, Dict] = {}
+        self.dirty = False
+        self.hits = 0
+        self.misses = 0
+        self.files_read = 0
+        self.bytes_read = 0
+
+        if persistent:
+            self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+
+        if data.get('version') == FACTS_VERSION:
+            self.entries = data.get('files', {})
+
+    def get(self, file_path: Path, stat: Optional[os.stat_result] = None) -> Dict:
+        """Facts for a file, re-parsing only when its content changed"""
+        key = str(file_path.relative_to(self.root))
+        if stat is None:
+            try:
+                stat = file_path.stat()
+            except OSError as e:
+                return {'encoding': None, 'error': str(e)}
+
+        entry = self.entries.get(key)
+        if entry and entry['mtime_ns'] == stat.st_mtime_ns and entry['size'] == stat.st_size:
+            self.hits += 1
+            return entry['facts']
+
+        try:
+            with open(file_path, 'rb') as f:
+                data = f.read()
+        except OSError as e:
+            return {'encoding': None, 'error': str(e)}
+        self.files_read += 1
+        self.bytes_read += len(data)
+
+        digest = hashlib.sha1(data).hexdigest()
+        if entry and entry['sha1'] == digest:
+            # Touched but unchanged - refresh the stat key only
+            self.hits += 1
+            facts = entry['facts']
+        else:
+            self.misses += 1
+            facts = facts_from_bytes(data)
+
+        self.store(key, stat, digest, facts)
+        return facts
+
+    def prefetch(self, paths: List[Path], jobs: int = 1):
+        """Parse every stale script up front across `jobs` worker processes.
+
+        Results are stored in input order; later get() calls are cache hits,
+        so the rule pass that follows stays serial and deterministic.
+        """
+        if jobs == 0:
+            jobs = os.cpu_count() or 1
+        if jobs <= 1:
+            return
+
+        stale = []
+        for path in paths:
+            key = str(path.relative_to(self.root))
+            try:
+                stat = path.stat()
+            except OSError:
+                continue  # get() reports the error
+            entry = self.entries.get(key)
+            if entry and entry['mtime_ns'] == stat.st_mtime_ns and entry['size'] == stat.st_size:
+                continue
+            stale.append((path, key, stat))
+
+        if not stale:
+            return
+
+        # Imported here: the process pool machinery is costly and serial runs never need it
+        from concurrent.futures import ProcessPoolExecutor
+
+        chunksize = max(1, len(stale) // (jobs * 4))
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            results = pool.map(facts_for_path, [str(path) for path, _, _ in stale], chunksize=chunksize)
+            for (path, key, stat), (digest, facts) in zip(stale, results):
+                if digest is None:
+                    continue
+                self.files_read += 1
+                self.bytes_read += stat.st_size
+                self.misses += 1
+                self.store(key, stat, digest, facts)
+
+    def store(self, key: str, stat: os.stat_result, digest: str, facts: Dict):
+        self.entries[key] = {
+            'mtime_ns': stat.st_mtime_ns,
+            'size': stat.st_size,
+            'sha1': digest,
+            'facts': facts,
+        }
+        self.dirty = True
+
+    def save(self, live_keys: Optional[set] = None):
+        """Write the cache atomically, dropping entries for deleted files"""
+        if not self.persistent or not self.dirty:
+            return
+
+        if live_keys is not None:
+            self.entries = {k: v for k, v in self.entries.items() if k in live_keys}
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': FACTS_VERSION, 'files': self.entries}, f, separators=(',', ':'))
+        os.replace(tmp_path, self.path)
+        self.dirty = False
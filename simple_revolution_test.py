@@ -6,14 +6,15 @@ Tests consciousness revolution readiness without full Godot engine startup.
 Validates script structure, Pentagon compliance, and revolution components.
 """
 
-import os
 import re
 from pathlib import Path
 
+from project_root import find_project_root
+
 class SimpleRevolutionValidator:
     def __init__(self, project_root=None):
         if project_root is None:
-            project_root = os.path.dirname(os.path.abspath(__file__))
+            project_root = find_project_root()
         
         self.project_root = Path(project_root)
         self.test_results = {
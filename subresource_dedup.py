@@ -0,0 +1,341 @@
+#!/usr/bin/env python3
+"""
+Universal Being Sub-Resource Deduplicator
+=========================================
+Finds materials, meshes and shapes pasted into many scenes as identical
+inline [sub_resource] blocks, and optionally moves each group into one
+shared .tres that every scene references instead. Godot then loads and
+keeps it once instead of parsing a copy per scene.
+
+    python subresource_dedup.py                       # report only
+    python subresource_dedup.py --extract             # write resources/shared/*.tres
+    python ubtool.py dedup --min-count 3
+
+A sub_resource is identified by its canonical form: its type plus its
+properties sorted by name, with whitespace outside strings dropped,
+ExtResource("id") replaced by the resource's path and SubResource("id")
+by the referenced sub_resource's own hash (ids are local to a scene).
+Scenes are streamed through scene_parser one at a time; only one copy of
+each group's properties is kept.
+
+Only groups that reference no other sub_resource are extracted (a nested
+Sky/Environment chain would need extracting as a whole), and inline
+GDScript is reported but never turned into a .tres.
+"""
+
+import argparse
+import hashlib
+import os
+import re
+import sys
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+from scene_parser import parse_scene
+from script_edits import write_atomic
+
+DEFAULT_SHARED_DIR = 'resources/shared'
+NOT_EXTRACTED_TYPES = {'GDScript'}
+
+_EXT_REF_RE = re.compile(r'ExtResource\(\s*"?([^")\s]+)"?\s*\)')
+_SUB_REF_RE = re.compile(r'SubResource\(\s*"?([^")\s]+)"?\s*\)')
+_STRING_OR_SPACE_RE = re.compile(r'("(?:[^"\\]|\\.)*")|\s+')
+_LOAD_STEPS_RE = re.compile(r'\bload_steps=\d+')
+
+
+def canonical_value(value: str) -> str:
+    """A property value with whitespace outside string literals removed"""
+    return _STRING_OR_SPACE_RE.sub(lambda m: m.group(1) or '', value)
+
+
+def _sized_lines(f, sizes: List[int]) -> Iterator[str]:
+    """Pass lines through while recording each one's size in bytes"""
+    for line in f:
+        sizes.append(len(line.encode('utf-8')))
+        yield line
+
+
+class SubResourceDeduplicator:
+    def __init__(self, index, min_count: int = 2, shared_dir: str = DEFAULT_SHARED_DIR):
+        self.index = index
+        self.root = index.root
+        self.min_count = min_count
+        self.shared_dir = shared_dir.strip('/')
+
+        self.groups: Dict[str, Dict] = {}  # digest -> {'type', 'properties', 'nested', 'occurrences'}
+        self.scenes_scanned = 0
+        self.sub_resources = 0
+
+    def res_path(self, path) -> str:
+        return 'res://' + os.path.relpath(path, self.root).replace(os.sep, '/')
+
+    # ------------------------------------------------------------------
+    # Scanning
+    # ------------------------------------------------------------------
+
+    def scan(self, scene_files: Optional[List] = None):
+        for path in (self.index.scenes() if scene_files is None else scene_files):
+            try:
+                self._scan_scene(path)
+            except (OSError, UnicodeDecodeError) as e:
+                print(f"⚠️ Skipped {self.index.relative(path)}: {e}")
+                continue
+            self.scenes_scanned += 1
+        return self
+
+    def _scan_scene(self, path):
+        scene = self.res_path(path)
+        ext_resources: Dict[str, Tuple[str, str]] = {}  # local ext_resource id -> (type, path)
+        digests: Dict[str, str] = {}    # local sub_resource id -> digest
+        sizes: List[int] = []
+
+        with open(path, 'r', encoding='utf-8') as f:
+            for record in parse_scene(_sized_lines(f, sizes)):
+                if record.kind == 'ext_resource':
+                    ext_resources[record.attrs.get('id')] = (record.attrs.get('type', ''), record.attrs.get('path', ''))
+                elif record.kind == 'sub_resource':
+                    self.sub_resources += 1
+                    digest, nested = self._digest(record, ext_resources, digests)
+                    digests[record.attrs.get('id')] = digest
+                    group = self.groups.get(digest)
+                    if group is None:
+                        group = self.groups[digest] = {
+                            'type': record.attrs.get('type', ''),
+                            'properties': dict(record.properties),
+                            'ext_resources': {ref: ext_resources.get(ref, ('', '')) for ref in self._ext_refs(record)},
+                            'nested': nested,
+                            'occurrences': [],
+                        }
+                    group['occurrences'].append({
+                        'scene': scene,
+                        'id': record.attrs.get('id'),
+                        'line': record.line,
+                        'end_line': record.end_line,
+                        'bytes': sum(sizes[record.line - 1:record.end_line]),
+                    })
+
+    def _digest(self, record, ext_resources: Dict[str, Tuple[str, str]], digests: Dict[str, str]) -> Tuple[str, bool]:
+        nested = False
+
+        def sub_ref(match):
+            nonlocal nested
+            nested = True
+            return f'SubResource(#{digests.get(match.group(1), "?" + match.group(1))})'
+
+        parts = [record.attrs.get('type', '')]
+        for key in sorted(record.properties):
+            value = canonical_value(record.properties[key])
+            value = _EXT_REF_RE.sub(lambda m: f'ExtResource("{ext_resources.get(m.group(1), ("", m.group(1)))[1]}")', value)
+            value = _SUB_REF_RE.sub(sub_ref, value)
+            parts.append(f"{key}={value}")
+        return hashlib.sha1('\n'.join(parts).encode('utf-8')).hexdigest(), nested
+
+    def _ext_refs(self, record) -> List[str]:
+        refs = []
+        for value in record.properties.values():
+            for ref in _EXT_REF_RE.findall(value):
+                if ref not in refs:
+                    refs.append(ref)
+        return refs
+
+    # ------------------------------------------------------------------
+    # Results
+    # ------------------------------------------------------------------
+
+    def duplicates(self) -> List[Dict]:
+        """Groups of identical sub_resources, most scene bytes saved first"""
+        result = []
+        for digest, group in self.groups.items():
+            occurrences = group['occurrences']
+            if len(occurrences) < self.min_count:
+                continue
+            extractable = not group['nested'] and group['type'] not in NOT_EXTRACTED_TYPES
+            scenes = list(dict.fromkeys(o['scene'] for o in occurrences))
+            shared_path = self.shared_path(digest, group['type'])
+            header = self._ext_header(group['type'], shared_path, digest)
+            resource_bytes = len(self._resource_text(group).encode('utf-8'))
+            total = sum(o['bytes'] for o in occurrences)
+            result.append({
+                'digest': digest,
+                'type': group['type'],
+                'count': len(occurrences),
+                'scenes': scenes,
+                'occurrences': occurrences,
+                'bytes': total,
+                # Every copy leaves its scene, which gains one ext_resource line instead ...
+                'bytes_saved': total - len(header.encode('utf-8')) * len(scenes),
+                # ... and the project gains the .tres, parsed once however many scenes load it
+                'disk_bytes_saved': total - len(header.encode('utf-8')) * len(scenes) - resource_bytes,
+                'extractable': extractable,
+                'shared_path': shared_path if extractable else None,
+            })
+        result.sort(key=lambda d: (-d['bytes_saved'], d['type'], d['digest']))
+        return result
+
+    def shared_path(self, digest: str, type_name: str) -> str:
+        return f"res://{self.shared_dir}/{type_name}_{digest[:8]}.tres"
+
+    def _ext_header(self, type_name: str, shared_path: str, digest: str) -> str:
+        return f'[ext_resource type="{type_name}" path="{shared_path}" id="shared_{digest[:8]}"]\n'
+
+    def _resource_text(self, group: Dict) -> str:
+        """The shared .tres: the group's ext_resources renumbered, then its properties"""
+        renumbered = {ref: str(n) for n, ref in enumerate(group['ext_resources'], 1)}
+        lines = [f'[gd_resource type="{group["type"]}" load_steps={len(renumbered) + 1} format=3]\n', '\n']
+        for ref, new_id in renumbered.items():
+            type_name, path = group['ext_resources'][ref]
+            lines.append(f'[ext_resource type="{type_name}" path="{path}" id="{new_id}"]\n')
+        if renumbered:
+            lines.append('\n')
+        lines.append('[resource]\n')
+        for key, value in group['properties'].items():
+            value = _EXT_REF_RE.sub(lambda m: f'ExtResource("{renumbered.get(m.group(1), m.group(1))}")', value)
+            lines.append(f"{key} = {value}\n")
+        return ''.join(lines)
+
+    # ------------------------------------------------------------------
+    # Extraction
+    # ------------------------------------------------------------------
+
+    def extract(self, dry_run: bool = False) -> Dict[str, int]:
+        """Write a shared .tres per extractable group and point its scenes at it"""
+        per_scene: Dict[str, List[Tuple[Dict, Dict]]] = {}
+        written = 0
+        for duplicate in self.duplicates():
+            if not duplicate['extractable'] or duplicate['bytes_saved'] <= 0:
+                continue
+            group = self.groups[duplicate['digest']]
+            target = self.root / duplicate['shared_path'][len('res://'):]
+            text = self._resource_text(group)
+            if target.exists():
+                with open(target, 'r', encoding='utf-8') as f:
+                    if f.read() != text:
+                        print(f"⚠️ {duplicate['shared_path']} exists with other content, group skipped")
+                        continue
+            elif not dry_run:
+                target.parent.mkdir(parents=True, exist_ok=True)
+                write_atomic(target, text)
+                self.index.refresh_file(target)
+            written += 1
+            for occurrence in duplicate['occurrences']:
+                per_scene.setdefault(occurrence['scene'], []).append((duplicate, occurrence))
+
+        removed = 0
+        for scene, items in per_scene.items():
+            removed += len(items)
+            if dry_run:
+                print(f"🧪 Would move {len(items)} sub_resource(s) out of {scene}")
+                continue
+            path = self.root / scene[len('res://'):]
+            write_atomic(path, list(self._rewritten_scene(path, items)))
+            self.index.refresh_file(path)
+            print(f"✅ Moved {len(items)} sub_resource(s) out of {scene}")
+        return {'resources': written, 'scenes': len(per_scene), 'sub_resources': removed}
+
+    def _rewritten_scene(self, path, items: List[Tuple[Dict, Dict]]) -> Iterator[str]:
+        """The scene's lines without the extracted blocks, with ext_resource headers and references swapped in"""
+        drop: Set[int] = set()
+        replacement: Dict[str, str] = {}  # local sub_resource id -> new ext_resource id
+        headers: Dict[str, str] = {}
+        for duplicate, occurrence in items:
+            drop.update(range(occurrence['line'], occurrence['end_line'] + 1))
+            new_id = f"shared_{duplicate['digest'][:8]}"
+            replacement[occurrence['id']] = new_id
+            headers[new_id] = self._ext_header(duplicate['type'], duplicate['shared_path'], duplicate['digest'])
+
+        # Headers go after the last ext_resource (or the file header); the first pass finds it
+        insert_after = 1
+        for record in parse_scene(path):
+            if record.kind == 'ext_resource':
+                insert_after = record.line
+            elif record.kind in ('sub_resource', 'node', 'resource'):
+                break
+        new_headers = ''.join(headers.values())
+        if insert_after == 1:
+            new_headers = '\n' + new_headers
+        load_steps_delta = len(headers) - len(replacement)
+
+        def reference(match):
+            new_id = replacement.get(match.group(1))
+            return f'ExtResource("{new_id}")' if new_id else match.group(0)
+
+        previous_dropped = False
+        with open(path, 'r', encoding='utf-8', newline='') as f:
+            for number, line in enumerate(f, 1):
+                if number in drop:
+                    previous_dropped = True
+                    continue
+                if previous_dropped and not line.strip():
+                    previous_dropped = False  # The blank line that separated a removed block
+                    continue
+                previous_dropped = False
+                if number == 1:
+                    line = _LOAD_STEPS_RE.sub(
+                        lambda m: f"load_steps={int(m.group(0).split('=')[1]) + load_steps_delta}", line)
+                elif 'SubResource' in line:
+                    line = _SUB_REF_RE.sub(reference, line)
+                yield line
+                if number == insert_after:
+                    yield new_headers
+
+
+def print_report(dedup: SubResourceDeduplicator, limit: int = 20):
+    duplicates = dedup.duplicates()
+    print(f"🧬 {dedup.sub_resources} sub_resources in {dedup.scenes_scanned} scenes, "
+          f"{len(duplicates)} duplicated groups")
+    if not duplicates:
+        print("✅ No sub_resource is pasted into more than one place")
+        return
+
+    extractable = [d for d in duplicates if d['extractable'] and d['bytes_saved'] > 0]
+    scene_bytes = sum(d['bytes_saved'] for d in extractable)
+    disk_bytes = sum(d['disk_bytes_saved'] for d in extractable)
+    print(f"💾 Extracting {len(extractable)} group(s) into shared .tres files would remove "
+          f"{scene_bytes / 1024:.1f} KB from the scenes ({disk_bytes / 1024:+.1f} KB on disk, "
+          f"shared .tres included)\n")
+    for duplicate in duplicates[:limit]:
+        note = '' if duplicate['extractable'] else \
+            ('  (references other sub_resources)' if dedup.groups[duplicate['digest']]['nested']
+             else '  (not extracted)')
+        print(f"  {duplicate['type']} x{duplicate['count']} in {len(duplicate['scenes'])} scene(s), "
+              f"{duplicate['bytes_saved']} scene bytes saved{note}")
+        for scene in duplicate['scenes'][:5]:
+            print(f"     {scene}")
+        if len(duplicate['scenes']) > 5:
+            print(f"     ... and {len(duplicate['scenes']) - 5} more")
+    if len(duplicates) > limit:
+        print(f"  ... and {len(duplicates) - limit} more groups")
+
+
+def run(index, min_count: int = 2, shared_dir: str = DEFAULT_SHARED_DIR, extract: bool = False,
+        dry_run: bool = False):
+    dedup = SubResourceDeduplicator(index, min_count, shared_dir).scan()
+    print_report(dedup)
+    if extract or dry_run:
+        result = dedup.extract(dry_run=dry_run)
+        verb = 'Would write' if dry_run else 'Wrote'
+        print(f"\n📦 {verb} {result['resources']} shared resource(s) under res://{dedup.shared_dir}/, "
+              f"replacing {result['sub_resources']} sub_resources in {result['scenes']} scene(s)")
+    return dedup
+
+
+def main(argv=None):
+    from project_index import ProjectIndex
+    from project_root import find_project_root
+
+    parser = argparse.ArgumentParser(description='Find identical inline sub_resources across scenes')
+    parser.add_argument('--root', metavar='PATH', help='Godot project (default: the one holding these tools)')
+    parser.add_argument('--min-count', type=int, default=2, help='Copies before a group is reported (default: 2)')
+    parser.add_argument('--into', default=DEFAULT_SHARED_DIR,
+                        help=f'Project folder for the shared .tres files (default: {DEFAULT_SHARED_DIR})')
+    parser.add_argument('--extract', action='store_true', help='Write the shared .tres files and update the scenes')
+    parser.add_argument('--dry-run', action='store_true', help='List what --extract would change without writing')
+    args = parser.parse_args(argv)
+
+    index = ProjectIndex(find_project_root(args.root))
+    run(index, args.min_count, args.into, args.extract, args.dry_run)
+    index.save_cache()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""
+Universal Being Tool Benchmarks
+===============================
+Generates synthetic projects (see synthetic_project.py) and times every
+tool end to end on them, recording wall time, throughput and peak RSS.
+
+Each tool runs in its own fresh Python process, so import cost is counted
+and one tool's memory never inflates another's peak. Tool output goes to
+/dev/null; only the measurements come back.
+
+Tools measured:
+- PentagonValidator        (validate_pentagon.py)
+- ArchitectureAnalyzer     (analyze_project_architecture.py)
+- UniversalBeingAnalyzer   (analyze_game_scripts.py)
+- LogAnalyzer              (tools/debug_log_analyzer.py)
+- update_paths             (update_paths.py - rewrites files, so it runs last)
+
+Usage:
+    python run_benchmarks.py                          # 1k, 10k and 100k scripts
+    python run_benchmarks.py --sizes 1000 10000 --output bench.json
+    python run_benchmarks.py --baseline bench.json    # exit 1 on regressions
+
+By default the fact cache is removed before every tool (--cache cold);
+--cache warm runs each tool once untimed first, which is what developers
+see on their second run.
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List
+
+BENCHMARK_DIR = Path(__file__).resolve().parent
+REPO_ROOT = BENCHMARK_DIR.parent.parent
+
+DEFAULT_SIZES = [1000, 10000, 100000]
+
+
+def _run_validator(root: Path, jobs: int):
+    from validate_pentagon import PentagonValidator
+    PentagonValidator(root, jobs=jobs).validate_project()
+
+
+def _run_architecture(root: Path, jobs: int):
+    from analyze_project_architecture import ArchitectureAnalyzer
+    ArchitectureAnalyzer(root, jobs=jobs).run_analysis()
+
+
+def _run_script_analyzer(root: Path, jobs: int):
+    from analyze_game_scripts import UniversalBeingAnalyzer
+    UniversalBeingAnalyzer(root, jobs=jobs).analyze_project()
+
+
+def _run_log_analyzer(root: Path, jobs: int):
+    from debug_log_analyzer import LogAnalyzer
+    analyzer = LogAnalyzer()
+    results = analyzer.analyze_file(str(root / 'logs' / 'godot.log'))
+    analyzer.save_cleaned_log(results, str(root / 'logs' / 'godot_cleaned.txt'))
+
+
+def _run_update_paths(root: Path, jobs: int):
+    from update_paths import update_file_paths
+    update_file_paths(root)
+
+
+# Tool name -> runner and the file types it reads (for throughput figures)
+TOOLS = {
+    'PentagonValidator': {'run': _run_validator, 'inputs': ['.gd']},
+    'ArchitectureAnalyzer': {'run': _run_architecture, 'inputs': ['.gd', '.tscn']},
+    'UniversalBeingAnalyzer': {'run': _run_script_analyzer, 'inputs': ['.gd', '.tscn']},
+    'LogAnalyzer': {'run': _run_log_analyzer, 'inputs': ['.log']},
+    'update_paths': {'run': _run_update_paths, 'inputs': ['.gd', '.tscn', '.godot']},
+}
+
+
+def run_child(tool: str, root: str, jobs: int):
+    """Child process entry: run one tool silently and print its measurements as JSON"""
+    sys.path.insert(0, str(REPO_ROOT))
+    sys.path.insert(0, str(REPO_ROOT / 'tools'))
+    from phase_profiler import peak_rss_mb
+
+    started = time.perf_counter()
+    with open(os.devnull, 'w', encoding='utf-8') as devnull, contextlib.redirect_stdout(devnull):
+        TOOLS[tool]['run'](Path(root), jobs)
+    seconds = time.perf_counter() - started
+
+    print(json.dumps({'seconds': round(seconds, 4), 'peak_rss_mb': peak_rss_mb()}))
+
+
+class BenchmarkRunner:
+    def __init__(self, sizes: List[int], tools: List[str], workdir: Path, cache: str = 'cold',
+                 jobs: int = 1, seed: int = 0, keep: bool = False):
+        self.sizes = sizes
+        self.tools = tools
+        self.workdir = workdir
+        self.cache = cache
+        self.jobs = jobs
+        self.seed = seed
+        self.keep = keep
+        self.results = {
+            'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+            'cache': cache,
+            'jobs': jobs,
+            'seed': seed,
+            'runs': [],
+        }
+
+    def run(self) -> Dict:
+        print("⏱️ UNIVERSAL BEING TOOL BENCHMARKS")
+        print("=" * 50)
+
+        for size in self.sizes:
+            self.results['runs'].append(self._run_size(size))
+
+        return self.results
+
+    def _run_size(self, size: int) -> Dict:
+        from synthetic_project import generate_project
+
+        project = self.workdir / f"synthetic_{size}"
+        if project.exists():
+            shutil.rmtree(project)
+
+        print(f"\n🌱 Generating {size} scripts in {project}...")
+        started = time.perf_counter()
+        manifest = generate_project(project, size, self.seed)
+        generate_seconds = time.perf_counter() - started
+        print(f"   {sum(manifest['files'].values())} files in {generate_seconds:.1f}s")
+
+        run = {
+            'size': size,
+            'files': manifest['files'],
+            'bytes': manifest['bytes'],
+            'generate_seconds': round(generate_seconds, 3),
+            'tools': {},
+        }
+
+        for tool in self.tools:
+            run['tools'][tool] = self._measure(tool, project, manifest)
+
+        if not self.keep:
+            shutil.rmtree(project, ignore_errors=True)
+        return run
+
+    def _measure(self, tool: str, project: Path, manifest: Dict) -> Dict:
+        inputs = TOOLS[tool]['inputs']
+        files = sum(manifest['files'].get(suffix, 0) for suffix in inputs)
+        size_bytes = sum(manifest['bytes'].get(suffix, 0) for suffix in inputs)
+
+        if self.cache == 'cold':
+            shutil.rmtree(project / '.ub_cache', ignore_errors=True)
+        elif tool != 'update_paths':
+            self._spawn(tool, project)  # Untimed warm-up run fills the cache
+
+        result = self._spawn(tool, project)
+        if 'error' in result:
+            print(f"   ❌ {tool:24} {result['error']}")
+            return result
+
+        seconds = result['seconds']
+        result.update({
+            'files': files,
+            'bytes': size_bytes,
+            'files_per_second': round(files / seconds, 1) if seconds else None,
+            'mb_per_second': round(size_bytes / (1024 * 1024) / seconds, 2) if seconds else None,
+        })
+        rss = f"{result['peak_rss_mb']:8.1f} MB" if result['peak_rss_mb'] is not None else "       n/a"
+        print(f"   ✅ {tool:24} {seconds:8.2f}s {result['files_per_second'] or 0:9.0f} files/s "
+              f"{result['mb_per_second'] or 0:7.2f} MB/s {rss}")
+        return result
+
+    def _spawn(self, tool: str, project: Path) -> Dict:
+        command = [sys.executable, str(Path(__file__).resolve()),
+                   '--child', tool, str(project), '--jobs', str(self.jobs)]
+        completed = subprocess.run(command, capture_output=True, text=True, encoding='utf-8')
+        if completed.returncode != 0:
+            lines = completed.stderr.strip().splitlines()
+            return {'error': lines[-1] if lines else f"exit code {completed.returncode}"}
+        return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def compare_with_baseline(results: Dict, baseline: Dict, tolerance: float) -> List[str]:
+    """Describe every tool/size whose time or peak RSS grew beyond tolerance"""
+    regressions = []
+    previous = {run['size']: run['tools'] for run in baseline.get('runs', [])}
+
+    for run in results['runs']:
+        old_tools = previous.get(run['size'], {})
+        for tool, new in run['tools'].items():
+            old = old_tools.get(tool)
+            if not old or 'error' in old or 'error' in new:
+                continue
+            for metric in ('seconds', 'peak_rss_mb'):
+                if old.get(metric) and new.get(metric) and new[metric] > old[metric] * (1 + tolerance):
+                    regressions.append(f"{tool} @ {run['size']}: {metric} {old[metric]} -> {new[metric]} "
+                                       f"(+{(new[metric] / old[metric] - 1) * 100:.0f}%)")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark the Universal Being tools on synthetic projects')
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES, metavar='N',
+                        help='Script counts to generate (default: 1000 10000 100000)')
+    parser.add_argument('--tools', nargs='+', choices=list(TOOLS), default=list(TOOLS),
+                        help='Tools to measure (default: all)')
+    parser.add_argument('--output', '-o', default='benchmark_results.json', help='Where to write the JSON results')
+    parser.add_argument('--workdir', help='Where to generate projects (default: a temporary directory)')
+    parser.add_argument('--keep', action='store_true', help='Keep the generated projects')
+    parser.add_argument('--cache', choices=['cold', 'warm'], default='cold',
+                        help='cold: clear .ub_cache before each tool; warm: time a second run')
+    parser.add_argument('--jobs', '-j', type=int, default=1, metavar='N',
+                        help='Worker processes for tools that support --jobs')
+    parser.add_argument('--seed', type=int, default=0, help='Generator seed (default: 0)')
+    parser.add_argument('--baseline', help='Earlier results JSON to compare against')
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help='Allowed slowdown/memory growth versus --baseline (default: 0.25 = 25%%)')
+    parser.add_argument('--child', nargs=2, metavar=('TOOL', 'PROJECT'), help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        run_child(args.child[0], args.child[1], args.jobs)
+        return 0
+
+    # update_paths rewrites files, so it always runs after the read-only tools
+    tools = sorted(args.tools, key=lambda t: t == 'update_paths')
+
+    workdir = Path(args.workdir) if args.workdir else Path(tempfile.mkdtemp(prefix='ub_bench_'))
+    workdir.mkdir(parents=True, exist_ok=True)
+    sys.path.insert(0, str(BENCHMARK_DIR))
+
+    runner = BenchmarkRunner(args.sizes, tools, workdir, cache=args.cache, jobs=args.jobs,
+                             seed=args.seed, keep=args.keep)
+    results = runner.run()
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2)
+    print(f"\n📊 Results saved to: {args.output}")
+
+    if not args.workdir and not args.keep:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare_with_baseline(results, baseline, args.tolerance)
+        if regressions:
+            print(f"\n🚨 {len(regressions)} regression(s) versus {args.baseline}:")
+            for regression in regressions:
+                print(f"   - {regression}")
+            return 1
+        print(f"\n✅ No regressions versus {args.baseline} (tolerance {args.tolerance:.0%})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,428 @@
+#!/usr/bin/env python3
+"""
+Synthetic Universal Being Project Generator
+===========================================
+Builds a Godot 4 project tree of any size that follows the real project
+conventions, so the Python tools can be benchmarked at 1k, 10k or 100k
+scripts without touching the real project.
+
+Generated tree:
+- project.godot with main_scene and the four real autoloads
+- core/UniversalBeing.gd base class and autoloads/*.gd
+- beings/, scripts/, systems/, components/ and core/ scripts that extend
+  UniversalBeing, declare class_name, implement the five pentagon_*
+  methods and preload each other through res:// paths
+- a deterministic share of broken beings (missing super() calls, super()
+  in the wrong place, missing pentagon_sewers, no consciousness_level)
+  and plain helper scripts, so every validator branch does real work
+- a .uid sidecar next to every script
+- one scene per ten scripts, using ExtResource script and PackedScene
+  references, SubResources and signal connections (the scene graph is
+  acyclic, rooted at the main scene)
+- akashic_library/*.ub.zip package folders
+- logs/godot.log with about 20 debug lines per script
+- some references to pre-reorganization paths, so update_paths.py has
+  work to do
+
+The same (size, seed) always produces byte-identical files.
+
+Usage:
+    python synthetic_project.py OUTPUT_DIR --scripts 10000 [--seed 0]
+"""
+
+import argparse
+import random
+from pathlib import Path
+from typing import Dict, List
+
+# Script share per top-level folder and the subfolders used inside it
+LAYOUT = [
+    ('beings', 0.50, ['consciousness', 'ai', 'ui', 'world', 'creatures']),
+    ('scripts', 0.25, ['systems', 'tools', 'tests', 'bridges']),
+    ('systems', 0.10, ['storage', 'input', 'timing', 'performance']),
+    ('components', 0.10, ['actions', 'memory', 'visual']),
+    ('core', 0.05, ['command_system', 'interfaces']),
+]
+
+# Files per leaf folder before another group_NNN folder is started
+FILES_PER_FOLDER = 200
+
+AUTOLOADS = {
+    'SystemBootstrap': 'res://autoloads/SystemBootstrap.gd',
+    'AkashicRecordsSystemSystem': 'res://systems/storage/AkashicRecordsSystem.gd',
+    'GemmaAI': 'res://autoloads/GemmaAI.gd',
+    'UBPrint': 'res://autoloads/UBPrint.gd',
+}
+
+# Paths that update_paths.PATH_UPDATES rewrites
+OLD_PATHS = [
+    'res://core/AkashicRecords.gd',
+    'res://core/ZipPackageManager.gd',
+    'res://core/input_focus_manager.gd',
+    'res://core/MemoryOptimizer.gd',
+    'res://core/ActionComponent.gd',
+]
+
+LOG_TEMPLATES = [
+    "🌟 Universal Being created: {name}",
+    "🧠 {name}: dormant → aware",
+    "🦋 {name} attempting evolution to {other}",
+    "🌊 FloodGates: Being {name} registered",
+    "🌊 FloodGates: Being {name} unregistered",
+    "📚 AkashicRecords: saved {name}",
+    "🔌 Socket connected on {name}",
+    "🎥 Camera focused {name}",
+    "🧬 DNA recorded for {name}",
+    "⚡ Physics collision between {name} and {other}",
+    "🤖 Gemma observed {name}",
+    "🖱️ Left click on {name}",
+    "⚠️ WARNING: {name} consciousness_level out of range",
+    "❌ ERROR: Failed to load res://beings/{other}.gd",
+    "E 0:00:{sec:02d}:{ms:03d}   _ready: Invalid call on {name}",
+    "🖥️ Console: inspect {name}",
+]
+
+_UID_CHARS = 'abcdefghijklmnopqrstuvwxyz0123456789'
+
+
+class SyntheticProjectGenerator:
+    def __init__(self, output_dir, script_count: int, seed: int = 0):
+        self.root = Path(output_dir)
+        self.script_count = script_count
+        self.rng = random.Random(seed)
+        self.scripts: List[Dict] = []  # {'path', 'res', 'class_name', 'uid', 'being'}
+        self.scenes: List[Dict] = []   # {'path', 'res', 'uid'}
+        self.counts: Dict[str, int] = {}
+        self.bytes: Dict[str, int] = {}
+
+    def generate(self) -> Dict:
+        """Write the whole tree and return a manifest of what was written"""
+        self.root.mkdir(parents=True, exist_ok=True)
+
+        self._plan_scripts()
+        self._write_base_scripts()
+        for index, script in enumerate(self.scripts):
+            self._write_script(index, script)
+        self._write_scenes()
+        self._write_packages()
+        self._write_log()
+        self._write_project_file()
+
+        return {
+            'root': str(self.root),
+            'scripts': self.script_count,
+            'scenes': len(self.scenes),
+            'files': dict(sorted(self.counts.items())),
+            'bytes': dict(sorted(self.bytes.items())),
+        }
+
+    # ------------------------------------------------------------------
+
+    def _write(self, relative: str, text: str):
+        path = self.root / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = text.encode('utf-8')
+        path.write_bytes(data)
+
+        suffix = path.suffix or path.name
+        self.counts[suffix] = self.counts.get(suffix, 0) + 1
+        self.bytes[suffix] = self.bytes.get(suffix, 0) + len(data)
+
+    def _uid(self) -> str:
+        return 'uid://' + ''.join(self.rng.choice(_UID_CHARS) for _ in range(13))
+
+    def _plan_scripts(self):
+        """Decide every script's path and class up front so preloads can point anywhere"""
+        for top, share, subfolders in LAYOUT:
+            count = int(round(self.script_count * share))
+            if top == LAYOUT[-1][0]:
+                count = self.script_count - len(self.scripts)  # Absorb rounding
+
+            for i in range(count):
+                subfolder = subfolders[i % len(subfolders)]
+                group = (i // len(subfolders)) // FILES_PER_FOLDER
+                class_name = f"{top.capitalize()}{subfolder.capitalize()}Being{i:06d}"
+                relative = f"{top}/{subfolder}/group_{group:03d}/{class_name}.gd"
+                self.scripts.append({
+                    'path': relative,
+                    'res': f"res://{relative}",
+                    'class_name': class_name,
+                    'uid': self._uid(),
+                    # Roughly one script in eight is a plain helper, not a being
+                    'being': top == 'beings' or self.rng.random() >= 0.125,
+                })
+
+    def _write_base_scripts(self):
+        self._write('core/UniversalBeing.gd', BASE_CLASS)
+        for name, res_path in AUTOLOADS.items():
+            relative = res_path.replace('res://', '')
+            self._write(relative, AUTOLOAD_TEMPLATE.format(name=name))
+            self._write(relative + '.uid', self._uid() + '\n')
+
+    def _write_script(self, index: int, script: Dict):
+        rng = self.rng
+        lines = []
+
+        if not script['being']:
+            lines.append("extends RefCounted")
+            lines.append(f"class_name {script['class_name']}")
+            lines.append("")
+            lines.append(f"## Helper {index} generated for benchmarks")
+            lines.append("")
+            for n in range(rng.randint(3, 8)):
+                lines.append(f"func helper_{n}(value: int) -> int:")
+                lines.append(f"\tvar result := value * {n + 1}")
+                lines.append("\treturn result")
+                lines.append("")
+            self._write(script['path'], '\n'.join(lines))
+            self._write(script['path'] + '.uid', script['uid'] + '\n')
+            return
+
+        flaw = rng.random()
+        neighbours = [self.scripts[rng.randrange(len(self.scripts))] for _ in range(rng.randint(1, 3))]
+
+        lines.append("extends UniversalBeing")
+        lines.append(f"class_name {script['class_name']}")
+        lines.append("")
+        lines.append(f"## Synthetic being {index} generated for benchmarks")
+        lines.append("")
+        for n, other in enumerate(neighbours):
+            lines.append(f'const Neighbour{n} = preload("{other["res"]}")')
+        if rng.random() < 0.1:
+            lines.append(f'const Legacy = preload("{rng.choice(OLD_PATHS)}")')
+        lines.append("")
+        lines.append("signal pulsed(strength: float)")
+        lines.append("")
+        lines.append("@export var energy: float = 1.0")
+        lines.append("var pulse_timer: float = 0.0")
+        lines.append("var memories: Array = []")
+        lines.append("")
+
+        # pentagon_init - 5% forget consciousness_level
+        lines.append("func pentagon_init() -> void:")
+        lines.append("\tsuper.pentagon_init()")
+        lines.append(f'\tbeing_type = "synthetic_{script["path"].split("/")[1]}"')
+        lines.append(f'\tbeing_name = "{script["class_name"]}"')
+        if not 0.30 <= flaw < 0.35:
+            lines.append(f"\tconsciousness_level = {index % 6}")
+        lines.append("")
+
+        lines.append("func pentagon_ready() -> void:")
+        lines.append("\tsuper.pentagon_ready()")
+        lines.append("\tif AkashicRecords:")
+        lines.append("\t\tAkashicRecords.load_being_from_zip(being_name)")
+        lines.append("\tpulsed.connect(_on_pulsed)")
+        lines.append("")
+
+        # pentagon_process - 10% forget super(), 5% call it late
+        lines.append("func pentagon_process(delta: float) -> void:")
+        if flaw < 0.10:
+            lines.append("\tpulse_timer += delta")
+        elif flaw < 0.15:
+            lines.append("\tpulse_timer += delta")
+            lines.append("\tsuper.pentagon_process(delta)")
+        else:
+            lines.append("\tsuper.pentagon_process(delta)")
+            lines.append("\tpulse_timer += delta")
+        lines.append("\tif pulse_timer > 1.0:")
+        lines.append("\t\tpulse_timer = 0.0")
+        lines.append("\t\tpulsed.emit(energy)")
+        lines.append("")
+
+        lines.append("func pentagon_input(event: InputEvent) -> void:")
+        lines.append("\tsuper.pentagon_input(event)")
+        lines.append("\tif event is InputEventMouseButton and event.pressed:")
+        lines.append("\t\t_remember(event)")
+        lines.append("")
+
+        # pentagon_sewers - 5% missing entirely
+        if not 0.15 <= flaw < 0.20:
+            lines.append("func pentagon_sewers() -> void:")
+            lines.append("\tmemories.clear()")
+            lines.append("\tif AkashicRecords:")
+            lines.append("\t\tAkashicRecords.save_being_to_zip(self)")
+            lines.append("\tsuper.pentagon_sewers()")
+            lines.append("")
+
+        lines.append("func _remember(event: InputEvent) -> void:")
+        lines.append("\tmemories.append(event)")
+        lines.append("\tif memories.size() > 32:")
+        lines.append("\t\tmemories.pop_front()")
+        lines.append("")
+        lines.append("func _on_pulsed(strength: float) -> void:")
+        lines.append("\tenergy = clamp(energy + strength * 0.01, 0.0, 10.0)")
+        for n in range(len(neighbours)):
+            lines.append(f"\tvar friend{n} = Neighbour{n}.new()")
+            lines.append(f"\tfriend{n}.queue_free()")
+        lines.append("")
+
+        self._write(script['path'], '\n'.join(lines))
+        self._write(script['path'] + '.uid', script['uid'] + '\n')
+
+    def _write_scenes(self):
+        rng = self.rng
+        scene_count = max(1, self.script_count // 10)
+        self.scenes = [{
+            'path': f"scenes/synthetic/group_{i // FILES_PER_FOLDER:03d}/scene_{i:06d}.tscn",
+            'uid': self._uid(),
+        } for i in range(scene_count)]
+        self.scenes[0]['path'] = 'scenes/synthetic/main.tscn'
+        for scene in self.scenes:
+            scene['res'] = f"res://{scene['path']}"
+
+        for i, scene in enumerate(self.scenes):
+            scripts = [self.scripts[rng.randrange(len(self.scripts))] for _ in range(rng.randint(1, 4))]
+            # Only instance later scenes, which keeps the scene graph acyclic
+            later = range(i + 1, scene_count)
+            children = [self.scenes[j] for j in rng.sample(later, min(len(later), rng.randint(0, 3)))]
+
+            ext = []
+            for n, script in enumerate(scripts, 1):
+                ext.append((f"{n}_s{i % 1000:03d}", 'Script', script['uid'], script['res']))
+            for n, child in enumerate(children, len(scripts) + 1):
+                ext.append((f"{n}_p{i % 1000:03d}", 'PackedScene', child['uid'], child['res']))
+            if rng.random() < 0.05:
+                ext.append((f"{len(ext) + 1}_legacy", 'Script', self._uid(), rng.choice(OLD_PATHS)))
+
+            out = [f'[gd_scene load_steps={len(ext) + 2} format=3 uid="{scene["uid"]}"]', ""]
+            for ext_id, kind, uid, path in ext:
+                out.append(f'[ext_resource type="{kind}" uid="{uid}" path="{path}" id="{ext_id}"]')
+            out.append("")
+            out.append('[sub_resource type="StandardMaterial3D" id="StandardMaterial3D_glow"]')
+            out.append(f"albedo_color = Color({rng.random():.3f}, {rng.random():.3f}, 1, 1)")
+            out.append("emission_enabled = true")
+            out.append("")
+            out.append('[sub_resource type="SphereMesh" id="SphereMesh_core"]')
+            out.append('material = SubResource("StandardMaterial3D_glow")')
+            out.append("")
+            out.append(f'[node name="Scene{i}" type="Node3D"]')
+            out.append(f'script = ExtResource("{ext[0][0]}")')
+            out.append("")
+            out.append('[node name="Core" type="MeshInstance3D" parent="."]')
+            out.append('mesh = SubResource("SphereMesh_core")')
+            out.append("")
+            for n, (ext_id, kind, _, _) in enumerate(ext[1:], 1):
+                if kind == 'Script':
+                    out.append(f'[node name="Being{n}" type="Node3D" parent="."]')
+                    out.append(f'script = ExtResource("{ext_id}")')
+                else:
+                    out.append(f'[node name="Instance{n}" parent="." instance=ExtResource("{ext_id}")]')
+                out.append("")
+            out.append('[connection signal="pulsed" from="." to="Core" method="_on_pulsed"]')
+            out.append("")
+
+            self._write(scene['path'], '\n'.join(out))
+
+    def _write_packages(self):
+        for i in range(max(1, self.script_count // 100)):
+            package = f"akashic_library/beings/being_{i:05d}.ub.zip"
+            self._write(f"{package}/manifest.json",
+                        f'{{"name": "being_{i:05d}", "version": "1.0.0", "type": "synthetic"}}\n')
+
+    def _write_log(self):
+        rng = self.rng
+        names = [s['class_name'] for s in self.scripts]
+        lines = []
+        for n in range(self.script_count * 20):
+            template = LOG_TEMPLATES[rng.randrange(len(LOG_TEMPLATES))]
+            lines.append(template.format(name=rng.choice(names), other=rng.choice(names),
+                                         sec=n % 60, ms=n % 1000))
+        self._write('logs/godot.log', '\n'.join(lines) + '\n')
+
+    def _write_project_file(self):
+        autoloads = '\n'.join(f'{name}="*{path}"' for name, path in AUTOLOADS.items())
+        self._write('project.godot', PROJECT_TEMPLATE.format(main_scene=self.scenes[0]['res'],
+                                                             autoloads=autoloads))
+
+
+def generate_project(output_dir, script_count: int, seed: int = 0) -> Dict:
+    """Generate a synthetic project and return its manifest"""
+    return SyntheticProjectGenerator(output_dir, script_count, seed).generate()
+
+
+PROJECT_TEMPLATE = """; Engine configuration file.
+; Synthetic Universal Being project generated for benchmarks.
+
+config_version=5
+
+[application]
+
+config/name="Synthetic Universal Being"
+run/main_scene="{main_scene}"
+config/features=PackedStringArray("4.4", "Forward Plus")
+
+[autoload]
+
+{autoloads}
+
+[input]
+
+toggle_console={{
+"deadzone": 0.5,
+"events": []
+}}
+"""
+
+BASE_CLASS = """extends Node3D
+class_name UniversalBeing
+
+## Base class for every Universal Being (synthetic benchmark copy)
+
+var being_type: String = "base"
+var being_name: String = "Universal Being"
+var consciousness_level: int = 0
+
+func _init() -> void:
+\tpentagon_init()
+
+func _ready() -> void:
+\tpentagon_ready()
+
+func _process(delta: float) -> void:
+\tpentagon_process(delta)
+
+func _input(event: InputEvent) -> void:
+\tpentagon_input(event)
+
+func pentagon_init() -> void:
+\tpass
+
+func pentagon_ready() -> void:
+\tpass
+
+func pentagon_process(delta: float) -> void:
+\tpass
+
+func pentagon_input(event: InputEvent) -> void:
+\tpass
+
+func pentagon_sewers() -> void:
+\tpass
+"""
+
+AUTOLOAD_TEMPLATE = """extends Node
+
+## {name} autoload (synthetic benchmark copy)
+
+signal system_ready
+
+func _ready() -> void:
+\tsystem_ready.emit()
+"""
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate a synthetic Universal Being project')
+    parser.add_argument('output', help='Directory to generate the project in')
+    parser.add_argument('--scripts', type=int, default=1000, help='Number of .gd scripts (default: 1000)')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed (default: 0)')
+    args = parser.parse_args()
+
+    manifest = generate_project(args.output, args.scripts, args.seed)
+    print(f"🌱 Generated {manifest['scripts']} scripts and {manifest['scenes']} scenes in {manifest['root']}")
+    for suffix, count in manifest['files'].items():
+        print(f"   {suffix:10} {count:7} files  {manifest['bytes'][suffix] / 1024:10.1f} KB")
+
+
+if __name__ == "__main__":
+    main()
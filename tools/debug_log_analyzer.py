@@ -125,14 +125,14 @@ class LogAnalyzer:
         
         print(f"📁 Category report saved to: {output_path}")
 
-def main():
+def main(argv=None):
     parser = argparse.ArgumentParser(description='Analyze Universal Being debug logs')
     parser.add_argument('input_file', help='Input log file path')
     parser.add_argument('--output', '-o', help='Output file for cleaned log')
     parser.add_argument('--category', '-c', help='Filter by category (error, warning, state_change, etc.)')
     parser.add_argument('--report', '-r', help='Generate category report file')
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     if not Path(args.input_file).exists():
         print(f"❌ File not found: {args.input_file}")
@@ -4,11 +4,16 @@ MCP GDScript Validator
 Uses the existing Godot MCP server to validate GDScript files
 without opening new Godot instances
 """
+import argparse
 import json
 import tempfile
 import os
 import subprocess
 import sys
+from pathlib import Path
+
+# The shared project tools (project_index.py, git_changes.py) live one level up
+TOOLKIT_DIR = Path(__file__).resolve().parent.parent
 
 def validate_gdscript_with_mcp(gdscript_content, source_name="test.gd"):
     """
@@ -136,6 +141,33 @@ def check_universal_being_files():
     
     return results
 
+def check_changed_files(ref):
+    """Validate the scripts changed since a git ref, plus scripts inheriting from them"""
+    from git_changes import changed_scripts
+    from project_index import ProjectIndex
+    from project_root import find_project_root
+    
+    index = ProjectIndex(find_project_root())
+    scope = sorted(changed_scripts(index, ref))
+    print(f"🌿 {len(scope)} script(s) changed since {ref} (subclasses included)")
+    
+    results = {}
+    for path in scope:
+        file_path = index.relative(path)
+        print(f"\n📄 Checking: {file_path}")
+        result = validate_file(str(path))
+        if result:
+            results[file_path] = result
+    
+    total_warnings = sum(len(r.get("warnings", [])) for r in results.values())
+    total_errors = sum(len(r.get("errors", [])) for r in results.values())
+    print(f"\n📊 Validation Summary:")
+    print(f"   Files checked: {len(results)}")
+    print(f"   Total warnings: {total_warnings}")
+    print(f"   Total errors: {total_errors}")
+    
+    return results
+
 def test_remote_connection():
     """Test if we can connect to the remote Godot via MCP"""
     print("🔗 Testing remote Godot connection...")
@@ -158,6 +190,12 @@ def test_remote_connection():
         return False
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Validate GDScript files through the Godot MCP setup')
+    parser.add_argument('file', nargs='?', help='Validate one file (default: a set of Universal Being files)')
+    parser.add_argument('--changed-since', metavar='REF',
+                        help='Validate the scripts changed since a git ref (and scripts inheriting from them)')
+    args = parser.parse_args()
+    
     print("🔍 MCP GDScript Validator")
     print("=" * 40)
     
@@ -165,9 +203,17 @@ if __name__ == "__main__":
     if not test_remote_connection():
         print("⚠️  MCP connection test failed - proceeding with basic validation")
     
-    if len(sys.argv) > 1:
+    if args.changed_since:
+        sys.path.insert(0, str(TOOLKIT_DIR))
+        from git_changes import GitScopeError
+        try:
+            results = check_changed_files(args.changed_since)
+        except GitScopeError as e:
+            parser.error(f"--changed-since: {e}")
+        sys.exit(1 if any(r.get("errors") for r in results.values()) else 0)
+    elif args.file:
         # Validate specific file
-        file_path = sys.argv[1]
+        file_path = args.file
         validate_file(file_path)
     else:
         # Check Universal Being files
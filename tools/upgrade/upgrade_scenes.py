@@ -1,33 +1,19 @@
 #!/usr/bin/env python3
-"""Upgrade .tscn and .tres files for Godot 4 compatibility."""
+"""Upgrade .tscn and .tres files for Godot 4 compatibility.
+
+Thin wrapper around the toolkit's upgrade_scenes.py, which rewrites only
+section type attributes and empty __meta__ properties via scene_parser.
+"""
 import argparse
-import re
+import sys
 from pathlib import Path
 
-NODE_REPLACEMENTS = {
-    'KinematicBody2D': 'CharacterBody2D',
-    'KinematicBody': 'CharacterBody3D',
-    'Spatial': 'Node3D',
-    'Area ': 'Area3D ',
-}
-
-META_PATTERN = re.compile(r'\n__meta__ = \{[^\}]*\}\n', re.MULTILINE)
-
-
-def upgrade_text(text: str) -> str:
-    for old, new in NODE_REPLACEMENTS.items():
-        text = text.replace(old, new)
-    text = META_PATTERN.sub('\n', text)
-    return text
+TOOLKIT_DIR = Path(__file__).resolve().parent.parent.parent
 
 
 def upgrade_file(path: Path) -> bool:
-    original = path.read_text(encoding='utf-8')
-    updated = upgrade_text(original)
-    if updated != original:
-        path.write_text(updated, encoding='utf-8')
-        return True
-    return False
+    from upgrade_scenes import process_file
+    return process_file(path)
 
 
 def main(root: str):
@@ -40,6 +26,7 @@ def main(root: str):
     print(f"Processed {len(files)} scene/resource files, upgraded {changed}.")
 
 if __name__ == '__main__':
+    sys.path.insert(0, str(TOOLKIT_DIR))
     parser = argparse.ArgumentParser(description='Upgrade scenes and resources')
     parser.add_argument('--root', default='.', help='Project root')
     args = parser.parse_args()
@@ -0,0 +1,499 @@
+#!/usr/bin/env python3
+"""
+Universal Being Tool
+====================
+One entry point for the project tools, with chainable subcommands.
+
+    python ubtool.py validate analyze report
+    python ubtool.py --jobs 0 validate --watch
+    python ubtool.py --root ../OtherProject scripts
+    python ubtool.py logs godot.log --category error
+
+Each subcommand imports its tool module only when it runs, so startup
+stays cheap no matter how many tools exist. Chained subcommands share a
+single ProjectIndex (one project walk, one fact cache); a subcommand
+that moves or rewrites files drops the index so the next one re-walks.
+
+Global options (--root, --jobs, --no-cache, --profile) go before the first
+subcommand; each subcommand's own options follow its name.
+
+Every subcommand in the chain runs; ubtool exits with the worst status any
+of them returned, so a failing check still fails the whole invocation.
+"""
+
+import argparse
+import sys
+import time
+
+from project_root import TOOLKIT_DIR, find_project_root
+
+
+class ToolContext:
+    """State shared by every subcommand in one ubtool invocation"""
+
+    def __init__(self, root, jobs: int = 1, use_cache: bool = True, profile: bool = False,
+                 profile_dump: str = None):
+        self.root = root
+        self.jobs = jobs
+        self.use_cache = use_cache
+        self.profile = profile
+        self.profile_dump = profile_dump
+        self.walks = 0
+        self._index = None
+
+    @property
+    def index(self):
+        """The shared ProjectIndex, built on first use"""
+        if self._index is None:
+            from project_index import ProjectIndex
+            self._index = ProjectIndex(self.root, use_cache=self.use_cache)
+            self.walks += 1
+        return self._index
+
+    def profiler(self, tool: str):
+        """A PhaseProfiler for one subcommand; the project walk is its first phase"""
+        from phase_profiler import PhaseProfiler
+        profiler = PhaseProfiler(self.profile, self.profile_dump, tool=tool)
+        if self._index is None:
+            with profiler.phase('project_index_walk'):
+                self.index
+        return profiler
+
+    def invalidate(self):
+        """Forget the index after a subcommand changed the tree on disk"""
+        self._index = None
+
+
+# ----------------------------------------------------------------------
+# Subcommands - every import happens inside the runner
+# ----------------------------------------------------------------------
+
+def changed_scope(ctx: ToolContext, args):
+    """--changed-since: the scripts to limit a subcommand to, or None for the whole project"""
+    if not args.changed_since:
+        return None
+    from git_changes import GitScopeError, changed_scripts
+    try:
+        scope = changed_scripts(ctx.index, args.changed_since, ctx.jobs)
+    except GitScopeError as e:
+        sys.exit(f"❌ --changed-since: {e}")
+    print(f"🌿 {len(scope)} script(s) changed since {args.changed_since} (subclasses included)")
+    return scope
+
+
+def run_validate(ctx: ToolContext, args):
+    from validate_pentagon import PentagonValidator
+    from validation_output import open_streams
+    profiler = ctx.profiler('PentagonValidator')
+    only_files = changed_scope(ctx, args)
+    streams = open_streams(args.jsonl, args.sarif)
+    validator = PentagonValidator(ctx.root, index=ctx.index, jobs=ctx.jobs, profiler=profiler, streams=streams,
+                                  only_files=only_files, changed_since=args.changed_since)
+    try:
+        if args.watch:
+            validator.watch(force_polling=args.poll, interval=args.interval)
+        else:
+            validator.validate_project()
+    finally:
+        streams.close()
+    # Same as validate_pentagon.py: violations in the changed scripts fail the run
+    return 1 if only_files is not None and validator.violations else 0
+
+
+def run_analyze(ctx: ToolContext, args):
+    from analyze_project_architecture import ArchitectureAnalyzer
+    profiler = ctx.profiler('ArchitectureAnalyzer')
+    analyzer = ArchitectureAnalyzer(ctx.root, index=ctx.index, jobs=ctx.jobs, profiler=profiler,
+                                    compact_json=args.compact_json, record_history=not args.no_history)
+    if args.since:
+        delta = analyzer.run_delta(args.since, args.delta_output)
+        # Same as the standalone analyzer: new violations fail the run
+        return 1 if delta["new_violations"] else 0
+    analyzer.run_analysis()
+
+
+def run_scripts(ctx: ToolContext, args):
+    from analyze_game_scripts import UniversalBeingAnalyzer
+    profiler = ctx.profiler('UniversalBeingAnalyzer')
+    analyzer = UniversalBeingAnalyzer(ctx.root, index=ctx.index, jobs=ctx.jobs, profiler=profiler)
+    if args.who_calls or args.reaches or args.scene_deps or args.dead_code:
+        if args.who_calls:
+            analyzer.print_who_calls(args.who_calls)
+        if args.reaches:
+            analyzer.print_reaches(args.reaches)
+        if args.scene_deps:
+            analyzer.print_scene_deps(args.scene_deps)
+        if args.dead_code:
+            analyzer.print_dead_code()
+    else:
+        analyzer.analyze_project()
+
+
+def run_report(ctx: ToolContext, args):
+    from fix_pentagon_compliance import PentagonComplianceRecovery
+    recovery = PentagonComplianceRecovery(ctx.root, index=ctx.index, jobs=ctx.jobs)
+    recovery.diagnose_compliance_issues()
+    recovery.generate_compliance_report()
+
+
+def run_fix(ctx: ToolContext, args):
+    from fix_pentagon_compliance import PentagonComplianceRecovery
+    profiler = ctx.profiler('PentagonComplianceRecovery')
+    PentagonComplianceRecovery(ctx.root, index=ctx.index, jobs=ctx.jobs, profiler=profiler,
+                               only_files=changed_scope(ctx, args), dry_run=args.dry_run).run_recovery()
+
+
+def run_clean(ctx: ToolContext, args):
+    from clean_project import UniversalBeingCleaner
+    UniversalBeingCleaner(ctx.root).run_cleanup()
+
+
+def run_clean_docs(ctx: ToolContext, args):
+    from clean_docs import DocsOrganizer
+    DocsOrganizer(ctx.root).organize_docs()
+
+
+def run_clean_scripts(ctx: ToolContext, args):
+    from clean_scripts_folder import ScriptsCleaner
+    ScriptsCleaner(ctx.root).run_cleanup()
+
+
+def run_update_paths(ctx: ToolContext, args):
+    from update_paths import update_file_paths
+    updated_files = update_file_paths(ctx.root, index=ctx.index)
+    print(f"✅ COMPLETE: Updated {len(updated_files)} files")
+
+
+def run_fix_akashic(ctx: ToolContext, args):
+    from fix_akashic_references import fix_akashic_references
+    updated_files = fix_akashic_references(ctx.root)
+    print(f"✅ COMPLETE: Fixed {len(updated_files)} files")
+
+
+def run_upgrade_scenes(ctx: ToolContext, args):
+    from upgrade_scenes import process_file
+    targets = ctx.index.scenes() + ctx.index.resources()
+    updated = sum(process_file(f, dry=args.dry) for f in targets)
+    print(f"\n=== Summary: {updated}/{len(targets)} resources patched ===")
+
+
+def run_repair(ctx: ToolContext, args):
+    from complete_emergency_repair import CompleteEmergencyRepair
+    CompleteEmergencyRepair(ctx.root).run_complete_repair()
+
+
+def run_logs(ctx: ToolContext, args):
+    sys.path.insert(0, str(TOOLKIT_DIR / 'tools'))
+    from debug_log_analyzer import main as analyze_logs
+    return analyze_logs(args.argv)
+
+
+def run_scene_profile(ctx: ToolContext, args):
+    from scene_profiler import parse_budgets, run
+    try:
+        budgets = parse_budgets(args.budget, defaults=not args.no_default_budgets)
+    except ValueError as e:
+        # A usage error, like parser.error in scene_profiler.py - 1 means over budget
+        print(f"❌ --budget: {e}", file=sys.stderr)
+        return 2
+    return run(ctx.index, args.scenes, budgets, args.directory, args.top, args.json)
+
+
+def run_dedup(ctx: ToolContext, args):
+    from subresource_dedup import run
+    run(ctx.index, args.min_count, args.into, args.extract, args.dry_run)
+    ctx.index.save_cache()
+
+
+def run_uids(ctx: ToolContext, args):
+    from uid_index import print_report
+    uids = ctx.index.uid_index
+    if args.uid:
+        print(uids.path_of(args.uid) or f"❓ {args.uid} is not declared by any existing file")
+    elif args.path:
+        print(uids.uid_of(args.path) or f"❓ {args.path} has no uid")
+    else:
+        print_report(uids)
+    uids.save()
+
+
+def run_history(ctx: ToolContext, args):
+    from metrics_history import main as query_history
+    return query_history(['--root', str(ctx.root)] + args.argv)
+
+
+def run_bench(ctx: ToolContext, args):
+    sys.path.insert(0, str(TOOLKIT_DIR / 'tools' / 'benchmark'))
+    from run_benchmarks import main as run_benchmarks
+    return run_benchmarks(args.argv)
+
+
+# name -> help, runner, options, whether it changes files on disk.
+# A runner returns its exit status; returning nothing counts as success.
+# 'passthrough' subcommands hand their arguments to the tool's own parser.
+COMMANDS = {
+    'validate': {
+        'help': 'Pentagon Architecture validation (validate_pentagon.py)',
+        'run': run_validate,
+        'options': [
+            (('--watch',), {'action': 'store_true', 'help': 'Keep re-validating scripts as they change'}),
+            (('--poll',), {'action': 'store_true', 'help': 'Watch by polling instead of inotify'}),
+            (('--interval',), {'type': float, 'default': 1.0, 'metavar': 'SECONDS',
+                               'help': 'Polling interval for --watch --poll'}),
+            (('--jsonl',), {'metavar': 'PATH', 'help': 'Stream every violation to PATH as JSON lines'}),
+            (('--sarif',), {'metavar': 'PATH', 'help': 'Stream every violation to PATH as a SARIF 2.1.0 log'}),
+            (('--changed-since',), {'metavar': 'REF',
+                                    'help': 'Only validate scripts changed since a git ref (and their subclasses)'}),
+        ],
+        'modifies': False,
+    },
+    'analyze': {
+        'help': 'Architecture analysis (analyze_project_architecture.py)',
+        'run': run_analyze,
+        'options': [
+            (('--compact-json',), {'action': 'store_true',
+                                   'help': 'Write architecture_analysis.json without indentation'}),
+            (('--no-history',), {'action': 'store_true',
+                                 'help': 'Do not record this run in the metrics history (ub_history.sqlite)'}),
+            (('--since',), {'metavar': 'SNAPSHOT',
+                            'help': 'Only re-analyze scripts changed since an earlier architecture_analysis.json'}),
+            (('--delta-output',), {'metavar': 'PATH',
+                                   'help': 'Where --since writes its delta (default: architecture_delta.json)'}),
+        ],
+        'modifies': False,
+    },
+    'scripts': {
+        'help': 'Script/scene/autoload map (analyze_game_scripts.py)',
+        'run': run_scripts,
+        'options': [
+            (('--who-calls',), {'metavar': 'SYMBOL',
+                                'help': 'Only list the callers of a function (Autoload.func, path.gd:func, ...)'}),
+            (('--reaches',), {'metavar': 'SYMBOL',
+                              'help': 'Only list every function transitively called from a function'}),
+            (('--scene-deps',), {'metavar': 'SCENE',
+                                 'help': 'Only list everything a scene transitively loads, in load order'}),
+            (('--dead-code',), {'action': 'store_true',
+                                'help': 'Only list the scripts, scenes and resources the game can never load'}),
+        ],
+        'modifies': False,
+    },
+    'report': {
+        'help': 'Pentagon compliance diagnosis report, no fixes (fix_pentagon_compliance.py)',
+        'run': run_report,
+        'modifies': False,
+    },
+    'fix': {
+        'help': 'Diagnose and fix Pentagon compliance issues (fix_pentagon_compliance.py)',
+        'run': run_fix,
+        'options': [
+            (('--changed-since',), {'metavar': 'REF',
+                                    'help': 'Only diagnose and fix scripts changed since a git ref (and their subclasses)'}),
+            (('--dry-run',), {'action': 'store_true',
+                              'help': 'Print the fixes as a unified diff without writing any file'}),
+        ],
+        'modifies': True,
+    },
+    'clean': {
+        'help': 'Reorganize the project structure (clean_project.py)',
+        'run': run_clean,
+        'modifies': True,
+    },
+    'clean-docs': {
+        'help': 'Organize the docs/ folder (clean_docs.py)',
+        'run': run_clean_docs,
+        'modifies': True,
+    },
+    'clean-scripts': {
+        'help': 'Organize the scripts/ folder (clean_scripts_folder.py)',
+        'run': run_clean_scripts,
+        'modifies': True,
+    },
+    'update-paths': {
+        'help': 'Rewrite res:// paths and uid:// references after the reorganization (update_paths.py)',
+        'run': run_update_paths,
+        'modifies': True,
+    },
+    'fix-akashic': {
+        'help': 'Fix AkashicRecordsSystemSystem references (fix_akashic_references.py)',
+        'run': run_fix_akashic,
+        'modifies': True,
+    },
+    'upgrade-scenes': {
+        'help': 'Migrate .tscn/.tres resources for Godot 4.4 (upgrade_scenes.py)',
+        'run': run_upgrade_scenes,
+        'options': [
+            (('--dry',), {'action': 'store_true', 'help': 'Report what would change without writing'}),
+        ],
+        'modifies': True,
+    },
+    'repair': {
+        'help': 'Complete emergency repair (complete_emergency_repair.py)',
+        'run': run_repair,
+        'modifies': True,
+    },
+    'scenes': {
+        'help': 'Scene complexity and load-cost ranking with budgets (scene_profiler.py)',
+        'run': run_scene_profile,
+        'options': [
+            (('scenes',), {'nargs': '*', 'help': 'Scenes to profile (default: every scene under --directory)'}),
+            (('--directory',), {'default': 'scenes', 'help': 'Project folder to profile (default: scenes)'}),
+            (('--budget',), {'action': 'append', 'default': [], 'metavar': 'METRIC=VALUE',
+                             'help': 'Cap a metric (tree_nodes, load_kb, ...); repeatable'}),
+            (('--no-default-budgets',), {'action': 'store_true',
+                                         'help': 'Only apply the --budget caps given on the command line'}),
+            (('--top',), {'type': int, 'default': 15, 'help': 'Rows in the ranking (default: 15)'}),
+            (('--json',), {'action': 'store_true', 'help': 'Print every profile as JSON instead'}),
+        ],
+        'modifies': False,
+    },
+    'dedup': {
+        'help': 'Find identical inline sub_resources across scenes, optionally share them (subresource_dedup.py)',
+        'run': run_dedup,
+        'options': [
+            (('--min-count',), {'type': int, 'default': 2, 'help': 'Copies before a group is reported (default: 2)'}),
+            (('--into',), {'default': 'resources/shared',
+                           'help': 'Project folder for the shared .tres files (default: resources/shared)'}),
+            (('--extract',), {'action': 'store_true', 'help': 'Write the shared .tres files and update the scenes'}),
+            (('--dry-run',), {'action': 'store_true', 'help': 'List what --extract would change without writing'}),
+        ],
+        'modifies': True,
+    },
+    'uids': {
+        'help': 'uid:// index: duplicate uids, orphaned sidecars, stale references (uid_index.py)',
+        'run': run_uids,
+        'options': [
+            (('--uid',), {'metavar': 'UID', 'help': 'Only print the file a uid:// resolves to'}),
+            (('--path',), {'metavar': 'RES_PATH', 'help': 'Only print the uid of a res:// path'}),
+        ],
+        'modifies': False,
+    },
+    'logs': {
+        'help': 'Analyze a Godot debug log (tools/debug_log_analyzer.py; takes its options)',
+        'run': run_logs,
+        'passthrough': True,
+        'modifies': False,
+    },
+    'history': {
+        'help': 'Trends and regressions from the metrics history (metrics_history.py; takes its options)',
+        'run': run_history,
+        'passthrough': True,
+        'modifies': False,
+    },
+    'bench': {
+        'help': 'Benchmark the tools on synthetic projects (tools/benchmark/run_benchmarks.py; takes its options)',
+        'run': run_bench,
+        'passthrough': True,
+        'modifies': False,
+    },
+}
+
+
+_FLAG_ACTIONS = {'store_true', 'store_false', 'store_const', 'count', 'help', 'version'}
+
+
+def value_options(options) -> set:
+    """Option strings that take a value, from (flags, kwargs) option specs"""
+    return {flag for flags, kwargs in options if kwargs.get('action') not in _FLAG_ACTIONS
+            for flag in flags if flag.startswith('-')}
+
+
+def split_chain(argv):
+    """Split argv into global options and (command, arguments) groups.
+
+    A command name only starts a new command where it is not the value of
+    the preceding option (`scenes --directory scenes`, `--root scripts`).
+    Passthrough commands' options are unknown, so any command name ends them.
+    """
+    global_args = []
+    chain = []
+    takes_value = value_options(GLOBAL_OPTIONS)
+    expect_value = False
+    for token in argv:
+        if expect_value:
+            expect_value = False
+        elif token in COMMANDS:
+            chain.append((token, []))
+            takes_value = value_options(COMMANDS[token].get('options', []))
+            continue
+        else:
+            expect_value = token in takes_value
+        (chain[-1][1] if chain else global_args).append(token)
+    return global_args, chain
+
+
+def parse_command_args(name: str, argv):
+    spec = COMMANDS[name]
+    if spec.get('passthrough'):
+        return argparse.Namespace(argv=argv)
+
+    parser = argparse.ArgumentParser(prog=f"ubtool {name}", description=spec['help'])
+    for flags, kwargs in spec.get('options', []):
+        parser.add_argument(*flags, **kwargs)
+    return parser.parse_args(argv)
+
+
+GLOBAL_OPTIONS = [
+    (('--root',), {'metavar': 'PATH',
+                   'help': 'Godot project to work on (default: UB_PROJECT_ROOT or the project holding these tools)'}),
+    (('--jobs', '-j'), {'type': int, 'default': 1, 'metavar': 'N',
+                        'help': 'Parse scripts across N worker processes (0 = one per CPU core)'}),
+    (('--no-cache',), {'action': 'store_true',
+                       'help': 'Re-parse every script instead of using .ub_cache/script_facts.json'}),
+    (('--profile',), {'action': 'store_true',
+                      'help': 'Record per-phase time, files, bytes read and peak memory for each command'}),
+    (('--profile-dump',), {'metavar': 'DIR',
+                           'help': 'Also write a cProfile .pstats dump per phase into DIR (implies --profile)'}),
+]
+
+
+def build_parser() -> argparse.ArgumentParser:
+    width = max(len(name) for name in COMMANDS)
+    commands = '\n'.join(f"  {name:<{width}}  {spec['help']}" for name, spec in COMMANDS.items())
+    parser = argparse.ArgumentParser(
+        prog='ubtool',
+        usage='ubtool [--root PATH] [--jobs N] [--no-cache] [--profile] COMMAND [options] [COMMAND [options] ...]',
+        description='Universal Being project tools. Chained commands share one project index.',
+        epilog=f"commands:\n{commands}\n\nRun 'ubtool COMMAND --help' for a command's options.",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    for flags, kwargs in GLOBAL_OPTIONS:
+        parser.add_argument(*flags, **kwargs)
+    return parser
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    global_args, chain = split_chain(argv)
+
+    parser = build_parser()
+    args = parser.parse_args(global_args)
+    if not chain:
+        parser.print_help()
+        return 2
+
+    # Parse every command's options up front so a typo fails before anything runs
+    steps = [(name, parse_command_args(name, command_argv)) for name, command_argv in chain]
+
+    ctx = ToolContext(find_project_root(args.root), jobs=args.jobs, use_cache=not args.no_cache,
+                      profile=args.profile, profile_dump=args.profile_dump)
+    timings = []
+    status = 0
+
+    for name, command_args in steps:
+        spec = COMMANDS[name]
+        started = time.perf_counter()
+        status = max(status, spec['run'](ctx, command_args) or 0)
+        timings.append((name, time.perf_counter() - started))
+        if spec['modifies']:
+            ctx.invalidate()
+
+    if len(steps) > 1:
+        print("\n⏱️ UBTOOL CHAIN")
+        for name, seconds in timings:
+            print(f"   {name:<16} {seconds:6.2f}s")
+        print(f"   project walks: {ctx.walks}")
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,364 @@
+#!/usr/bin/env python3
+"""
+Universal Being UID Index
+=========================
+uid:// <-> res:// index over the whole project, kept on disk under
+.ub_cache/ and refreshed incrementally.
+
+Godot 4 gives every resource a uid and scenes reference resources by uid
+first, falling back to the path only when the uid is unknown. The uid of
+a file is declared by:
+- its .uid sidecar (x.gd.uid, x.gdshader.uid)
+- its .import file's [remap] uid (textures, models, sounds)
+- its own [gd_scene uid=...] / [gd_resource uid=...] header
+
+and every [ext_resource uid="..." path="..."] header references one.
+
+    uids = index.uid_index
+    uids.path_of('uid://daibvehc2ae5p')   # 'res://components/ActionComponent.gd'
+    uids.uid_of('res://components/ActionComponent.gd')
+    uids.stale(), uids.duplicates()
+
+Each source file is stored with its mtime/size, so a run only re-reads
+the sidecars and headers that changed; lookups are dictionary hits.
+After files move, refresh() re-scans just the moved files and their
+sidecars.
+"""
+
+import argparse
+import json
+import os
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from scene_parser import parse_scene, unquote
+from script_facts import CACHE_DIR
+
+UID_INDEX_VERSION = 1
+UID_INDEX_FILE = 'uid_index.json'
+
+SIDECAR_SUFFIXES = ('.uid', '.import')
+SOURCE_SUFFIXES = SIDECAR_SUFFIXES + ('.tscn', '.tres')
+
+
+class UidIndex:
+    def __init__(self, index, persistent: bool = True):
+        self.index = index
+        self.root = index.root
+        self.path = self.root / CACHE_DIR / UID_INDEX_FILE
+        self.persistent = persistent
+
+        # project-relative source file -> {'mtime_ns', 'size', 'declares': [uid, res path] | None,
+        #                                  'references': [[uid, res path, line], ...]}
+        self.sources: Dict[str, Dict] = {}
+        self.dirty = False
+        self.files_read = 0
+
+        self._paths_by_uid: Dict[str, Set[str]] = {}  # uid -> res paths declaring it
+        self._uid_by_path: Dict[str, str] = {}        # res path -> declared uid
+
+        if persistent:
+            self._load()
+        self.update()
+
+    def _load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+
+        if data.get('version') == UID_INDEX_VERSION:
+            self.sources = data.get('sources', {})
+
+    def res_path(self, path) -> str:
+        return 'res://' + os.path.relpath(path, self.root).replace(os.sep, '/')
+
+    def file_path(self, res_path: str) -> Path:
+        return self.root / res_path[len('res://'):]
+
+    # ------------------------------------------------------------------
+    # Scanning
+    # ------------------------------------------------------------------
+
+    def update(self):
+        """Re-read the sources that changed since the stored index, forget deleted ones"""
+        live = set()
+        for suffix in SOURCE_SUFFIXES:
+            for path in self.index.files(suffix):
+                key = self.index.relative(path)
+                live.add(key)
+                entry = self.sources.get(key)
+                stat = self.index.stat(path)
+                if stat is None:
+                    continue
+                if entry is None or entry['mtime_ns'] != stat.st_mtime_ns or entry['size'] != stat.st_size:
+                    self.sources[key] = self._scan(path, stat)
+                    self.dirty = True
+
+        for key in [k for k in self.sources if k not in live]:
+            del self.sources[key]
+            self.dirty = True
+
+        self._paths_by_uid = {}
+        self._uid_by_path = {}
+        for entry in self.sources.values():
+            self._add_declaration(entry)
+
+    def refresh(self, paths: Iterable):
+        """Re-scan moved, created or deleted files and their sidecars, and nothing else"""
+        for path in paths:
+            path = Path(path)
+            candidates = [path] if path.suffix in SIDECAR_SUFFIXES else \
+                [path] + [path.with_name(path.name + suffix) for suffix in SIDECAR_SUFFIXES]
+            for candidate in candidates:
+                if candidate.suffix not in SOURCE_SUFFIXES:
+                    continue
+                key = self.index.relative(candidate)
+                old = self.sources.pop(key, None)
+                if old is not None:
+                    self._remove_declaration(old)
+                    self.dirty = True
+                try:
+                    stat = os.stat(candidate)
+                except OSError:
+                    continue
+                entry = self._scan(candidate, stat)
+                self.sources[key] = entry
+                self._add_declaration(entry)
+                self.dirty = True
+
+    def _scan(self, path: Path, stat: os.stat_result) -> Dict:
+        entry = {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size, 'declares': None, 'references': []}
+        self.files_read += 1
+        try:
+            if path.suffix == '.uid':
+                with open(path, 'r', encoding='utf-8') as f:
+                    uid = f.readline().strip()
+                if uid.startswith('uid://'):
+                    entry['declares'] = [uid, self.res_path(path)[:-len('.uid')]]
+            elif path.suffix == '.import':
+                for record in parse_scene(path):
+                    if record.kind == 'remap':
+                        uid = unquote(record.properties.get('uid', ''))
+                        if uid.startswith('uid://'):
+                            entry['declares'] = [uid, self.res_path(path)[:-len('.import')]]
+                        break
+            else:
+                info = self.index.scene_info(path)
+                if info is not None:
+                    res_path = self.res_path(path)
+                    if info['uid']:
+                        entry['declares'] = [info['uid'], res_path]
+                    for ext in info['ext_resources']:
+                        if ext['uid'] and ext['path']:
+                            entry['references'].append([ext['uid'], self.resolve(ext['path'], res_path), ext['line']])
+        except (OSError, UnicodeDecodeError):
+            pass
+        return entry
+
+    def resolve(self, target: str, from_res_path: str) -> str:
+        """res:// form of a path referenced from from_res_path"""
+        if target.startswith('res://'):
+            return target
+        base = os.path.dirname(from_res_path[len('res://'):])
+        return 'res://' + os.path.normpath(os.path.join(base, target)).replace(os.sep, '/')
+
+    def _add_declaration(self, entry: Dict):
+        if entry['declares']:
+            uid, res_path = entry['declares']
+            self._paths_by_uid.setdefault(uid, set()).add(res_path)
+            self._uid_by_path[res_path] = uid
+
+    def _remove_declaration(self, entry: Dict):
+        if entry['declares']:
+            uid, res_path = entry['declares']
+            paths = self._paths_by_uid.get(uid)
+            if paths is not None:
+                paths.discard(res_path)
+                if not paths:
+                    del self._paths_by_uid[uid]
+            if self._uid_by_path.get(res_path) == uid:
+                del self._uid_by_path[res_path]
+
+    def save(self):
+        """Write the index atomically if anything changed"""
+        if not self.persistent or not self.dirty:
+            return
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': UID_INDEX_VERSION, 'sources': self.sources}, f, separators=(',', ':'))
+        os.replace(tmp_path, self.path)
+        self.dirty = False
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def exists(self, res_path: str) -> bool:
+        return self.index.stat(self.file_path(res_path)) is not None
+
+    def path_of(self, uid: str) -> Optional[str]:
+        """The existing file declaring uid (the first one, sorted, if several do)"""
+        paths = self._paths_by_uid.get(uid)
+        if not paths:
+            return None
+        if len(paths) == 1:
+            path = next(iter(paths))
+            return path if self.exists(path) else None
+        return next((path for path in sorted(paths) if self.exists(path)), None)
+
+    def uid_of(self, res_path: str) -> Optional[str]:
+        return self._uid_by_path.get(res_path)
+
+    def relink(self, uid: Optional[str], res_path: str) -> Tuple[Optional[str], str]:
+        """(uid, path) an ext_resource header should carry.
+
+        The path wins while it exists: the uid becomes that file's own uid,
+        or is dropped if it names another file. A missing path follows its
+        uid to wherever the file moved (same extension only, so a stray uid
+        never turns a texture into a scene). References without a uid are
+        left alone.
+        """
+        if not uid:
+            return uid, res_path
+        if self.exists(res_path):
+            own = self.uid_of(res_path)
+            if own:
+                return own, res_path
+            return (uid if self.path_of(uid) is None else None), res_path
+        moved = self.path_of(uid)
+        if moved and os.path.splitext(moved)[1] == os.path.splitext(res_path)[1]:
+            return uid, moved
+        return uid, res_path
+
+    # ------------------------------------------------------------------
+    # Problems
+    # ------------------------------------------------------------------
+
+    def duplicates(self) -> Dict[str, List[str]]:
+        """uid -> existing files declaring it, for uids claimed by more than one file"""
+        result = {}
+        for uid, paths in self._paths_by_uid.items():
+            existing = sorted(path for path in paths if self.exists(path))
+            if len(existing) > 1:
+                result[uid] = existing
+        return dict(sorted(result.items()))
+
+    def stale(self) -> List[Dict]:
+        """Declarations and references that no longer match the files on disk.
+
+        kind 'orphan'    a .uid/.import sidecar whose file is gone
+        kind 'moved'     a reference whose uid now belongs to another file
+        kind 'unknown'   a reference whose uid no file declares (Godot falls back to the path)
+        """
+        problems = []
+        for key, entry in sorted(self.sources.items()):
+            declares = entry['declares']
+            if declares and key.endswith(SIDECAR_SUFFIXES) and not self.exists(declares[1]):
+                problems.append({'kind': 'orphan', 'source': key, 'uid': declares[0], 'path': declares[1]})
+            for uid, res_path, line in entry['references']:
+                actual = self.path_of(uid)
+                if actual is None:
+                    problems.append({'kind': 'unknown', 'source': key, 'line': line, 'uid': uid, 'path': res_path})
+                elif actual != res_path:
+                    problems.append({'kind': 'moved', 'source': key, 'line': line, 'uid': uid,
+                                     'path': res_path, 'actual': actual})
+        return problems
+
+    def summary(self) -> Dict:
+        problems = self.stale()
+        return {
+            'uids': len(self._paths_by_uid),
+            'sources': len(self.sources),
+            'references': sum(len(entry['references']) for entry in self.sources.values()),
+            'duplicates': len(self.duplicates()),
+            'stale': {kind: sum(1 for p in problems if p['kind'] == kind) for kind in ('orphan', 'moved', 'unknown')},
+        }
+
+
+def relink_scene_text(text: str, uids: UidIndex, res_path: str) -> Tuple[str, List[str]]:
+    """Rewrite the ext_resource headers of a .tscn/.tres so uid and path agree (see UidIndex.relink)"""
+    lines = text.splitlines(keepends=True)
+    changes = []
+    for record in parse_scene(lines):
+        if record.kind != 'ext_resource' or not record.attrs.get('path'):
+            continue
+        uid = record.attrs.get('uid')
+        path = uids.resolve(record.attrs['path'], res_path)
+        new_uid, new_path = uids.relink(uid, path)
+        if (new_uid, new_path) == (uid, path):
+            continue
+
+        header = lines[record.line - 1]
+        if new_path != path:
+            header = header.replace(f'path="{record.attrs["path"]}"', f'path="{new_path}"', 1)
+            changes.append(f"{record.attrs['path']} -> {new_path}")
+        if new_uid != uid:
+            if new_uid:
+                header = header.replace(f'uid="{uid}"', f'uid="{new_uid}"', 1)
+            else:
+                header = header.replace(f' uid="{uid}"', '', 1)
+            changes.append(f"{uid} -> {new_uid or 'no uid'} for {new_path}")
+        lines[record.line - 1] = header
+    return ''.join(lines), changes
+
+
+def print_report(uids: UidIndex, limit: int = 20):
+    summary = uids.summary()
+    print(f"🆔 {summary['uids']} uids from {summary['sources']} sidecars and headers, "
+          f"{summary['references']} uid references")
+
+    duplicates = uids.duplicates()
+    if duplicates:
+        print(f"\n⚠️ Duplicate uids ({len(duplicates)}):")
+        for uid, paths in list(duplicates.items())[:limit]:
+            print(f"   {uid}: {', '.join(paths)}")
+
+    problems = uids.stale()
+    labels = {
+        'orphan': '🗑️ Orphaned sidecars (file gone)',
+        'moved': '🔀 References whose uid moved to another file',
+        'unknown': '❓ References to uids no file declares',
+    }
+    for kind, label in labels.items():
+        matching = [p for p in problems if p['kind'] == kind]
+        if not matching:
+            continue
+        print(f"\n{label} ({len(matching)}):")
+        for problem in matching[:limit]:
+            where = problem['source'] + (f":{problem['line']}" if 'line' in problem else '')
+            target = f"{problem['path']} -> {problem['actual']}" if kind == 'moved' else problem['path']
+            print(f"   {where}  {problem['uid']}  {target}")
+        if len(matching) > limit:
+            print(f"   ... and {len(matching) - limit} more")
+
+    if not duplicates and not problems:
+        print("✅ Every uid is unique and every reference resolves")
+
+
+def main(argv=None):
+    from project_index import ProjectIndex
+    from project_root import find_project_root
+
+    parser = argparse.ArgumentParser(description='uid:// index report: duplicate and stale uids')
+    parser.add_argument('--root', help='Godot project (default: the project holding these tools)')
+    parser.add_argument('--uid', help='Only print the file a uid:// resolves to')
+    parser.add_argument('--path', help='Only print the uid of a res:// path')
+    args = parser.parse_args(argv)
+
+    index = ProjectIndex(find_project_root(args.root))
+    uids = index.uid_index
+    if args.uid:
+        print(uids.path_of(args.uid) or f"❓ {args.uid} is not declared by any existing file")
+    elif args.path:
+        print(uids.uid_of(args.path) or f"❓ {args.path} has no uid")
+    else:
+        print_report(uids)
+    uids.save()
+
+
+if __name__ == "__main__":
+    main()
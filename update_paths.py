@@ -1,12 +1,17 @@
 #!/usr/bin/env python3
 """
 Universal Being Path Updater
-Updates all file references after the great reorganization of 2025-06-06
+Updates all file references after the great reorganization of 2025-06-06.
+Besides res:// strings, uid:// references are kept in step: moved scripts
+take their .uid sidecar along, and scene ext_resource headers get the uid
+and path of the file as it is now (see uid_index.py).
 """
 
 import os
-import re
-from pathlib import Path
+
+from project_index import ProjectIndex
+from project_root import find_project_root
+from uid_index import relink_scene_text
 
 # Path mapping for the reorganization
 PATH_UPDATES = {
@@ -41,15 +46,36 @@ PATH_UPDATES = {
     "AkashicRecordsEnhanced": "AkashicRecordsSystem",
 }
 
-def update_file_paths(root_dir):
+def carry_uid_sidecars(index):
+    """Move a moved script's .uid sidecar next to it, so uid:// references keep resolving"""
+    moved = []
+    for old_path, new_path in PATH_UPDATES.items():
+        if not old_path.startswith('res://'):
+            continue
+        old_file = index.root / old_path[len('res://'):]
+        new_file = index.root / new_path[len('res://'):]
+        old_sidecar = old_file.with_name(old_file.name + '.uid')
+        new_sidecar = new_file.with_name(new_file.name + '.uid')
+        if old_sidecar.exists() and not old_file.exists() and new_file.exists() and not new_sidecar.exists():
+            os.replace(old_sidecar, new_sidecar)
+            index.refresh_file(old_sidecar)
+            index.refresh_file(new_sidecar)
+            moved.append(str(new_sidecar))
+            print(f"🆔 Moved uid sidecar: {old_path}.uid -> {new_path}.uid")
+    return moved
+
+def update_file_paths(root_dir, index=None):
     """Update all file references in the project"""
-    updated_files = []
+    if index is None:
+        index = ProjectIndex(root_dir)
+    uids = index.uid_index
+    updated_files = carry_uid_sidecars(index)
     
     # File extensions to check
-    extensions = ['.gd', '.tscn', '.cs', '.godot', '.cfg']
+    extensions = ['.gd', '.tscn', '.tres', '.cs', '.godot', '.cfg']
     
     for ext in extensions:
-        for file_path in Path(root_dir).rglob(f'*{ext}'):
+        for file_path in index.files(ext):
             try:
                 with open(file_path, 'r', encoding='utf-8') as f:
                     content = f.read()
@@ -60,21 +86,29 @@ def update_file_paths(root_dir):
                 for old_path, new_path in PATH_UPDATES.items():
                     content = content.replace(old_path, new_path)
                 
+                # Make each ext_resource's uid and path agree (a uid follows its file when it moved)
+                if ext in ('.tscn', '.tres'):
+                    content, changes = relink_scene_text(content, uids, uids.res_path(file_path))
+                    for change in changes:
+                        print(f"🆔 {index.relative(file_path)}: {change}")
+                
                 # If content changed, write it back
                 if content != original_content:
                     with open(file_path, 'w', encoding='utf-8') as f:
                         f.write(content)
+                    index.refresh_file(file_path)
                     updated_files.append(str(file_path))
                     print(f"✅ Updated: {file_path}")
                     
             except Exception as e:
                 print(f"❌ Error updating {file_path}: {e}")
     
+    index.save_cache()
     return updated_files
 
 def main():
-    # Get project root from current script location
-    root_dir = os.path.dirname(os.path.abspath(__file__))
+    # Find the Godot project these tools belong to
+    root_dir = find_project_root()
     
     print("🚀 Universal Being Path Updater - Great Reorganization 2025-06-06")
     print("=" * 60)
@@ -4,35 +4,71 @@ upgrade_scenes.py – migrate .tscn / .tres resources for Godot 4.4
 
 Usage:
     python upgrade_scenes.py [--path <project_root>] [--dry]
+
+Each file is streamed through scene_parser twice: once to find the edits,
+then, only if there are any, line by line into a temporary file that
+replaces the original. Only a section's type="..." attribute is renamed
+(never a substring such as SpatialMaterial or a script's source), and an
+empty __meta__ = {} property is dropped by its line span.
 """
 
 import argparse
 import re
 from pathlib import Path
+from typing import Dict, Set
+
+from scene_parser import parse_scene
+from script_edits import write_atomic
 
 CLASS_MAP = {
     "KinematicBody": "CharacterBody3D",
     "KinematicBody2D": "CharacterBody2D",
     "Spatial": "Node3D",
-    "Area ": "Area3D ",    # note space to avoid 'Area2D'
+    "Area": "Area3D",
 }
 
-RE_EMPTY_META = re.compile(r'\[__meta__\][\s\S]*?\n{2}', re.MULTILINE)
+RE_TYPE_ATTR = re.compile(r'(\btype=")([^"]+)(")')
+RE_EMPTY_DICT = re.compile(r'\{\s*\}')
+
+
+def plan_upgrade(path: Path):
+    """(header line -> new type, lines to drop) for one file"""
+    retype: Dict[int, str] = {}
+    drop: Set[int] = set()
+    for record in parse_scene(path):
+        new_type = CLASS_MAP.get(record.attrs.get('type'))
+        if new_type:
+            retype[record.line] = new_type
+        meta = record.properties.get('__meta__')
+        if meta is not None and RE_EMPTY_DICT.fullmatch(meta.strip()):
+            first, last = record.property_lines['__meta__']
+            drop.update(range(first, last + 1))
+    return retype, drop
 
 
-def transform_text(txt: str) -> str:
-    for old, new in CLASS_MAP.items():
-        txt = txt.replace(old, new)
-    txt = RE_EMPTY_META.sub("", txt)  # strip empty __meta__ blobs
-    return txt
+def _upgraded_lines(path: Path, retype: Dict[int, str], drop: Set[int]):
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        for number, line in enumerate(f, 1):
+            if number in drop:
+                continue
+            if number in retype:
+                line = RE_TYPE_ATTR.sub(lambda m: m.group(1) + retype[number] + m.group(3), line, count=1)
+            yield line
 
 
 def process_file(path: Path, dry: bool = False) -> bool:
-    raw = path.read_text(encoding='utf-8')
-    new = transform_text(raw)
-    if new != raw and not dry:
-        path.write_text(new, encoding='utf-8')
-    return new != raw
+    try:
+        retype, drop = plan_upgrade(path)
+    except (OSError, UnicodeDecodeError) as e:
+        print(f"⚠️ Skipped {path}: {e}")
+        return False
+    if not retype and not drop:
+        return False
+    if not dry:
+        write_atomic(path, _upgraded_lines(path, retype, drop))
+    print(f"{'🧪 Would patch' if dry else '✅ Patched'} {path}: "
+          f"{len(retype)} type(s) renamed, {len(drop)} line(s) of empty __meta__ removed")
+    return True
 
 
 def main():
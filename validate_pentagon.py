@@ -17,49 +17,64 @@ UNIVERSAL BEING RULES:
 - Must implement consciousness levels properly
 - Must follow Pentagon lifecycle
 - Must call super() methods correctly
+
+WATCH MODE:
+    python validate_pentagon.py --watch
+Validates once, then re-validates only the scripts you save and the scripts
+inheriting from them (inotify on Linux, polling elsewhere or with --poll),
+prints which violations appeared or went away, and keeps
+docs/PENTAGON_VALIDATION_REPORT.md up to date.
+
+MACHINE-READABLE OUTPUT:
+    python validate_pentagon.py --jsonl pentagon.jsonl --sarif pentagon.sarif
+Streams each violation with file, line, column, rule id and severity as
+soon as it is found (see validation_output.py for the rule ids).
 """
 
-import os
-import re
+import argparse
+import sys
 from pathlib import Path
-from typing import Dict, List, Set
+from typing import Dict, List, Optional, Set, Tuple
 from datetime import datetime
 
+from file_watcher import create_watcher
+from git_changes import GitScopeError, changed_scripts
+from phase_profiler import PhaseProfiler
+from project_index import ProjectIndex
+from project_root import find_project_root
+from script_facts import PENTAGON_METHODS, super_position_ok
+from validation_output import FindingStreams, open_streams, severity
+
+# Directories a full validation run scans
+SCAN_DIRS = ['autoloads', 'core', 'scripts', 'beings']
+
+# Directories developers edit beings in; watched (and validated) by --watch
+WATCH_DIRS = ['beings', 'systems', 'core', 'components', 'scripts']
+
 class PentagonValidator:
-    def __init__(self, project_root: str):
+    def __init__(self, project_root: str, index: ProjectIndex = None, jobs: int = 1,
+                 profiler: PhaseProfiler = None, streams: FindingStreams = None,
+                 only_files: Set[Path] = None, changed_since: str = None):
         self.root = Path(project_root)
+        self.index = index if index is not None else ProjectIndex(self.root)
+        self.jobs = jobs
+        self.profiler = profiler if profiler is not None else PhaseProfiler(tool='PentagonValidator')
+        self.profiler.attach(self.index)
+        self.scan_dirs = list(SCAN_DIRS)
         self.violations = []
         self.compliant_files = []
         self.non_ub_files = []  # Files that don't need to be Universal Beings
+        self.file_results = {}  # file -> (status, violation record), in scan order
         
-        # Pentagon methods that must be implemented
-        self.pentagon_methods = {
-            'pentagon_init': {
-                'signature': r'func\s+pentagon_init\s*\(\s*\)\s*->\s*void:',
-                'super_call': r'super\.pentagon_init\(\)',
-                'super_position': 'first'
-            },
-            'pentagon_ready': {
-                'signature': r'func\s+pentagon_ready\s*\(\s*\)\s*->\s*void:',
-                'super_call': r'super\.pentagon_ready\(\)',
-                'super_position': 'first'
-            },
-            'pentagon_process': {
-                'signature': r'func\s+pentagon_process\s*\(\s*delta\s*:\s*float\s*\)\s*->\s*void:',
-                'super_call': r'super\.pentagon_process\s*\(\s*delta\s*\)',
-                'super_position': 'first'
-            },
-            'pentagon_input': {
-                'signature': r'func\s+pentagon_input\s*\(\s*event\s*:\s*InputEvent\s*\)\s*->\s*void:',
-                'super_call': r'super\.pentagon_input\s*\(\s*event\s*\)',
-                'super_position': 'first'
-            },
-            'pentagon_sewers': {
-                'signature': r'func\s+pentagon_sewers\s*\(\s*\)\s*->\s*void:',
-                'super_call': r'super\.pentagon_sewers\s*\(\)',
-                'super_position': 'last'
-            }
-        }
+        # --changed-since: validate only these scripts (see git_changes.py)
+        self.only_files = only_files
+        self.changed_since = changed_since
+        
+        # JSONL/SARIF outputs; each finding is written as soon as it is found (see validation_output.py)
+        self.streams = streams
+        
+        # Pentagon methods that must be implemented (signature, super call, super position)
+        self.pentagon_methods = PENTAGON_METHODS
         
         # Files that are exempt from Universal Being rules
         self.exempt_files = {
@@ -86,90 +101,160 @@ class PentagonValidator:
         print()
         
         # Scan all .gd files in relevant directories
-        scan_dirs = ['autoloads', 'core', 'scripts', 'beings']
+        scan_dirs = self.scan_dirs
+        
+        profile = self.profiler.phase
+        
+        # Parse stale scripts across worker processes; the rule pass below stays ordered.
+        # Every script is needed: base classes may live outside the scanned folders.
+        with profile('prefetch_facts'):
+            self.index.prefetch_facts(self.index.scripts(), self.jobs)
+        with profile('class_hierarchy'):
+            self.index.class_hierarchy
         
         for directory in scan_dirs:
             dir_path = self.root / directory
             if dir_path.exists():
-                self._scan_directory(dir_path, directory)
+                with profile(f'scan_{directory}'):
+                    self._scan_directory(dir_path, directory)
+        
+        # Persist extracted facts so the next run only re-parses changed files
+        with profile('save_cache'):
+            self.index.save_cache()
         
         # Generate report
-        self._generate_report()
+        with profile('generate_report'):
+            self._generate_report()
+        
+        if self.profiler.enabled:
+            profile_path = self.root / 'pentagon_validation_profile.json'
+            self.profiler.save(profile_path)
+            self.profiler.print_summary()
+            print(f"⏱️ Profile saved to: {profile_path}")
         
+        if self.streams is not None and self.streams.streams:
+            print(f"📡 {self.streams.count} finding(s) streamed to: {', '.join(map(str, self.streams.paths))}")
         print(f"✅ Validation complete! See docs/PENTAGON_VALIDATION_REPORT.md")
 
     def _scan_directory(self, directory: Path, dir_name: str):
         """Scan a directory for .gd files and validate them"""
         print(f"🔍 Scanning {dir_name}/...")
         
-        for gd_file in directory.rglob('*.gd'):
+        for gd_file in self.index.scripts(dir_name):
             if gd_file.name in self.exempt_files:
                 continue
+            if self.only_files is not None and gd_file not in self.only_files:
+                continue
                 
             self._validate_file(gd_file, dir_name)
 
     def _validate_file(self, file_path: Path, directory: str):
         """Validate a single .gd file for Pentagon compliance"""
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-        except Exception as e:
-            self.violations.append({
-                'file': str(file_path.relative_to(self.root)),
-                'type': 'READ_ERROR',
-                'message': f"Could not read file: {e}"
-            })
-            return
+        file_rel = str(file_path.relative_to(self.root))
+        status, record = self._check_file(file_path)
+        self.file_results[file_rel] = (status, record)
+        self._stream_findings(record)
         
+        if status == 'violation':
+            self.violations.append(record)
+        elif status == 'compliant':
+            self.compliant_files.append(file_rel)
+        else:
+            self.non_ub_files.append(file_rel)
+
+    def _check_file(self, file_path: Path) -> Tuple[str, Optional[Dict]]:
+        """Apply the Pentagon rules to one file.
+        
+        Returns ('violation', record), ('compliant', None) or ('non_ub', None).
+        """
         file_rel = str(file_path.relative_to(self.root))
+        facts = self.index.facts(file_path)
+        if facts['encoding'] != 'utf-8':
+            message = f"Could not read file: {facts['error']}"
+            return 'violation', {
+                'file': file_rel,
+                'type': 'READ_ERROR',
+                'message': message,
+                'findings': [self._finding(file_path, 'file/read-error', message)]
+            }
         
         # Check if this should be a Universal Being
-        is_universal_being = self._is_universal_being_file(content, file_path.name)
+        is_universal_being = self._is_universal_being_file(facts, file_path)
         
         if not is_universal_being:
-            self.non_ub_files.append(file_rel)
-            return
+            return 'non_ub', None
         
         # Validate Universal Being compliance
-        violations = []
+        findings = []
         
         # Check Universal Being inheritance
-        if not self._check_universal_being_inheritance(content):
-            violations.append("Missing 'extends UniversalBeing' declaration")
+        if not self._check_universal_being_inheritance(file_path):
+            line = facts['extends_line'] or facts['class_name_line'] or 1
+            findings.append(self._finding(file_path, 'being/extends', "Missing 'extends UniversalBeing' declaration",
+                                          line, self._column_of(file_path, line)))
         
         # Check class_name declaration
-        if not self._check_class_name(content):
-            violations.append("Missing proper 'class_name' declaration")
+        if not self._check_class_name(facts):
+            line = facts['extends_line'] or 1
+            findings.append(self._finding(file_path, 'being/class-name', "Missing proper 'class_name' declaration",
+                                          line, self._column_of(file_path, line)))
         
         # Check Pentagon methods
-        pentagon_violations = self._check_pentagon_methods(content)
-        violations.extend(pentagon_violations)
+        findings.extend(self._check_pentagon_methods(facts, file_path))
         
         # Check consciousness level
-        if not self._check_consciousness_level(content):
-            violations.append("Missing consciousness_level assignment")
+        if not self._check_consciousness_level(facts):
+            findings.append(self._finding(file_path, 'being/consciousness-level',
+                                          "Missing consciousness_level assignment"))
         
         # Check being_type and being_name
-        if not self._check_being_properties(content):
-            violations.append("Missing being_type or being_name assignment")
+        if not self._check_being_properties(facts):
+            findings.append(self._finding(file_path, 'being/properties',
+                                          "Missing being_type or being_name assignment"))
         
-        if violations:
-            self.violations.append({
+        if findings:
+            return 'violation', {
                 'file': file_rel,
                 'type': 'PENTAGON_VIOLATION',
-                'violations': violations
-            })
-        else:
-            self.compliant_files.append(file_rel)
+                'violations': [finding['message'] for finding in findings],
+                'findings': findings
+            }
+        return 'compliant', None
+
+    def _finding(self, file_path: Path, rule: str, message: str, line: int = 1, column: int = 1) -> Dict:
+        """One located violation, as written to the JSONL/SARIF streams"""
+        return {
+            'file': file_path.relative_to(self.root).as_posix(),
+            'line': line,
+            'column': column,
+            'rule': rule,
+            'severity': severity(rule),
+            'message': message
+        }
+
+    def _column_of(self, file_path: Path, line: int) -> int:
+        """1-based column of the first code character on a line"""
+        lines = self.index.read_text(file_path).split('\n')
+        if not 0 < line <= len(lines):
+            return 1
+        text = lines[line - 1]
+        return len(text) - len(text.lstrip()) + 1
 
-    def _is_universal_being_file(self, content: str, filename: str) -> bool:
+    def _stream_findings(self, record: Optional[Dict]):
+        if self.streams is None or record is None:
+            return
+        for finding in record['findings']:
+            self.streams.write(finding)
+
+    def _is_universal_being_file(self, facts: Dict, file_path: Path) -> bool:
         """Determine if this file should be a Universal Being"""
+        filename = file_path.name
         # Exempt files
         if filename in self.exempt_files or filename in self.core_system_files:
             return False
         
         # If it extends UniversalBeing, it should follow rules
-        if re.search(r'extends\s+UniversalBeing', content):
+        if self._check_universal_being_inheritance(file_path):
             return True
         
         # If it's in beings/ directory, it should be a Universal Being
@@ -177,136 +262,192 @@ class PentagonValidator:
             return True
         
         # If it has Pentagon methods, it should be a Universal Being
-        for method in self.pentagon_methods:
-            if re.search(self.pentagon_methods[method]['signature'], content):
+        for method in facts['pentagon_methods'].values():
+            if method['signature']:
                 return True
         
         return False
 
-    def _check_universal_being_inheritance(self, content: str) -> bool:
-        """Check if file properly extends UniversalBeing"""
-        return bool(re.search(r'extends\s+UniversalBeing', content))
+    def _check_universal_being_inheritance(self, file_path: Path) -> bool:
+        """Check if file inherits from UniversalBeing, directly or via an intermediate class"""
+        return self.index.class_hierarchy.is_universal_being(file_path)
 
-    def _check_class_name(self, content: str) -> bool:
+    def _check_class_name(self, facts: Dict) -> bool:
         """Check if file has proper class_name declaration"""
-        return bool(re.search(r'class_name\s+\w+', content))
+        return facts['class_name'] is not None
 
-    def _check_pentagon_methods(self, content: str) -> List[str]:
+    def _check_pentagon_methods(self, facts: Dict, file_path: Path) -> List[Dict]:
         """Check Pentagon method implementation and super() calls"""
-        violations = []
+        findings = []
         
         for method_name, rules in self.pentagon_methods.items():
             # Check if method exists
-            method_match = re.search(rules['signature'], content)
-            if not method_match:
-                violations.append(f"Missing {method_name}() method")
+            method = facts['pentagon_methods'].get(method_name)
+            if not method or not method['signature']:
+                # A bad signature points at the method, a missing one at the class declaration
+                line = method['line'] if method else facts['class_name_line'] or facts['extends_line'] or 1
+                findings.append(self._finding(file_path, 'pentagon/missing-method',
+                                              f"Missing {method_name}() method",
+                                              line, self._column_of(file_path, line)))
                 continue
             
-            # Extract method body
-            method_body = self._extract_method_body(content, method_match.start())
-            
             # Check super() call
-            super_call_match = re.search(rules['super_call'], method_body)
-            if not super_call_match:
-                violations.append(f"{method_name}() missing super() call")
+            if not method['super_args']:
+                findings.append(self._finding(file_path, 'pentagon/missing-super',
+                                              f"{method_name}() missing super() call", method['line']))
                 continue
             
             # Check super() call position
-            if not self._check_super_position(method_body, super_call_match, rules['super_position']):
+            if not super_position_ok(method, rules['super_position']):
                 position = rules['super_position']
-                violations.append(f"{method_name}() super() call must be {position}")
+                line = method['super_line'] or method['line']
+                findings.append(self._finding(file_path, 'pentagon/super-position',
+                                              f"{method_name}() super() call must be {position}",
+                                              line, self._column_of(file_path, line)))
         
-        return violations
+        return findings
 
-    def _extract_method_body(self, content: str, method_start: int) -> str:
-        """Extract the body of a method from content"""
-        lines = content[method_start:].split('\n')
-        body_lines = []
-        indent_level = None
-        
-        for i, line in enumerate(lines):
-            if i == 0:  # Method signature line
-                body_lines.append(line)
-                continue
-            
-            # Determine indentation level from first non-empty line
-            if indent_level is None and line.strip():
-                indent_level = len(line) - len(line.lstrip())
-            
-            # If we hit a line with same or less indentation, method is done
-            if line.strip() and indent_level is not None:
-                current_indent = len(line) - len(line.lstrip())
-                if current_indent <= indent_level - 1:  # Allow for method end
-                    break
+    def _check_consciousness_level(self, facts: Dict) -> bool:
+        """Check if consciousness_level is properly assigned"""
+        return bool(facts['consciousness_levels'])
+
+    def _check_being_properties(self, facts: Dict) -> bool:
+        """Check if being_type and being_name are assigned"""
+        return facts['being_type'] is not None and facts['being_name'] is not None
+
+    def watch(self, force_polling: bool = False, interval: float = 1.0):
+        """Validate once, then re-validate only the scripts that change and their subclasses"""
+        self.scan_dirs = list(dict.fromkeys(self.scan_dirs + WATCH_DIRS))
+        directories = [d for d in self.scan_dirs if (self.root / d).is_dir()]
+        
+        # Start watching before the first pass so saves made during it are not lost
+        watcher = create_watcher(self.root, directories, ('.gd',), interval, force_polling)
+        self.validate_project()
+        
+        print(f"👁️ Watching {', '.join(d + '/' for d in directories)} ({watcher.backend})")
+        print("   Press Ctrl+C to stop")
+        try:
+            while True:
+                changed = watcher.wait()
+                if changed:
+                    self._revalidate(sorted(changed))
+        except KeyboardInterrupt:
+            print("\n👋 Stopped watching")
+        finally:
+            watcher.close()
+
+    def _revalidate(self, paths: List[Path]):
+        """Re-check changed files and the scripts inheriting from them,
+        print the violation diff and refresh the report"""
+        print(f"\n🔄 {datetime.now().strftime('%H:%M:%S')} - {len(paths)} file(s) changed")
+        
+        # Class names as they were before the edit, so subclasses of a renamed
+        # or deleted class are found too (the fact cache has not re-parsed yet)
+        targets = set(paths)
+        for path in paths:
+            entry = self.index.fact_cache.entries.get(self.index.relative(path))
+            if entry and entry['facts'].get('class_name'):
+                targets.add(entry['facts']['class_name'])
+            self.index.refresh_file(path)
+        
+        # Being-ness follows the ancestors, so subclasses are re-checked as well
+        inherited = []
+        for res_path in sorted(self.index.class_hierarchy.subclasses(targets)):
+            path = self.root / res_path[len('res://'):]
+            if path not in paths and self._in_scan(path):
+                inherited.append(path)
+        if inherited:
+            print(f"🧬 Re-checking {len(inherited)} script(s) inheriting from them")
+        
+        added = removed = 0
+        for path in list(paths) + inherited:
+            file_rel = str(path.relative_to(self.root))
+            before = self.file_results.get(file_rel)
             
-            body_lines.append(line)
+            if path.is_file() and path.name not in self.exempt_files:
+                after = self._check_file(path)
+                self.file_results[file_rel] = after
+                self._stream_findings(after[1])
+            else:
+                after = None
+                self.file_results.pop(file_rel, None)
             
-            # Stop after reasonable number of lines
-            if len(body_lines) > 50:
-                break
-        
-        return '\n'.join(body_lines)
+            old = self._violation_messages(before)
+            new = self._violation_messages(after)
+            added += len(new - old)
+            removed += len(old - new)
+            self._print_file_diff(file_rel, before, after, old, new)
+        
+        # Rebuild the report lists from per-file results (no rescan)
+        self.violations = [r for s, r in self.file_results.values() if s == 'violation']
+        self.compliant_files = [f for f, (s, _) in self.file_results.items() if s == 'compliant']
+        self.non_ub_files = [f for f, (s, _) in self.file_results.items() if s == 'non_ub']
+        
+        self.index.save_cache()
+        self._generate_report(console_summary=False)
+        
+        print(f"📊 Violations: +{added} -{removed} | ✅ {len(self.compliant_files)} "
+              f"❌ {len(self.violations)} | 📈 {self._compliance_rate():.1f}%")
 
-    def _check_super_position(self, method_body: str, super_match, expected_position: str) -> bool:
-        """Check if super() call is in the correct position"""
-        lines = method_body.split('\n')
-        super_line_idx = None
-        
-        # Find which line has the super() call
-        for i, line in enumerate(lines):
-            if super_match.group() in line:
-                super_line_idx = i
-                break
-        
-        if super_line_idx is None:
+    def _in_scan(self, path: Path) -> bool:
+        """Whether a full pass would validate this script"""
+        if path.name in self.exempt_files:
             return False
+        if self.only_files is not None and path not in self.only_files:
+            return False
+        rel = path.relative_to(self.root).as_posix()
+        return any(rel.startswith(directory.rstrip('/') + '/') for directory in self.scan_dirs)
+
+    def _violation_messages(self, result: Optional[Tuple[str, Optional[Dict]]]) -> Set[str]:
+        if result is None or result[0] != 'violation':
+            return set()
+        record = result[1]
+        if record['type'] == 'READ_ERROR':
+            return {record['message']}
+        return set(record['violations'])
+
+    def _print_file_diff(self, file_rel: str, before, after, old: Set[str], new: Set[str]):
+        """Print how one file's validation result changed"""
+        if after is None:
+            if before is not None:
+                print(f"🗑️ {file_rel} removed" + (f" ({len(old)} violation(s) gone)" if old else ""))
+            return
         
-        # Count non-comment, non-empty lines
-        code_lines = []
-        for line in lines[1:]:  # Skip method signature
-            stripped = line.strip()
-            if stripped and not stripped.startswith('#'):
-                code_lines.append(line)
-        
-        if not code_lines:
-            return True  # Only super() call, that's fine
-        
-        super_code_idx = None
-        for i, line in enumerate(code_lines):
-            if super_match.group() in line:
-                super_code_idx = i
-                break
-        
-        if expected_position == 'first':
-            return super_code_idx == 0
-        elif expected_position == 'last':
-            return super_code_idx == len(code_lines) - 1
+        label = "🆕" if before is None else "📝"
+        status = after[0]
+        if before is not None and before[0] != status:
+            print(f"{label} {file_rel}: {before[0]} -> {status}")
+        elif old == new:
+            print(f"{label} {file_rel}: unchanged ({status})")
+            return
+        else:
+            print(f"{label} {file_rel}")
         
-        return True
+        for message in sorted(new - old):
+            print(f"   + ❌ {message}")
+        for message in sorted(old - new):
+            print(f"   - ✅ {message}")
 
-    def _check_consciousness_level(self, content: str) -> bool:
-        """Check if consciousness_level is properly assigned"""
-        return bool(re.search(r'consciousness_level\s*=\s*\d+', content))
-
-    def _check_being_properties(self, content: str) -> bool:
-        """Check if being_type and being_name are assigned"""
-        has_type = bool(re.search(r'being_type\s*=\s*["\'][\w_]+["\']', content))
-        has_name = bool(re.search(r'being_name\s*=\s*["\'][^"\']+["\']', content))
-        return has_type and has_name
+    def _compliance_rate(self) -> float:
+        total_files = len(self.compliant_files) + len(self.violations)
+        return (len(self.compliant_files) / total_files * 100) if total_files > 0 else 100
 
-    def _generate_report(self):
+    def _generate_report(self, console_summary: bool = True):
         """Generate validation report"""
         report_path = self.root / 'docs' / 'PENTAGON_VALIDATION_REPORT.md'
         report_path.parent.mkdir(exist_ok=True)
         
         total_files = len(self.compliant_files) + len(self.violations)
-        compliance_rate = (len(self.compliant_files) / total_files * 100) if total_files > 0 else 100
+        compliance_rate = self._compliance_rate()
         
         with open(report_path, 'w', encoding='utf-8') as f:
             f.write("# Pentagon Architecture Validation Report\n\n")
             f.write(f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}  \n")
             f.write(f"**Compliance Rate:** {compliance_rate:.1f}%  \n")
-            f.write(f"**Total Files Scanned:** {total_files}  \n\n")
+            f.write(f"**Total Files Scanned:** {total_files}  \n")
+            if self.only_files is not None:
+                f.write(f"**Scope:** scripts changed since `{self.changed_since}` and their subclasses  \n")
+            f.write("\n")
             
             # Summary
             f.write("## 📊 Summary\n\n")
@@ -359,6 +500,9 @@ class PentagonValidator:
             else:
                 f.write("🎉 **Perfect Pentagon Compliance!** All Universal Beings follow the sacred architecture.\n")
         
+        if not console_summary:
+            return
+        
         # Console summary
         print("📊 VALIDATION SUMMARY")
         print("=" * 30)
@@ -370,10 +514,59 @@ class PentagonValidator:
 
 def main():
     """Main validation function"""
-    # Get project root from current script location
-    project_root = os.path.dirname(os.path.abspath(__file__))
-    validator = PentagonValidator(project_root)
-    validator.validate_project()
+    parser = argparse.ArgumentParser(description='Validate Pentagon Architecture compliance')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Re-parse every script instead of using .ub_cache/script_facts.json')
+    parser.add_argument('--jobs', '-j', type=int, default=1, metavar='N',
+                        help='Parse scripts across N worker processes (0 = one per CPU core)')
+    parser.add_argument('--profile', action='store_true',
+                        help='Record per-phase time, files, bytes read and peak memory '
+                             'into pentagon_validation_profile.json')
+    parser.add_argument('--profile-dump', metavar='DIR',
+                        help='Also write a cProfile .pstats dump per phase into DIR (implies --profile)')
+    parser.add_argument('--watch', action='store_true',
+                        help=f"Keep running and re-validate scripts in {', '.join(WATCH_DIRS)} as they change")
+    parser.add_argument('--poll', action='store_true',
+                        help='Watch by polling file stats instead of inotify (e.g. for /mnt drives under WSL)')
+    parser.add_argument('--interval', type=float, default=1.0, metavar='SECONDS',
+                        help='Polling interval for --watch --poll (default: 1.0)')
+    parser.add_argument('--changed-since', metavar='REF',
+                        help='Only validate scripts changed since a git ref (and scripts inheriting from them); '
+                             'exits 1 when they have violations')
+    parser.add_argument('--jsonl', metavar='PATH',
+                        help='Stream every violation to PATH as JSON lines while validating')
+    parser.add_argument('--sarif', metavar='PATH',
+                        help='Stream every violation to PATH as a SARIF 2.1.0 log while validating')
+    args = parser.parse_args()
+    
+    # Find the Godot project these tools belong to
+    project_root = find_project_root()
+    profiler = PhaseProfiler(args.profile, args.profile_dump, tool='PentagonValidator')
+    with profiler.phase('project_index_walk'):
+        index = ProjectIndex(project_root, use_cache=not args.no_cache)
+    only_files = None
+    if args.changed_since:
+        try:
+            with profiler.phase('changed_scripts'):
+                only_files = changed_scripts(index, args.changed_since, args.jobs)
+        except GitScopeError as e:
+            parser.error(f"--changed-since: {e}")
+        print(f"🌿 {len(only_files)} script(s) changed since {args.changed_since} (subclasses included)")
+    
+    streams = open_streams(args.jsonl, args.sarif)
+    validator = PentagonValidator(project_root, index=index, jobs=args.jobs, profiler=profiler, streams=streams,
+                                  only_files=only_files, changed_since=args.changed_since)
+    try:
+        if args.watch:
+            validator.watch(force_polling=args.poll, interval=args.interval)
+        else:
+            validator.validate_project()
+    finally:
+        streams.close()
+    
+    # Pre-commit hooks and pipelines fail on violations in the changed scripts
+    if only_files is not None and validator.violations:
+        sys.exit(1)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Pentagon Validation Output Streams
+==================================
+Machine-readable output for validate_pentagon.py, written one finding at a
+time as violations are found, so IDEs and CI can consume results while the
+run is still going instead of parsing the Markdown report afterwards.
+
+    streams = open_streams(jsonl='pentagon.jsonl', sarif='pentagon.sarif')
+    streams.write({'file': 'beings/x.gd', 'line': 12, 'column': 1,
+                   'rule': 'pentagon/missing-super', 'message': '...'})
+    streams.close()
+
+- JSONL: one finding object per line, flushed immediately.
+- SARIF 2.1.0: every result is appended and the document closed again
+  after each write, so the file is valid SARIF at any moment.
+
+Every finding carries file, line, column, rule id and severity.
+"""
+
+import json
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# Rule id -> short name, SARIF level and description
+RULES = {
+    'pentagon/missing-method': {
+        'level': 'error',
+        'description': 'A Universal Being must implement all five pentagon_* methods with their exact signatures',
+    },
+    'pentagon/missing-super': {
+        'level': 'error',
+        'description': 'Each pentagon_* method must call its super() method',
+    },
+    'pentagon/super-position': {
+        'level': 'warning',
+        'description': 'super() must come first in pentagon_init/ready/process/input and last in pentagon_sewers',
+    },
+    'being/extends': {
+        'level': 'error',
+        'description': 'A Universal Being script must inherit from UniversalBeing',
+    },
+    'being/class-name': {
+        'level': 'warning',
+        'description': 'A Universal Being script must declare a class_name',
+    },
+    'being/consciousness-level': {
+        'level': 'warning',
+        'description': 'A Universal Being must assign consciousness_level',
+    },
+    'being/properties': {
+        'level': 'warning',
+        'description': 'A Universal Being must assign being_type and being_name',
+    },
+    'file/read-error': {
+        'level': 'error',
+        'description': 'The script could not be read as UTF-8',
+    },
+}
+
+
+def severity(rule: str) -> str:
+    return RULES[rule]['level']
+
+
+class JsonlStream:
+    """One JSON object per finding, one finding per line"""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._file = open(self.path, 'w', encoding='utf-8')
+
+    def write(self, finding: Dict):
+        self._file.write(json.dumps(finding, ensure_ascii=False) + '\n')
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+
+class SarifStream:
+    """SARIF 2.1.0 log that stays valid after every appended result"""
+
+    def __init__(self, path, tool_name: str = 'validate_pentagon'):
+        self.path = Path(path)
+        self.results = 0
+
+        header = json.dumps({
+            '$schema': 'https://json.schemastore.org/sarif-2.1.0.json',
+            'version': '2.1.0',
+            'runs': [{
+                'tool': {'driver': {
+                    'name': tool_name,
+                    'rules': [
+                        {'id': rule_id,
+                         'shortDescription': {'text': rule['description']},
+                         'defaultConfiguration': {'level': rule['level']}}
+                        for rule_id, rule in RULES.items()
+                    ],
+                }},
+                'results': [],
+            }],
+        }, indent=2)
+        # Results go inside the (empty) results array; everything after it is the tail
+        cut = header.rindex('"results": [') + len('"results": [')
+        self._tail = header[cut:].replace(']', '\n      ]', 1).encode('utf-8')
+
+        self._file = open(self.path, 'wb')
+        self._file.write(header[:cut].encode('utf-8'))
+        self._end = self._file.tell()
+        self._write_tail()
+
+    def write(self, finding: Dict):
+        result = {
+            'ruleId': finding['rule'],
+            'level': finding['severity'],
+            'message': {'text': finding['message']},
+            'locations': [{'physicalLocation': {
+                'artifactLocation': {'uri': finding['file'], 'uriBaseId': '%SRCROOT%'},
+                'region': {'startLine': finding['line'], 'startColumn': finding['column']},
+            }}],
+        }
+        f = self._file
+        f.seek(self._end)
+        f.truncate()
+        separator = ',' if self.results else ''
+        f.write(f"{separator}\n        {json.dumps(result, ensure_ascii=False)}".encode('utf-8'))
+        self.results += 1
+        self._end = f.tell()
+        self._write_tail()
+
+    def _write_tail(self):
+        self._file.write(self._tail)
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+
+class FindingStreams:
+    """Fans each finding out to every open stream"""
+
+    def __init__(self, streams: List):
+        self.streams = streams
+        self.count = 0
+
+    def write(self, finding: Dict):
+        self.count += 1
+        for stream in self.streams:
+            stream.write(finding)
+
+    def close(self):
+        for stream in self.streams:
+            stream.close()
+
+    @property
+    def paths(self) -> List[Path]:
+        return [stream.path for stream in self.streams]
+
+
+def open_streams(jsonl: Optional[str] = None, sarif: Optional[str] = None) -> FindingStreams:
+    streams = []
+    if jsonl:
+        streams.append(JsonlStream(jsonl))
+    if sarif:
+        streams.append(SarifStream(sarif))
+    return FindingStreams(streams)
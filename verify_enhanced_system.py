@@ -7,6 +7,8 @@ Checks that all new core elements are properly integrated
 import os
 import json
 
+from scene_parser import parse_scene
+
 def check_file_exists(filepath, description):
     """Check if a file exists"""
     if os.path.exists(filepath):
@@ -109,9 +111,6 @@ def main():
     scene_file = "scenes/PERFECT_ULTIMATE_UNIVERSAL_BEING.tscn"
     total_checks += 1
     if os.path.exists(scene_file):
-        with open(scene_file, 'r', encoding='utf-8') as f:
-            scene_content = f.read()
-
         required_elements = [
             "GameStateSocketManager",
             "GemmaAI",
@@ -120,10 +119,14 @@ def main():
             "F9 - Run comprehensive test"
         ]
 
-        missing_elements = []
-        for element in required_elements:
-            if element not in scene_content:
-                missing_elements.append(element)
+        # Node names, resource paths and property values, one section at a time
+        missing_elements = list(required_elements)
+        for record in parse_scene(scene_file):
+            values = list(record.attrs.values()) + list(record.properties.values())
+            missing_elements = [element for element in missing_elements
+                                if not any(element in value for value in values)]
+            if not missing_elements:
+                break
 
         if missing_elements:
             print(f"❌ Scene Integration: Missing elements: {', '.join(missing_elements)}")